@@ -0,0 +1 @@
+/root/package/__init__.py
\ No newline at end of file
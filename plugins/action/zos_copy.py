@@ -13,14 +13,19 @@ from __future__ import absolute_import, division, print_function
 
 __metaclass__ = type
 
+import base64
+import io
+import locale
 import os
+import shutil
 import stat
+import tarfile
 import time
 
-from tempfile import mkstemp, gettempprefix
+from tempfile import mkdtemp, mkstemp, gettempprefix
 
 from ansible.errors import AnsibleError
-from ansible.module_utils._text import to_text
+from ansible.module_utils._text import to_bytes, to_text
 from ansible.module_utils.six import string_types
 from ansible.module_utils.parsing.convert_bool import boolean
 from ansible.plugins.action import ActionBase
@@ -32,10 +37,19 @@ from ansible_collections.ibm.ibm_zos_core.plugins.module_utils.data_set import (
     is_data_set
 )
 
+from ansible_collections.ibm.ibm_zos_core.plugins.module_utils.manifest import (
+    build_manifest,
+    diff_manifests
+)
+
 from ansible_collections.ibm.ibm_zos_core.plugins.module_utils import encode
 
 display = Display()
 
+# Largest content, in bytes, sent to the module in its arguments instead of
+# being transferred with SFTP
+INLINE_CONTENT_MAX_SIZE = 256 * 1024
+
 
 class ActionModule(ActionBase):
     def run(self, tmp=None, task_vars=None):
@@ -47,101 +61,58 @@ class ActionModule(ActionBase):
         task_args = self._task.args.copy()
         del tmp
 
+        if task_args.get("batch") is not None:
+            return self._run_batch(result, task_args, task_vars)
+
         src = task_args.get('src', None)
         dest = task_args.get('dest', None)
         content = task_args.get('content', None)
 
         force = _process_boolean(task_args.get('force'), default=True)
         backup = _process_boolean(task_args.get('backup'), default=False)
-        local_follow = _process_boolean(task_args.get('local_follow'), default=False)
         remote_src = _process_boolean(task_args.get('remote_src'), default=False)
         is_binary = _process_boolean(task_args.get('is_binary'), default=False)
         ignore_sftp_stderr = _process_boolean(task_args.get("ignore_sftp_stderr"), default=False)
         backup_name = task_args.get("backup_name", None)
-        encoding = task_args.get("encoding", None)
+        archive_transfer = task_args.get("archive_transfer", None) or "none"
+        sync = _process_boolean(task_args.get("sync"), default=False)
+        sync_delete = _process_boolean(task_args.get("sync_delete"), default=False)
         mode = task_args.get("mode", None)
-        owner = task_args.get("owner", None)
-        group = task_args.get("group", None)
 
         is_pds = is_src_dir = False
-        temp_path = is_uss = is_mvs_dest = copy_member = src_member = None
+        temp_path = src_member = None
 
-        if dest:
-            if not isinstance(dest, string_types):
-                msg = "Invalid type supplied for 'dest' option, it must be a string"
-                return self._exit_action(result, msg, failed=True)
-            else:
-                is_uss = "/" in dest
-                is_mvs_dest = is_data_set(dest)
-        else:
-            msg = "Destination is required"
+        msg = _check_copy_args(task_args)
+        if msg:
             return self._exit_action(result, msg, failed=True)
 
-        if src:
-            if content:
-                msg = "Either 'src' or 'content' can be provided; not both."
-                return self._exit_action(result, msg, failed=True)
-
-            elif not isinstance(src, string_types):
-                msg = "Invalid type supplied for 'src' option, it must be a string"
-                return self._exit_action(result, msg, failed=True)
-
-            elif len(src) < 1 or len(dest) < 1:
-                msg = "'src' or 'dest' must not be empty"
-                return self._exit_action(result, msg, failed=True)
-            else:
-                src_member = is_member(src)
-                if not remote_src:
-                    if src.startswith('~'):
-                        src = os.path.expanduser(src)
-                    src = os.path.realpath(src)
-                    is_src_dir = os.path.isdir(src)
-                    is_pds = is_src_dir and is_mvs_dest
-
+        is_uss = "/" in dest
+        is_mvs_dest = is_data_set(dest)
         copy_member = is_member(dest)
 
-        if not src and not content:
-            msg = "'src' or 'content' is required"
-            return self._exit_action(result, msg, failed=True)
-
-        if encoding and is_binary:
-            msg = "The 'encoding' parameter is not valid for binary transfer"
-            return self._exit_action(result, msg, failed=True)
-
-        if (not backup) and backup_name is not None:
-            msg = "Backup file provided but 'backup' parameter is False"
-            return self._exit_action(result, msg, failed=True)
-
-        if not is_uss:
-            if mode or owner or group:
-                msg = "Cannot specify 'mode', 'owner' or 'group' for MVS destination"
-                return self._exit_action(result, msg, failed=True)
+        if src:
+            src_member = is_member(src)
+            if not remote_src:
+                src = _local_path(src)
+                is_src_dir = os.path.isdir(src)
+                is_pds = is_src_dir and is_mvs_dest
 
         if not remote_src:
-            if local_follow and not src:
-                msg = "No path given for local symlink"
-                return self._exit_action(result, msg, failed=True)
-
-            elif src and not os.path.exists(src):
-                msg = "The local file {0} does not exist".format(src)
-                return self._exit_action(result, msg, failed=True)
-
-            elif src and not os.access(src, os.R_OK):
-                msg = (
-                    "The local file {0} does not have appropriate "
-                    "read permission".format(src)
-                )
-                return self._exit_action(result, msg, failed=True)
-
             if content:
-                try:
-                    local_content = _write_content_to_temp_file(content)
-                    transfer_res = self._copy_to_remote(
-                        local_content, ignore_stderr=ignore_sftp_stderr
-                    )
-                finally:
-                    os.remove(local_content)
+                if _inline_module_content(task_args):
+                    # The module writes the content itself, nothing is transferred
+                    transfer_res = dict()
+                else:
+                    try:
+                        local_content = _write_content_to_temp_file(content)
+                        transfer_res = self._copy_to_remote(
+                            local_content, ignore_stderr=ignore_sftp_stderr
+                        )
+                    finally:
+                        os.remove(local_content)
             else:
+                transfer_src = src
+                staging_dir = None
                 if is_src_dir:
                     path, dirs, files = next(os.walk(src))
                     if not is_uss and dirs:
@@ -150,19 +121,85 @@ class ActionModule(ActionBase):
                             dict(src=src, dest=dest, changed=False, failed=True)
                         )
                         return result
-                    task_args["size"] = sum(
-                        os.stat(path + "/" + f).st_size for f in files
-                    )
+                    if sync and is_uss:
+                        # Only the files that changed since the last sync are transferred
+                        local_manifest = build_manifest(src)
+                        query_res = self._execute_module(
+                            module_name="ibm.ibm_zos_core.zos_copy",
+                            module_args=dict(
+                                task_args,
+                                is_uss=is_uss,
+                                is_src_dir=is_src_dir,
+                                sync_query=True,
+                                local_charset=encode.Defaults.get_default_system_charset()
+                            ),
+                            task_vars=task_vars,
+                        )
+                        if query_res.get("msg"):
+                            return self._exit_action(result, query_res.get("msg"), failed=True)
+
+                        changed_files, extraneous = diff_manifests(
+                            local_manifest, query_res.get("sync_manifest") or {}
+                        )
+                        if not changed_files and not (sync_delete and extraneous):
+                            result.update(
+                                dict(
+                                    src=src,
+                                    dest=query_res.get("dest"),
+                                    is_binary=is_binary,
+                                    changed=False,
+                                    sync=dict(copied=[], deleted=[]),
+                                    invocation=dict(module_args=self._task.args),
+                                )
+                            )
+                            return result
+                        try:
+                            staging_dir = mkdtemp()
+                            transfer_src = _stage_files(src, staging_dir, changed_files)
+                        except (OSError, IOError) as err:
+                            if staging_dir:
+                                shutil.rmtree(staging_dir, ignore_errors=True)
+                            msg = "Unable to stage the changed files of {0}: {1}".format(src, str(err))
+                            return self._exit_action(result, msg, failed=True)
+                        task_args["sync_manifest"] = local_manifest
+
+                    try:
+                        if archive_transfer != "none":
+                            try:
+                                archive_path, task_args["size"] = _create_transfer_archive(
+                                    transfer_src, compress=archive_transfer == "gz"
+                                )
+                            except (OSError, IOError, tarfile.TarError) as err:
+                                msg = "Unable to create an archive of the directory {0}: {1}".format(src, str(err))
+                                return self._exit_action(result, msg, failed=True)
+                            # The module unpacks the archive in place of the temp path
+                            try:
+                                transfer_res = self._copy_to_remote(
+                                    archive_path, ignore_stderr=ignore_sftp_stderr
+                                )
+                            finally:
+                                os.remove(archive_path)
+                        else:
+                            path, dirs, files = next(os.walk(transfer_src))
+                            task_args["size"] = sum(
+                                os.stat(path + "/" + f).st_size for f in files
+                            )
+                            transfer_res = self._copy_to_remote(
+                                transfer_src, is_dir=is_src_dir, ignore_stderr=ignore_sftp_stderr
+                            )
+                    finally:
+                        if staging_dir:
+                            shutil.rmtree(staging_dir, ignore_errors=True)
                 else:
                     if mode == "preserve":
                         task_args["mode"] = "0{0:o}".format(
                             stat.S_IMODE(os.stat(src).st_mode)
                         )
                     task_args["size"] = os.stat(src).st_size
-                display.vvv(u"ibm_zos_copy calculated size: {0}".format(os.stat(src).st_size), host=self._play_context.remote_addr)
-                transfer_res = self._copy_to_remote(
-                    src, is_dir=is_src_dir, ignore_stderr=ignore_sftp_stderr
-                )
+                    transfer_res = self._copy_to_remote(
+                        src, is_dir=is_src_dir, ignore_stderr=ignore_sftp_stderr
+                    )
+                display.vvv(u"ibm_zos_copy calculated size: {0}".format(task_args["size"]), host=self._play_context.remote_addr)
 
             temp_path = transfer_res.get("temp_path")
             if transfer_res.get("msg"):
@@ -192,23 +229,160 @@ class ActionModule(ActionBase):
             return result
 
         if copy_res.get("msg"):
-            result.update(
+            result.update(_update_failed_result(copy_res, self._task.args, backup or backup_name))
+            self._remote_cleanup(dest, copy_res.get("dest_exists"), task_vars)
+            return result
+
+        return _update_result(is_binary, copy_res, self._task.args)
+
+    def _run_batch(self, result, task_args, task_vars):
+        """Copy all the items of 'batch' with a single transfer of their local
+        sources and a single run of the module. """
+        batch = task_args.pop("batch")
+        if not isinstance(batch, list) or not all(isinstance(item, dict) for item in batch):
+            msg = "Invalid type supplied for 'batch' option, it must be a list of dictionaries"
+            return self._exit_action(result, msg, failed=True)
+        if not batch:
+            msg = "'batch' must not be empty"
+            return self._exit_action(result, msg, failed=True)
+        if any(task_args.get(name) is not None for name in ("src", "content", "dest")):
+            msg = "'src', 'content' and 'dest' must be given in the items of 'batch'"
+            return self._exit_action(result, msg, failed=True)
+        if _process_boolean(task_args.get("sync"), default=False):
+            msg = "'sync' is not supported with 'batch'"
+            return self._exit_action(result, msg, failed=True)
+
+        # Each item is checked with the options of the task it does not set
+        items = []
+        for index, item in enumerate(batch):
+            item_args = dict(task_args)
+            item_args.update(item)
+            msg = _check_copy_args(item_args)
+            if msg:
+                return self._exit_action(result, "Item {0} of 'batch': {1}".format(index, msg), failed=True)
+            items.append(item_args)
+
+        # ********************************************************** #
+        #  The local sources are archived under the index of their   #
+        #  item, with the layout a transfer of each source would     #
+        #  create, and transferred together.                         #
+        # ********************************************************** #
+
+        module_items = []
+        archive_entries = []
+        for index, item_args in enumerate(items):
+            src = item_args.get("src")
+            dest = item_args.get("dest")
+            remote_src = _process_boolean(item_args.get("remote_src"), default=False)
+            module_item = dict(batch[index])
+            module_item.update(
                 dict(
-                    msg=copy_res.get("msg"),
-                    stdout=copy_res.get("stdout") or copy_res.get("module_stdout"),
-                    stderr=copy_res.get("stderr") or copy_res.get("module_stderr"),
-                    stdout_lines=copy_res.get("stdout_lines"),
-                    stderr_lines=copy_res.get("stderr_lines"),
-                    rc=copy_res.get("rc"),
-                    invocation=dict(module_args=self._task.args),
+                    is_uss="/" in dest,
+                    is_mvs_dest=is_data_set(dest),
+                    copy_member=is_member(dest),
+                    src_member=is_member(src) if src else None,
+                    is_src_dir=False,
+                    is_pds=False,
                 )
             )
-            if backup or backup_name:
-                result["backup_name"] = copy_res.get("backup_name")
-            self._remote_cleanup(dest, copy_res.get("dest_exists"), task_vars)
+            if not remote_src:
+                if item_args.get("content") is not None:
+                    if not _inline_module_content(module_item):
+                        archive_entries.append((None, str(index), item_args.get("content")))
+                else:
+                    local_src = _local_path(src)
+                    if os.path.isdir(local_src):
+                        path, dirs, files = next(os.walk(local_src))
+                        if not module_item["is_uss"] and dirs:
+                            msg = (
+                                "Item {0} of 'batch': Cannot copy a source directory with subdirectories "
+                                "to a data set, the destination must be another directory".format(index)
+                            )
+                            return self._exit_action(result, msg, failed=True)
+                        module_item["is_src_dir"] = True
+                        module_item["is_pds"] = module_item["is_mvs_dest"]
+                        archive_entries.append((
+                            local_src, "{0}/{1}".format(index, os.path.basename(local_src.rstrip("/"))), None
+                        ))
+                    else:
+                        if item_args.get("mode") == "preserve":
+                            module_item["mode"] = "0{0:o}".format(
+                                stat.S_IMODE(os.stat(local_src).st_mode)
+                            )
+                        archive_entries.append((local_src, str(index), None))
+            module_items.append(module_item)
+
+        temp_path = None
+        if archive_entries:
+            archive_transfer = task_args.get("archive_transfer", None) or "none"
+            try:
+                archive_path, sizes = _create_batch_archive(
+                    archive_entries, compress=archive_transfer == "gz"
+                )
+            except (OSError, IOError, tarfile.TarError) as err:
+                msg = "Unable to create an archive of the sources of 'batch': {0}".format(str(err))
+                return self._exit_action(result, msg, failed=True)
+            try:
+                transfer_res = self._copy_to_remote(
+                    archive_path,
+                    ignore_stderr=_process_boolean(task_args.get("ignore_sftp_stderr"), default=False)
+                )
+            finally:
+                os.remove(archive_path)
+            if transfer_res.get("msg"):
+                return transfer_res
+            temp_path = transfer_res.get("temp_path")
+            display.vvv(u"ibm_zos_copy temp path: {0}".format(temp_path), host=self._play_context.remote_addr)
+
+            for (local_src, arcname, content), size in zip(archive_entries, sizes):
+                index = int(arcname.split("/")[0])
+                module_items[index]["temp_path"] = "{0}/{1}".format(temp_path, index)
+                module_items[index]["size"] = size
+
+        task_args.update(
+            dict(
+                batch=module_items,
+                temp_path=temp_path,
+                local_charset=encode.Defaults.get_default_system_charset()
+            )
+        )
+        copy_res = self._execute_module(
+            module_name="ibm.ibm_zos_core.zos_copy",
+            module_args=task_args,
+            task_vars=task_vars,
+        )
+
+        if copy_res.get("batch_results") is None:
+            result.update(_update_failed_result(copy_res, self._task.args, False))
             return result
 
-        return _update_result(is_binary, copy_res, self._task.args)
+        batch_results = []
+        for item_args, item_res in zip(items, copy_res.get("batch_results")):
+            is_binary = _process_boolean(item_args.get("is_binary"), default=False)
+            backup = _process_boolean(item_args.get("backup"), default=False)
+            if item_res.get("msg"):
+                item_result = _update_failed_result(item_res, item_args, backup or item_args.get("backup_name"))
+                item_result.update(dest=item_args.get("dest"), failed=True)
+                item_result.pop("invocation")
+                self._remote_cleanup(item_args.get("dest"), item_res.get("dest_exists"), task_vars)
+            elif item_res.get("note") and not _process_boolean(item_args.get("force"), default=True):
+                item_result = dict(dest=item_args.get("dest"), note=item_res.get("note"), changed=False)
+            else:
+                item_result = _update_result(is_binary, item_res, item_args)
+                item_result.pop("invocation")
+            batch_results.append(item_result)
+
+        result.update(
+            dict(
+                changed=any(item_result.get("changed") for item_result in batch_results),
+                batch_results=batch_results,
+                invocation=dict(module_args=self._task.args),
+            )
+        )
+        if copy_res.get("msg"):
+            result["msg"] = copy_res.get("msg")
+            result["failed"] = True
+        return result
 
     def _copy_to_remote(self, src, is_dir=False, ignore_stderr=False):
         """Copy a file or directory to the remote z/OS system """
@@ -338,6 +512,24 @@ class ActionModule(ActionBase):
         return result
 
 
+def _update_failed_result(copy_res, original_args, backup):
+    """ Helper function to build the output result of a failed copy """
+    failed_result = dict(
+        msg=copy_res.get("msg"),
+        stdout=copy_res.get("stdout") or copy_res.get("module_stdout"),
+        stderr=copy_res.get("stderr") or copy_res.get("module_stderr"),
+        stdout_lines=copy_res.get("stdout_lines"),
+        stderr_lines=copy_res.get("stderr_lines"),
+        rc=copy_res.get("rc"),
+        invocation=dict(module_args=original_args),
+    )
+    if copy_res.get("member_errors"):
+        failed_result["member_errors"] = copy_res.get("member_errors")
+    if backup:
+        failed_result["backup_name"] = copy_res.get("backup_name")
+    return failed_result
+
+
 def _update_result(is_binary, copy_res, original_args):
     """ Helper function to update output result with the provided values """
     ds_type = copy_res.get("ds_type")
@@ -356,6 +548,10 @@ def _update_result(is_binary, copy_res, original_args):
         updated_result["note"] = note
     if backup_name:
         updated_result["backup_name"] = backup_name
+    if copy_res.get("sync"):
+        updated_result["sync"] = copy_res.get("sync")
+    if copy_res.get("failed_copy_attempts") is not None:
+        updated_result["failed_copy_attempts"] = copy_res.get("failed_copy_attempts")
 
     if ds_type == "USS":
         updated_result.update(
@@ -376,6 +572,64 @@ def _update_result(is_binary, copy_res, original_args):
     return updated_result
 
 
+def _check_copy_args(args):
+    """ Check the options of a copy, the ones of the task or of an item of
+        'batch', and return the error message of the first invalid one, or
+        None when they are all valid.
+    """
+    src = args.get("src", None)
+    dest = args.get("dest", None)
+    content = args.get("content", None)
+    remote_src = _process_boolean(args.get("remote_src"), default=False)
+    local_follow = _process_boolean(args.get("local_follow"), default=False)
+    is_binary = _process_boolean(args.get("is_binary"), default=False)
+    backup = _process_boolean(args.get("backup"), default=False)
+
+    if not dest:
+        return "Destination is required"
+    if not isinstance(dest, string_types):
+        return "Invalid type supplied for 'dest' option, it must be a string"
+
+    if src:
+        if content:
+            return "Either 'src' or 'content' can be provided; not both."
+        if not isinstance(src, string_types):
+            return "Invalid type supplied for 'src' option, it must be a string"
+    elif not content:
+        return "'src' or 'content' is required"
+
+    if args.get("encoding") and is_binary:
+        return "The 'encoding' parameter is not valid for binary transfer"
+
+    if (not backup) and args.get("backup_name") is not None:
+        return "Backup file provided but 'backup' parameter is False"
+
+    if "/" not in dest:
+        if args.get("mode") or args.get("owner") or args.get("group"):
+            return "Cannot specify 'mode', 'owner' or 'group' for MVS destination"
+
+    if not remote_src:
+        if local_follow and not src:
+            return "No path given for local symlink"
+        if src:
+            src = _local_path(src)
+            if not os.path.exists(src):
+                return "The local file {0} does not exist".format(src)
+            if not os.access(src, os.R_OK):
+                return (
+                    "The local file {0} does not have appropriate "
+                    "read permission".format(src)
+                )
+    return None
+
+
+def _local_path(src):
+    """ Resolve the path of a local source """
+    if src.startswith('~'):
+        src = os.path.expanduser(src)
+    return os.path.realpath(src)
+
+
 def _process_boolean(arg, default=False):
     try:
         return boolean(arg)
@@ -404,12 +658,153 @@ def _detect_sftp_errors(stderr):
     return ""
 
 
+def _create_transfer_archive(src, compress=False):
+    """Create a tar archive of a directory in a local temp file, the files are
+    stored under the directory base name, the same layout 'put -r' creates on
+    the remote system.
+
+    Arguments:
+        src {str} -- The directory to archive.
+
+    Keyword Arguments:
+        compress {bool} -- Whether to compress the archive with gzip. (default: {False})
+
+    Returns:
+        tuple(str, int) -- The path of the archive and the total size of the
+            regular files in its manifest.
+    """
+    path, sizes = _create_batch_archive(
+        [(src, os.path.basename(src.rstrip("/")), None)], compress=compress
+    )
+    return path, sizes[0]
+
+
+def _create_batch_archive(entries, compress=False):
+    """Create a tar archive of local files, directories and contents in a
+    local temp file.
+
+    Arguments:
+        entries {list[tuple(str, str, str)]} -- The local path, or None for a
+            content, the name in the archive, and the content to store as a
+            file when there is no local path.
+
+    Keyword Arguments:
+        compress {bool} -- Whether to compress the archive with gzip. (default: {False})
+
+    Returns:
+        tuple(str, list[int]) -- The path of the archive and the total size of
+            the regular files stored for each entry.
+    """
+    fd, path = mkstemp(suffix=".tar.gz" if compress else ".tar")
+    os.close(fd)
+    sizes = []
+    try:
+        with tarfile.open(path, "w:gz" if compress else "w", dereference=True) as archive:
+            for src, base, content in entries:
+                if src is None:
+                    data = _encode_content(content)
+                    tarinfo = tarfile.TarInfo(base)
+                    tarinfo.size = len(data)
+                    tarinfo.mode = 0o600
+                    tarinfo.mtime = time.time()
+                    archive.addfile(tarinfo, io.BytesIO(data))
+                    sizes.append(len(data))
+                else:
+                    sizes.append(_add_to_archive(archive, src, base))
+    except Exception:
+        os.remove(path)
+        raise
+    return path, sizes
+
+
+def _add_to_archive(archive, src, base):
+    """Add a local file or directory tree to an archive under base, and return
+    the total size of its regular files."""
+    size = 0
+    if not os.path.isdir(src):
+        tarinfo = archive.gettarinfo(src, base)
+        with open(src, "rb") as infile:
+            archive.addfile(tarinfo, infile)
+        return tarinfo.size
+
+    archive.add(src, arcname=base, recursive=False)
+    for root, dirs, files in os.walk(src):
+        dirs.sort()
+        for name in dirs + sorted(files):
+            file_path = os.path.join(root, name)
+            arcname = os.path.join(base, os.path.relpath(file_path, src))
+            tarinfo = archive.gettarinfo(file_path, arcname)
+            # 'put -r' skips anything that is not a file or directory
+            if tarinfo is None or not (tarinfo.isreg() or tarinfo.isdir()):
+                continue
+            if tarinfo.isreg():
+                size += tarinfo.size
+                with open(file_path, "rb") as infile:
+                    archive.addfile(tarinfo, infile)
+            else:
+                archive.addfile(tarinfo)
+    return size
+
+
+def _stage_files(src, staging_dir, files):
+    """Copy some of the files of a directory into a staging directory with
+    the same base name, keeping their relative paths.
+
+    Arguments:
+        src {str} -- The source directory.
+        staging_dir {str} -- The directory to stage the files in.
+        files {list[str]} -- The paths of the files to stage, relative to src.
+
+    Returns:
+        str -- The path of the staged directory.
+    """
+    staged_src = os.path.join(staging_dir, os.path.basename(src.rstrip("/")))
+    os.mkdir(staged_src)
+    for file_path in files:
+        staged_file = os.path.join(staged_src, file_path)
+        if not os.path.isdir(os.path.dirname(staged_file)):
+            os.makedirs(os.path.dirname(staged_file))
+        shutil.copy2(os.path.join(src, file_path), staged_file)
+    return staged_src
+
+
+def _encode_content(content):
+    """Encode content the way it is written to a local file """
+    return to_bytes(content, encoding=locale.getpreferredencoding(False), errors="surrogate_or_strict")
+
+
+def _inline_content(content):
+    """Encode content in base64 to send it in the module arguments, or return
+    None when it is larger than INLINE_CONTENT_MAX_SIZE and must be
+    transferred instead.
+    """
+    data = _encode_content(content)
+    if len(data) > INLINE_CONTENT_MAX_SIZE:
+        return None
+    return to_text(base64.b64encode(data))
+
+
+def _inline_module_content(module_args):
+    """Replace the content of the module arguments by its base64 encoding,
+    so that it is sent only once, when it is small enough to be inlined.
+
+    Returns:
+        bool -- Whether the content was inlined, otherwise it must be transferred.
+    """
+    content_b64 = _inline_content(module_args.get("content"))
+    if content_b64 is None:
+        return False
+    module_args["content_b64"] = content_b64
+    module_args.pop("content")
+    return True
+
+
 def _write_content_to_temp_file(content):
     """Write given content to a temp file and return its path """
     fd, path = mkstemp()
     try:
-        with os.fdopen(fd, "w") as infile:
-            infile.write(content)
+        with os.fdopen(fd, "wb") as infile:
+            infile.write(_encode_content(content))
     except (OSError, IOError) as err:
         os.remove(path)
         raise AnsibleError(
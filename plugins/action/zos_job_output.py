@@ -0,0 +1,269 @@
+# Copyright (c) IBM Corporation 2023
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import os
+import re
+import shutil
+
+from hashlib import sha256
+from tempfile import mkdtemp
+
+from ansible.module_utils.common.text.converters import to_bytes, to_text
+from ansible.module_utils.parsing.convert_bool import boolean
+from ansible.plugins.action import ActionBase
+from ansible.errors import AnsibleError
+from ansible.utils.display import Display
+from ansible import cli
+
+display = Display()
+
+
+def _process_boolean(arg, default=False):
+    """ Return boolean representation of arg.
+        If arg is None, return the default value
+    """
+    try:
+        return boolean(arg)
+    except TypeError:
+        return default
+
+
+def _get_file_checksum(src):
+    """ Calculate SHA256 hash for a given file """
+    blksize = 64 * 1024
+    hash_digest = sha256()
+    try:
+        with open(to_bytes(src, errors="surrogate_or_strict"), "rb") as infile:
+            block = infile.read(blksize)
+            while block:
+                hash_digest.update(block)
+                block = infile.read(blksize)
+    except Exception as err:
+        raise AnsibleError("Unable to calculate checksum: {0}".format(str(err)))
+    return hash_digest.hexdigest()
+
+
+def _detect_sftp_errors(stderr):
+    """Detects if the stderr of the SFTP command contains any errors.
+       The SFTP command usually returns zero return code even if it
+       encountered an error while transferring data. Hence the need to parse
+       its stderr to determine what error it ran into.
+    """
+    # The first line of stderr is a connection acknowledgement,
+    # which can be ignored
+    lines = to_text(stderr).splitlines()
+    if len(lines) > 1:
+        return "".join(lines[1:])
+    return ""
+
+
+def _move_tree(src, dest):
+    """ Move the files of the src directory tree into dest, replacing the
+        files that already exist in dest.
+    """
+    for root, dirs, files in os.walk(src):
+        dest_dir = os.path.join(dest, os.path.relpath(root, src))
+        if not os.path.isdir(dest_dir):
+            os.makedirs(dest_dir)
+        for name in files:
+            shutil.move(os.path.join(root, name), os.path.join(dest_dir, name))
+
+
+class ActionModule(ActionBase):
+    def run(self, tmp=None, task_vars=None):
+        """ handler for writing job output to files on the controller """
+        if task_vars is None:
+            task_vars = dict()
+
+        result = super(ActionModule, self).run(tmp, task_vars)
+        del tmp
+
+        if result.get("skipped"):
+            return result
+
+        module_args = self._task.args.copy()
+        dest = module_args.get("dest")
+
+        if not dest:
+            result.update(
+                self._execute_module(
+                    module_name="ibm.ibm_zos_core.zos_job_output",
+                    module_args=module_args,
+                    task_vars=task_vars,
+                )
+            )
+            return result
+
+        ignore_sftp_stderr = _process_boolean(
+            module_args.get("ignore_sftp_stderr"), default=False
+        )
+
+        # ********************************************************** #
+        #  Determine the destination directory, as with zos_fetch    #
+        #  the hostname is appended to dest so that the output of    #
+        #  jobs from many hosts does not collide.                    #
+        # ********************************************************** #
+
+        if "inventory_hostname" in task_vars:
+            target_name = task_vars["inventory_hostname"]
+        else:
+            target_name = self._play_context.remote_addr
+        dest = os.path.join(self._loader.path_dwim(os.path.expanduser(dest)), target_name)
+
+        try:
+            if not os.path.isdir(dest):
+                os.makedirs(dest)
+        except OSError as err:
+            result["msg"] = "Unable to create destination directory {0}".format(dest)
+            result["stderr"] = str(err)
+            result["stderr_lines"] = str(err).splitlines()
+            result["failed"] = True
+            return result
+
+        # ********************************************************** #
+        #                Execute module on remote host               #
+        # ********************************************************** #
+
+        module_res = self._execute_module(
+            module_name="ibm.ibm_zos_core.zos_job_output",
+            module_args=module_args,
+            task_vars=task_vars,
+        )
+        remote_path = module_res.pop("remote_path", None)
+        result.update(module_res)
+        if module_res.get("failed") or remote_path is None:
+            return result
+
+        staging_dir = None
+        try:
+            # The files are transferred to a path that does not exist yet so
+            # that SFTP copies the remote directory as is, they are then moved
+            # into dest, replacing the output of earlier runs.
+            staging_dir = mkdtemp()
+            staging_path = os.path.join(staging_dir, "output")
+            transfer_res = self._transfer_remote_content(
+                staging_path, remote_path, ignore_stderr=ignore_sftp_stderr
+            )
+            if transfer_res.get("msg"):
+                result.update(transfer_res)
+                return result
+
+            _move_tree(staging_path, dest)
+
+            for job in result.get("jobs") or []:
+                for dd in job.get("ddnames") or []:
+                    if "dest" not in dd:
+                        continue
+                    dd["dest"] = os.path.join(dest, dd["dest"])
+                    if _get_file_checksum(dd["dest"]) != dd.get("checksum"):
+                        result["msg"] = "The checksum of {0} does not match the job output on z/OS".format(
+                            dd["dest"]
+                        )
+                        result["failed"] = True
+                        return result
+        except Exception as err:
+            result["msg"] = "Failure during the transfer of the job output"
+            result["stderr"] = str(err)
+            result["stderr_lines"] = str(err).splitlines()
+            result["failed"] = True
+            return result
+
+        # ********************************************************** #
+        #              Cleanup temp files and directories            #
+        # ********************************************************** #
+
+        finally:
+            if staging_dir is not None:
+                shutil.rmtree(staging_dir, ignore_errors=True)
+            self._connection.exec_command("rm -r {0}".format(remote_path))
+
+        result["dest"] = dest
+        return result
+
+    def _transfer_remote_content(self, dest, remote_path, ignore_stderr=False):
+        """ Transfer the directory holding the job output from USS to the
+            local machine in a single SFTP transfer.
+        """
+        result = dict()
+        _sftp_action = 'get -r'
+
+        # To support multiple Ansible versions we must do some version detection and act accordingly
+        version_inf = cli.CLI.version_info(False)
+        version_major = version_inf['major']
+        version_minor = version_inf['minor']
+
+        # Override the Ansible Connection behavior for this module and track users configuration
+        sftp_transfer_method = "sftp"
+        user_ssh_transfer_method = None
+        is_ssh_transfer_method_updated = False
+
+        try:
+            if version_major == 2 and version_minor >= 11:
+                user_ssh_transfer_method = self._connection.get_option('ssh_transfer_method')
+
+                if user_ssh_transfer_method != sftp_transfer_method:
+                    self._connection.set_option('ssh_transfer_method', sftp_transfer_method)
+                    is_ssh_transfer_method_updated = True
+
+            elif version_major == 2 and version_minor <= 10:
+                user_ssh_transfer_method = self._play_context.ssh_transfer_method
+
+                if user_ssh_transfer_method != sftp_transfer_method:
+                    self._play_context.ssh_transfer_method = sftp_transfer_method
+                    is_ssh_transfer_method_updated = True
+
+            if is_ssh_transfer_method_updated:
+                display.vvv(u"ibm_zos_job_output SSH transfer method updated from {0} to {1}.".format(user_ssh_transfer_method,
+                            sftp_transfer_method), host=self._play_context.remote_addr)
+
+            display.vvv(u"{0} {1} TO {2}".format(_sftp_action, remote_path, dest), host=self._play_context.remote_addr)
+            (returncode, stdout, stderr) = self._connection._file_transport_command(remote_path, dest, _sftp_action)
+
+            display.vvv(u"ibm_zos_job_output return code: {0}".format(returncode), host=self._play_context.remote_addr)
+            display.vvv(u"ibm_zos_job_output stdout: {0}".format(stdout), host=self._play_context.remote_addr)
+            display.vvv(u"ibm_zos_job_output stderr: {0}".format(stderr), host=self._play_context.remote_addr)
+
+            err = _detect_sftp_errors(stderr)
+
+            # With verbosity greater than 3, SFTP writes its debug output to
+            # stderr, which does not mean an error happened.
+            if self._play_context.verbosity > 3:
+                ignore_stderr = True
+
+            if re.findall(r"Permission denied", err):
+                result["msg"] = "Insufficient write permission for destination {0}".format(
+                    dest
+                )
+            elif returncode != 0 or (err and not ignore_stderr):
+                result["msg"] = "Error transferring remote data from z/OS system"
+                result["rc"] = returncode
+            if result.get("msg"):
+                result["stderr"] = err
+                result["failed"] = True
+
+        finally:
+            # Restore the users defined option `ssh_transfer_method` if it was overridden
+
+            if is_ssh_transfer_method_updated:
+                if version_major == 2 and version_minor >= 11:
+                    self._connection.set_option('ssh_transfer_method', user_ssh_transfer_method)
+
+                elif version_major == 2 and version_minor <= 10:
+                    self._play_context.ssh_transfer_method = user_ssh_transfer_method
+
+                display.vvv(u"ibm_zos_job_output SSH transfer method restored to {0}".format(user_ssh_transfer_method), host=self._play_context.remote_addr)
+                is_ssh_transfer_method_updated = False
+
+        return result
@@ -32,7 +32,7 @@ class ActionModule(ActionBase):
             return result
 
         module_args = self._task.args.copy()
-        if module_args["location"] == "LOCAL":
+        if module_args.get("location") == "LOCAL":
 
             source = self._task.args.get("src", None)
 
@@ -0,0 +1,55 @@
+# Copyright (c) IBM Corporation 2023
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+from ansible_collections.ibm.ibm_zos_core.plugins.module_utils.content_format import (
+    GZIP_BASE64_FIELD,
+    parse_content,
+)
+
+
+def decompress_content(response):
+    """Restore the content lines of every DD compressed with content_format=gzip_base64.
+
+    Arguments:
+        response {Union[dict, list]} -- The result of zos_job_output, zos_job_submit
+        or zos_mvs_raw, or any part of it such as a job or a single DD.
+
+    Returns:
+        Union[dict, list] -- A copy of the response with every compressed DD
+        holding its 'content' lines again, anything else is left as is.
+    """
+    if isinstance(response, list):
+        return [decompress_content(item) for item in response]
+    if not isinstance(response, dict):
+        return response
+
+    decompressed = dict(
+        (key, decompress_content(value)) for key, value in response.items()
+    )
+    if GZIP_BASE64_FIELD in response:
+        decompressed["content"] = parse_content(response)
+        del decompressed[GZIP_BASE64_FIELD]
+        decompressed.pop("content_format", None)
+    return decompressed
+
+
+class FilterModule(object):
+    """ Jinja2 filters for use with the DD content returned by the job and program modules. """
+
+    def filters(self):
+        filters = {
+            "decompress_content": decompress_content,
+        }
+        return filters
@@ -21,13 +21,14 @@ from ansible_collections.ibm.ibm_zos_core.plugins.module_utils.ansible_module im
 )
 
 import time
-from shutil import copy2, copytree, rmtree
+from shutil import rmtree
 from ansible_collections.ibm.ibm_zos_core.plugins.module_utils.import_handler import (
     MissingZOAUImport,
 )
 from ansible_collections.ibm.ibm_zos_core.plugins.module_utils.better_arg_parser import (
     BetterArgParser,
 )
+from ansible_collections.ibm.ibm_zos_core.plugins.module_utils.copy import copy_file, copy_tree
 from ansible_collections.ibm.ibm_zos_core.plugins.module_utils.file import make_dirs
 
 from ansible_collections.ibm.ibm_zos_core.plugins.module_utils.data_set import (
@@ -172,12 +173,12 @@ def uss_file_backup(path, backup_name=None, compress=False):
         if os.path.isdir(abs_path):
             if os.path.exists(backup_name):
                 rmtree(backup_name)
-            copytree(abs_path, backup_name)
+            copy_tree(abs_path, backup_name)
         elif not os.path.isdir(abs_path) and os.path.isdir(backup_name):
             backup_name = backup_name + os.path.basename(abs_path)
-            copy2(abs_path, backup_name)
+            copy_file(abs_path, backup_name, preserve_times=True)
         else:
-            copy2(abs_path, backup_name)
+            copy_file(abs_path, backup_name, preserve_times=True)
 
     return backup_name
 
@@ -0,0 +1,88 @@
+# Copyright (c) IBM Corporation 2023
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import base64
+import zlib
+
+# The content is returned as a list of lines, the default
+LINES = "lines"
+# The content is returned as a single gzip compressed, base64 encoded string
+GZIP_BASE64 = "gzip_base64"
+
+CONTENT_FORMATS = [LINES, GZIP_BASE64]
+
+# Field holding the compressed content in place of 'content'
+GZIP_BASE64_FIELD = "content_gzip_base64"
+
+
+def format_content(response, content_format=LINES):
+    """Convert the 'content' lines of a DD response to the requested format,
+    the response is updated in place. With gzip_base64, 'content' is replaced
+    by 'content_gzip_base64' and 'content_format' is added to the response.
+
+    Arguments:
+        response {dict} -- A DD response holding the content lines.
+
+    Keyword Arguments:
+        content_format {str} -- One of CONTENT_FORMATS. (default: {LINES})
+
+    Returns:
+        dict -- The updated response.
+    """
+    if content_format == LINES or response.get("content") is None:
+        return response
+
+    text = "\n".join(response.pop("content"))
+    # A gzip header is written so the content can also be decompressed with gunzip
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    compressed = compressor.compress(text.encode("utf-8")) + compressor.flush()
+    response[GZIP_BASE64_FIELD] = base64.b64encode(compressed).decode("ascii")
+    response["content_format"] = content_format
+    return response
+
+
+def format_job_content(jobs, content_format=LINES):
+    """Convert the content of every DD of the jobs returned by job_output.
+
+    Arguments:
+        jobs {list[dict]} -- The jobs, each with its 'ddnames'.
+
+    Keyword Arguments:
+        content_format {str} -- One of CONTENT_FORMATS. (default: {LINES})
+
+    Returns:
+        list[dict] -- The updated jobs.
+    """
+    if content_format == LINES:
+        return jobs
+    for job in jobs or []:
+        for dd in job.get("ddnames") or []:
+            format_content(dd, content_format)
+    return jobs
+
+
+def parse_content(response):
+    """Get the content lines of a DD response, whichever its format.
+
+    Arguments:
+        response {dict} -- A DD response.
+
+    Returns:
+        list[str] -- The content lines, None when the response has no content.
+    """
+    if GZIP_BASE64_FIELD in response:
+        compressed = base64.b64decode(response[GZIP_BASE64_FIELD])
+        return zlib.decompress(compressed, 16 + zlib.MAX_WBITS).decode("utf-8").split("\n")
+    return response.get("content")
@@ -15,6 +15,10 @@ from __future__ import absolute_import, division, print_function
 __metaclass__ = type
 
 
+import errno
+import os
+import shutil
+
 from ansible.module_utils.six import PY3
 from ansible_collections.ibm.ibm_zos_core.plugins.module_utils.ansible_module import (
     AnsibleModuleHelper,
@@ -22,6 +26,7 @@ from ansible_collections.ibm.ibm_zos_core.plugins.module_utils.ansible_module im
 from ansible_collections.ibm.ibm_zos_core.plugins.module_utils.better_arg_parser import (
     BetterArgParser,
 )
+from ansible_collections.ibm.ibm_zos_core.plugins.module_utils.system import is_zos
 
 if PY3:
     from shlex import quote
@@ -32,6 +37,19 @@ else:
 REPRO = """  REPRO INDATASET({}) -
     OUTDATASET({}) REPLACE """
 
+# Bytes copied by each system call, or read at a time by the buffered copy
+COPY_BUFFER_SIZE = 8 * 1024 * 1024
+
+# Number of paths given to each ls -T or chtag command
+TAG_BATCH_SIZE = 500
+
+# Errors of copy_file_range and sendfile that mean the files are not
+# supported by them, the copy then continues with buffered reads
+_ZERO_COPY_ERRORS = frozenset(
+    getattr(errno, name) for name in ("EXDEV", "ENOSYS", "EINVAL", "EOPNOTSUPP", "ENOTSUP", "EBADF", "ENOTSOCK")
+    if hasattr(errno, name)
+)
+
 
 def _validate_data_set_name(ds):
     arg_defs = dict(ds=dict(arg_type="data_set"),)
@@ -146,20 +164,229 @@ def copy_uss2uss_binary(src, dest):
         src: {str} -- The source USS path
         dest: {str} -- The destination USS path
     Raises:
-        USSCmdExecError: When any exception is raised during the conversion.
+        OSError: When the file can not be read or written.
     Returns:
-        boolean -- The return code after the USS command executed successfully
-        str -- The stdout after the USS command executed successfully
-        str -- The stderr after the USS command executed successfully
+        boolean -- The return code after the file was copied successfully
+        str -- The stdout after the file was copied successfully
+        str -- The stderr after the file was copied successfully
     """
-    module = AnsibleModuleHelper(argument_spec={})
     src = _validate_path(src)
     dest = _validate_path(dest)
-    cp_uss2uss = "cp -F bin {0} {1}".format(quote(src), quote(dest))
-    rc, out, err = module.run_command(cp_uss2uss)
-    if rc:
-        raise USSCmdExecError(cp_uss2uss, rc, out, err)
-    return rc, out, err
+    copy_file(src, dest)
+    return 0, "", ""
+
+
+def copy_file(src, dest, preserve_times=False, preserve_tag=True):
+    """Copy the content of a USS file into another one, along with its mode
+    and, on z/OS, its file tag. The content is copied by the kernel with
+    copy_file_range or sendfile when they are available and support the
+    files, otherwise with large buffered reads, no process is started.
+
+    Arguments:
+        src: {str} -- The source USS path
+        dest: {str} -- The destination USS path
+
+    Keyword Arguments:
+        preserve_times: {bool} -- Whether to also keep the access and modification
+                                  times of the file. (default: {False})
+        preserve_tag: {bool} -- Whether to keep the file tag. (default: {True})
+
+    Raises:
+        shutil.SameFileError: When src and dest are the same file.
+        OSError: When the file can not be read or written.
+    """
+    # Opening dest would truncate src before it is read
+    if os.path.exists(dest) and os.path.samefile(src, dest):
+        raise shutil.SameFileError("{0!r} and {1!r} are the same file".format(src, dest))
+
+    with open(src, "rb", buffering=0) as src_file:
+        with open(dest, "wb", buffering=0) as dest_file:
+            _copy_file_content(src_file, dest_file)
+
+    if preserve_times:
+        shutil.copystat(src, dest)
+    else:
+        shutil.copymode(src, dest)
+
+    if preserve_tag and is_zos():
+        copy_file_tags([(src, dest)])
+
+
+def copy_files(file_pairs, preserve_times=False):
+    """Copy many USS files with copy_file, the file tags of all of them are
+    then copied with a few commands instead of a few for each file.
+
+    Arguments:
+        file_pairs: {list[tuple(str, str)]} -- The (source, destination) paths
+
+    Keyword Arguments:
+        preserve_times: {bool} -- Whether to also keep the access and modification
+                                  times of the files. (default: {False})
+
+    Raises:
+        OSError: When a file can not be read or written.
+    """
+    for src, dest in file_pairs:
+        copy_file(src, dest, preserve_times=preserve_times, preserve_tag=False)
+    if is_zos():
+        copy_file_tags(file_pairs)
+
+
+def copy_tree(src, dest, dirs_exist_ok=False):
+    """Copy a USS directory tree with copy_file, keeping the mode and times of
+    files and directories and the file tags. Like shutil.copytree, symbolic
+    links are followed and copied as regular files and directories.
+
+    Arguments:
+        src: {str} -- The source USS directory
+        dest: {str} -- The destination USS directory
+
+    Keyword Arguments:
+        dirs_exist_ok: {bool} -- Whether dest and its directories may already
+                                 exist. (default: {False})
+
+    Raises:
+        OSError: When dest exists and dirs_exist_ok is not set, or when a file
+                 can not be read or written.
+
+    Returns:
+        str -- The destination directory
+    """
+    copied_files = []
+    copied_dirs = []
+    for root, dirs, files in os.walk(src, followlinks=True):
+        dest_root = os.path.normpath(os.path.join(dest, os.path.relpath(root, src)))
+        if os.path.isdir(dest_root):
+            if not dirs_exist_ok:
+                raise OSError(errno.EEXIST, os.strerror(errno.EEXIST), dest_root)
+        else:
+            os.makedirs(dest_root)
+        copied_dirs.append((root, dest_root))
+
+        for name in files:
+            file_pair = (os.path.join(root, name), os.path.join(dest_root, name))
+            copy_file(file_pair[0], file_pair[1], preserve_times=True, preserve_tag=False)
+            copied_files.append(file_pair)
+
+    # The tags of all the files are copied with a few commands, and the
+    # directories get their times last, after their content was written.
+    if is_zos():
+        copy_file_tags(copied_files)
+    for src_dir, dest_dir in reversed(copied_dirs):
+        shutil.copystat(src_dir, dest_dir)
+
+    return dest
+
+
+def _copy_file_content(src_file, dest_file):
+    """Copy the content of a file object into another one, from and to their
+    current positions."""
+    src_fd = src_file.fileno()
+    dest_fd = dest_file.fileno()
+
+    for zero_copy in (_copy_file_range, _sendfile):
+        try:
+            if zero_copy(src_fd, dest_fd):
+                return
+        except OSError as err:
+            # Whatever was copied before the error advanced both file
+            # positions, the next method continues from there.
+            if err.errno not in _ZERO_COPY_ERRORS:
+                raise
+
+    buffer = bytearray(COPY_BUFFER_SIZE)
+    view = memoryview(buffer)
+    read = src_file.readinto(buffer)
+    while read:
+        written = 0
+        while written < read:
+            written += dest_file.write(view[written:read])
+        read = src_file.readinto(buffer)
+
+
+def _copy_file_range(src_fd, dest_fd):
+    if not hasattr(os, "copy_file_range"):
+        return False
+    while os.copy_file_range(src_fd, dest_fd, COPY_BUFFER_SIZE):
+        pass
+    return True
+
+
+def _sendfile(src_fd, dest_fd):
+    if not hasattr(os, "sendfile"):
+        return False
+    # Only Linux accepts no offset, sendfile is given the position of src_fd
+    # and src_fd is moved past what was sent, even when sendfile fails.
+    offset = os.lseek(src_fd, 0, os.SEEK_CUR)
+    try:
+        sent = os.sendfile(dest_fd, src_fd, offset, COPY_BUFFER_SIZE)
+        while sent:
+            offset += sent
+            sent = os.sendfile(dest_fd, src_fd, offset, COPY_BUFFER_SIZE)
+    finally:
+        os.lseek(src_fd, offset, os.SEEK_SET)
+    return True
+
+
+def get_file_tags(paths):
+    """Get the file tags of USS files, as listed by ls -T.
+
+    Arguments:
+        paths: {list[str]} -- The USS paths
+
+    Returns:
+        dict -- The (type, code set) of each path, for example ("t", "IBM-1047"),
+                ("b", "binary") or ("-", "untagged"). Paths that could not be
+                listed are left out.
+    """
+    module = AnsibleModuleHelper(argument_spec={})
+    tags = dict()
+    for start in range(0, len(paths), TAG_BATCH_SIZE):
+        batch = paths[start:start + TAG_BATCH_SIZE]
+        rc, out, err = module.run_command(["ls", "-Td"] + list(batch))
+        for line in out.splitlines():
+            # t IBM-1047    T=on  /path/to/file
+            parts = line.split(None, 3)
+            if len(parts) == 4:
+                tags[parts[3]] = (parts[0], parts[1])
+    return tags
+
+
+def copy_file_tags(file_pairs):
+    """Give each destination file the file tag of its source, with a chtag
+    command for each different tag instead of one for each file.
+
+    Arguments:
+        file_pairs: {list[tuple(str, str)]} -- The (source, destination) paths
+
+    Raises:
+        USSCmdExecError: When chtag fails.
+    """
+    if not file_pairs:
+        return
+    tags = get_file_tags([path for pair in file_pairs for path in pair])
+
+    paths_by_tag = dict()
+    for src, dest in file_pairs:
+        src_tag = tags.get(src)
+        if src_tag is not None and src_tag != tags.get(dest):
+            paths_by_tag.setdefault(src_tag, []).append(dest)
+
+    module = AnsibleModuleHelper(argument_spec={})
+    for (tag_type, code_set), paths in paths_by_tag.items():
+        if tag_type == "t":
+            options = ["-t", "-c", code_set]
+        elif tag_type == "m":
+            options = ["-m", "-c", code_set]
+        elif tag_type == "b":
+            options = ["-b"]
+        else:
+            options = ["-r"]
+        for start in range(0, len(paths), TAG_BATCH_SIZE):
+            cmd = ["chtag"] + options + paths[start:start + TAG_BATCH_SIZE]
+            rc, out, err = module.run_command(cmd)
+            if rc:
+                raise USSCmdExecError(" ".join(cmd), rc, out, err)
 
 
 def copy_mvs2mvs(src, dest, is_binary=False):
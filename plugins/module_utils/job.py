@@ -15,6 +15,12 @@ __metaclass__ = type
 
 import fnmatch
 import re
+from collections import deque
+from itertools import islice
+from concurrent.futures import ThreadPoolExecutor
+from random import uniform
+from subprocess import Popen, PIPE
+from tempfile import TemporaryFile
 from time import sleep
 from timeit import default_timer as timer
 from ansible_collections.ibm.ibm_zos_core.plugins.module_utils.better_arg_parser import (
@@ -23,6 +29,16 @@ from ansible_collections.ibm.ibm_zos_core.plugins.module_utils.better_arg_parser
 from ansible_collections.ibm.ibm_zos_core.plugins.module_utils.import_handler import (
     MissingZOAUImport,
 )
+from ansible_collections.ibm.ibm_zos_core.plugins.module_utils import (
+    zoau_version_checker
+)
+from ansible_collections.ibm.ibm_zos_core.plugins.module_utils.job_log import (
+    JobLogParser,
+)
+from ansible_collections.ibm.ibm_zos_core.plugins.module_utils.job_cache import (
+    JobOutputCache,
+    DEFAULT_CACHE_MAX_BYTES,
+)
 
 try:
     from zoautil_py.jobs import read_output, list_dds, listing
@@ -31,42 +47,327 @@ except Exception:
     list_dds = MissingZOAUImport()
     listing = MissingZOAUImport()
 
+# Maximum number of DDs read from the spool at the same time
+DEFAULT_READ_WORKERS = 8
+
+# First ZOAU version whose jobs.listing accepts the owner and job_name filters
+LISTING_FILTERS_ZOAU_VERSION = "1.2.0"
+
+# Backoff used when polling JES, the first poll waits POLL_INITIAL_DELAY_S and
+# each following poll waits POLL_MULTIPLIER times longer up to POLL_MAX_DELAY_S
+POLL_INITIAL_DELAY_S = 0.05
+POLL_MAX_DELAY_S = 5
+POLL_MULTIPLIER = 2
+POLL_JITTER = 0.1
+# Job statuses that end a job without a return code
+JOB_ERROR_STATUSES = frozenset(["ABEND", "SEC ERROR", "SEC", "JCL ERROR", "JCLERR"])
+# Job statuses after which the job spool no longer changes
+JOB_FINAL_STATUSES = frozenset(["CC", "CANCELED"]) | JOB_ERROR_STATUSES
+# The msg_txt of the placeholder returned when no job output was found
+JOB_NOT_FOUND_MSG = "The job could not be found."
+
+
+class JobPoller(object):
+    def __init__(self, timeout=0, start_time=None, initial_delay=POLL_INITIAL_DELAY_S,
+                 max_delay=POLL_MAX_DELAY_S, multiplier=POLL_MULTIPLIER, jitter=POLL_JITTER):
+        """Polls JES until a condition is met or the time allowed runs out,
+        waiting longer between each poll (exponential backoff with jitter and
+        a cap) so that quick jobs are seen as soon as they complete while long
+        waits query JES far less often.
+
+        Keyword Arguments:
+            timeout {int} -- How long in seconds polling can go on for, measured
+                             from start_time. (default: {0})
+            start_time {float} -- The timer value the timeout is measured from,
+                                  defaults to the time the poller is created. (default: {None})
+            initial_delay {float} -- Seconds to wait before the second poll. (default: {POLL_INITIAL_DELAY_S})
+            max_delay {float} -- Maximum seconds to wait between polls. (default: {POLL_MAX_DELAY_S})
+            multiplier {float} -- Growth factor of the delay after each poll. (default: {POLL_MULTIPLIER})
+            jitter {float} -- Fraction of the delay randomly added or removed so
+                              that concurrent pollers do not query JES in lock step. (default: {POLL_JITTER})
+        """
+        self.timeout = timeout
+        self.start_time = timer() if start_time is None else start_time
+        self.delay = initial_delay
+        self.max_delay = max_delay
+        self.multiplier = multiplier
+        self.jitter = jitter
+        self.polls = 0
+
+    @property
+    def elapsed(self):
+        """Seconds since start_time."""
+        return timer() - self.start_time
+
+    @property
+    def duration(self):
+        """Seconds since start_time, rounded as reported back to the user."""
+        return round(self.elapsed)
+
+    def wait(self):
+        """Sleep until the next poll is due, the sleep never goes past the timeout.
+
+        Returns:
+            bool -- False when the time allowed has run out, otherwise True.
+        """
+        remaining = self.timeout - self.elapsed
+        if remaining <= 0:
+            return False
+        delay = self.delay * uniform(1 - self.jitter, 1 + self.jitter)
+        sleep(min(delay, remaining))
+        self.delay = min(self.delay * self.multiplier, self.max_delay)
+        return True
+
+    def poll(self, query, is_done=bool):
+        """Call query once per tick until is_done returns True for its result
+        or the timeout is reached.
+
+        Arguments:
+            query {callable} -- Performs a single query, such as one listing call.
+
+        Keyword Arguments:
+            is_done {callable} -- Receives the query result and returns whether
+                                  polling can stop, defaults to a truthy result. (default: {bool})
+
+        Returns:
+            object -- The result of the last query.
+        """
+        result = query()
+        self.polls += 1
+        while not is_done(result) and self.wait():
+            result = query()
+            self.polls += 1
+        return result
+
+
+def is_job_complete(job_listing):
+    """Whether a job no longer needs to be polled. A job that is not active
+    is done, including one with a status in JOB_ERROR_STATUSES, whose job
+    output is analyzed to report the error. An active job is done once its
+    return code is known.
+
+    Arguments:
+        job_listing {Job} -- A single job entry returned by the ZOAU listing.
+
+    Returns:
+        bool -- True when there is no need to keep polling the job.
+    """
+    if job_listing.status != "AC":
+        return True
+    return not (job_listing.rc is None or len(job_listing.rc) == 0 or job_listing.rc == "?")
+
+
+def poll_jobs(job_ids, is_done, timeout=0, start_time=None, owner=None, on_done=None, wait_for_all=True):
+    """Poll many jobs until they are done, with the backoff of a JobPoller.
+    Jobs of a single owner are listed with one owner filtered listing call
+    per tick when ZOAU supports it, otherwise each job is listed by its ID.
+
+    Arguments:
+        job_ids {list[str]} -- The job IDs to poll.
+        is_done {callable} -- Receives a job listing entry and returns whether
+                              the job is done.
+
+    Keyword Arguments:
+        timeout {int} -- How long in seconds polling can go on for. (default: {0})
+        start_time {float} -- The timer value the timeout is measured from. (default: {None})
+        owner {str} -- The owner of the jobs, used to filter the listing when
+                       supported by ZOAU, otherwise the owner shared by all the
+                       jobs once they have been listed. (default: {None})
+        on_done {callable} -- Called with the listing entry of each job as soon
+                              as it is done. (default: {None})
+        wait_for_all {bool} -- Whether to wait for all the jobs to be done,
+                               otherwise polling stops once any job is done. (default: {True})
+
+    Returns:
+        tuple(dict, JobPoller) -- The last listing entry of each job ID seen,
+            and the poller used, which holds the duration and number of polls.
+    """
+    pending = set(job_ids)
+    entries = {}
+    owner_filters = [_listing_filters(owner, "*")]
+
+    def list_pending():
+        # Several jobs of the same owner are listed at once, otherwise each
+        # job is listed by its ID so the whole spool is never listed
+        if len(pending) > 1 and owner_filters[0]:
+            return _listing(**owner_filters[0]) or []
+        listed = []
+        for job_id in job_ids:
+            if job_id in pending:
+                listed.extend(_listing(job_id=job_id) or [])
+        return listed
+
+    def query():
+        listed = set()
+        for entry in list_pending():
+            if entry.id in pending:
+                entries[entry.id] = entry
+                listed.add(entry.id)
+
+        if not owner_filters[0] and listed == pending:
+            owners = set(entries[job_id].owner for job_id in pending)
+            if len(owners) == 1:
+                owner_filters[0] = _listing_filters(owners.pop(), "*")
+
+        for job_id in job_ids:
+            if job_id not in pending:
+                continue
+            # A job that was listed before and no longer is has been purged
+            if job_id in listed and not is_done(entries[job_id]):
+                continue
+            if job_id not in listed and job_id not in entries:
+                continue
+            pending.discard(job_id)
+            if on_done is not None:
+                on_done(entries[job_id])
+        return len(pending)
+
+    if wait_for_all:
+        def finished(pending_count):
+            return pending_count == 0
+    else:
+        def finished(pending_count):
+            return pending_count < len(set(job_ids))
+
+    poller = JobPoller(timeout=timeout, start_time=start_time)
+    poller.poll(query, finished)
+    return entries, poller
 
-def job_output(job_id=None, owner=None, job_name=None, dd_name=None, duration=0, timeout=0, start_time=timer()):
+
+def job_output(job_id=None, owner=None, job_name=None, dd_name=None, duration=0, timeout=0, start_time=timer(),
+               dd_content=True, max_workers=DEFAULT_READ_WORKERS, max_lines=None, tail_lines=None, max_bytes=None,
+               search=None, search_context=0, cache_dir=None, cache_max_bytes=DEFAULT_CACHE_MAX_BYTES,
+               dd_offsets=None):
     """Get the output from a z/OS job based on various search criteria.
 
     Keyword Arguments:
         job_id (str) -- The job ID to search for (default: {None})
         owner (str) -- The owner of the job (default: {None})
         job_name (str) -- The job name search for (default: {None})
-        dd_name (str) -- The data definition to retrieve (default: {None})
+        dd_name (Union[str, list[str]]) -- The data definition(s) to retrieve, '?' or
+                                           None retrieves all of them (default: {None})
         duration (int) -- The time the submitted job ran for
         timeout (int) - how long to wait in seconds for a job to complete
         start_time (int) - time the JCL started its submission
+        dd_content (bool) - Whether to read the content of the selected DDs, when
+                            False only the DD metadata from the DD listing is returned,
+                            the DDs of a job that did not run are still read for its msg
+                            (default: {True})
+        max_workers (int) - The maximum number of DDs read concurrently, 1 reads
+                            them one at a time (default: {DEFAULT_READ_WORKERS})
+        max_lines (int) - Return at most the first max_lines lines of each DD (default: {None})
+        tail_lines (int) - Return at most the last tail_lines lines of each DD (default: {None})
+        max_bytes (int) - Return at most max_bytes bytes of each DD, the content is cut on
+                          a line boundary (default: {None})
+        search (list[str]) - Regular expressions searched for in the DD content, when set
+                             only the matching lines are returned in 'matches' instead
+                             of the DD content (default: {None})
+        search_context (int) - Number of lines returned before and after each
+                               matching line (default: {0})
+        cache_dir (str) - A directory caching the output of completed jobs, only used
+                          when job_id is a single job ID, None disables the cache
+                          (default: {None})
+        cache_max_bytes (int) - The maximum size of the cache directory, least recently
+                                used entries are evicted past it
+                                (default: {DEFAULT_CACHE_MAX_BYTES})
+        dd_offsets (dict) - Follow the DDs from a previous call, maps each DD id to the
+                            number of its records already read, only the records after
+                            it are returned along with each DD 'next_offset' and the job
+                            'offsets' to pass to the next call. An empty dict starts
+                            following the DDs from their first record, None reads the
+                            DDs whole (default: {None})
 
     Returns:
         list[dict] -- The output information for a list of jobs matching specified criteria.
         If no job status is found it will return a ret_code diction with
         parameter 'msg_txt" = "The job could not be found.
     """
+    if dd_name is not None and not isinstance(dd_name, list):
+        dd_name = [dd_name]
+
+    if max_lines is not None and tail_lines is not None:
+        raise ValueError("Only one of max_lines and tail_lines can be set.")
+
+    if search is not None and not isinstance(search, list):
+        search = [search]
+
+    if dd_offsets is not None:
+        try:
+            dd_offsets = dict((str(dd_id), int(offset)) for dd_id, offset in dd_offsets.items())
+        except (AttributeError, TypeError, ValueError):
+            raise ValueError("The dd_offsets must map each DD id to a record offset.")
+        if any(offset < 0 for offset in dd_offsets.values()):
+            raise ValueError("The dd_offsets must be 0 or greater.")
+
     arg_defs = dict(
         job_id=dict(arg_type="qualifier_pattern"),
         owner=dict(arg_type="qualifier_pattern"),
         job_name=dict(arg_type="qualifier_pattern"),
-        dd_name=dict(arg_type=_ddname_pattern),
+        dd_name=dict(arg_type="list", elements=_ddname_pattern),
+        max_lines=dict(arg_type=_positive_int),
+        tail_lines=dict(arg_type=_positive_int),
+        max_bytes=dict(arg_type=_positive_int),
+        search=dict(arg_type="list", elements=_search_pattern),
+        search_context=dict(arg_type="int", default=0),
     )
 
     parser = BetterArgParser(arg_defs)
     parsed_args = parser.parse_args(
-        {"job_id": job_id, "owner": owner, "job_name": job_name, "dd_name": dd_name}
+        {"job_id": job_id, "owner": owner, "job_name": job_name, "dd_name": dd_name,
+         "max_lines": max_lines, "tail_lines": tail_lines, "max_bytes": max_bytes,
+         "search": search, "search_context": search_context}
+    )
+    dd_search = None
+    if parsed_args.get("search"):
+        if parsed_args.get("search_context") < 0:
+            raise ValueError("The search_context must be 0 or greater.")
+        dd_search = dict(patterns=parsed_args.get("search"), context=parsed_args.get("search_context"))
+    # Only the limits that were set, empty when the DDs are returned whole
+    dd_limits = dict(
+        (limit, parsed_args.get(limit)) for limit in ("max_lines", "tail_lines", "max_bytes")
+        if parsed_args.get(limit) is not None
     )
     job_id = parsed_args.get("job_id") or "*"
     job_name = parsed_args.get("job_name") or "*"
     owner = parsed_args.get("owner") or "*"
-    dd_name = parsed_args.get("dd_name") or ""
+    dd_name = parsed_args.get("dd_name") or None
+    # '?' means all the DDs
+    if dd_name is not None and "?" in dd_name:
+        dd_name = None
+
+    cache = None
+    if cache_dir and not re.search(r"[*?\[]", job_id):
+        cache = JobOutputCache(cache_dir, cache_max_bytes)
+        cache_key = cache.key(
+            owner=owner, job_name=job_name, dd_name=dd_name, dd_content=dd_content,
+            dd_limits=dd_limits, search=[pattern.pattern for pattern in parsed_args.get("search") or []],
+            search_context=parsed_args.get("search_context"), dd_offsets=dd_offsets)
+        job_listing = (_listing(job_id=job_id) or [None])[0]
+
+        if job_listing is None:
+            # The job was purged, its cached output is no longer valid
+            cache.invalidate(job_id)
+            cache = None
+        elif job_listing.status not in JOB_FINAL_STATUSES:
+            # The spool of an active job still changes, it is never cached
+            cache = None
+        else:
+            cached = cache.get(job_id, cache_key, job_listing)
+            if cached is not None:
+                for job in cached:
+                    job["duration"] = duration
+                return cached
 
     job_detail = _get_job_status(job_id=job_id, owner=owner, job_name=job_name,
-                                 dd_name=dd_name, duration=duration, timeout=timeout, start_time=start_time)
+                                 dd_name=dd_name, duration=duration, timeout=timeout, start_time=start_time,
+                                 dd_content=dd_content, max_workers=max_workers, dd_limits=dd_limits,
+                                 dd_search=dd_search, dd_offsets=dd_offsets)
+
+    # Only real output is cached, the spool of a job can still be empty or
+    # unavailable, in which case _get_job_status returns a placeholder
+    if cache is not None and job_detail and all(
+            job["ddnames"] and job["ret_code"].get("msg_txt") != JOB_NOT_FOUND_MSG for job in job_detail):
+        cache.put(job_id, cache_key, job_listing, job_detail)
 
     # while ((job_detail is None or len(job_detail) == 0) and duration <= timeout):
     #     current_time = timer()
@@ -79,7 +380,9 @@ def job_output(job_id=None, owner=None, job_name=None, dd_name=None, duration=0,
         owner = "" if owner == "*" else owner
         job_name = "" if job_name == "*" else job_name
         job_detail = _get_job_status(job_id=job_id, owner=owner, job_name=job_name,
-                                     dd_name=dd_name, duration=duration, timeout=timeout, start_time=start_time)
+                                     dd_name=dd_name, duration=duration, timeout=timeout, start_time=start_time,
+                                     dd_content=dd_content, max_workers=max_workers, dd_limits=dd_limits,
+                                     dd_search=dd_search, dd_offsets=dd_offsets)
     return job_detail
 
 
@@ -99,7 +402,7 @@ def _job_not_found(job_id, owner, job_name, dd_name):
     job["ret_code"]["msg"] = None
     job["ret_code"]["code"] = None
     job["ret_code"]["msg_code"] = None
-    job["ret_code"]["msg_txt"] = "The job could not be found."
+    job["ret_code"]["msg_txt"] = JOB_NOT_FOUND_MSG
 
     job["class"] = ""
     job["content_type"] = ""
@@ -119,7 +422,8 @@ def _job_not_found(job_id, owner, job_name, dd_name):
     return jobs
 
 
-def job_status(job_id=None, owner=None, job_name=None, dd_name=None):
+def job_status(job_id=None, owner=None, job_name=None, dd_name=None, dd_scan=True,
+               max_workers=DEFAULT_READ_WORKERS):
     """Get the status information of a z/OS job based on various search criteria.
 
     Keyword Arguments:
@@ -127,6 +431,13 @@ def job_status(job_id=None, owner=None, job_name=None, dd_name=None):
         owner {str} -- The owner of the job (default: {None})
         job_name {str} -- The job name search for (default: {None})
         dd_name {str} -- If populated, return ONLY this DD in the job list (default: {None})
+        dd_scan {bool} -- Whether to return and read the job DDs. When False, the
+                          DDs are only listed to leave out the jobs without any,
+                          and only the job log of a job that did not run is read
+                          for its msg, thus 'ddnames', 'class', 'system' and
+                          'subsystem' are left empty (default: {True})
+        max_workers {int} -- The maximum number of DDs read concurrently, 1 reads
+                             them one at a time (default: {DEFAULT_READ_WORKERS})
 
     Returns:
         list[dict] -- The status information for a list of jobs matching search criteria.
@@ -151,41 +462,22 @@ def job_status(job_id=None, owner=None, job_name=None, dd_name=None):
     owner = parsed_args.get("owner") or "*"
     dd_name = parsed_args.get("dd_name")
 
-    job_status_result = _get_job_status(job_id, owner, job_name, dd_name)
+    job_status_result = _get_job_status(job_id, owner, job_name, dd_name, dd_scan=dd_scan,
+                                        max_workers=max_workers)
 
     if len(job_status_result) == 0:
         job_id = "" if job_id == "*" else job_id
         job_name = "" if job_name == "*" else job_name
         owner = "" if owner == "*" else owner
-        job_status_result = _get_job_status(job_id, owner, job_name, dd_name)
+        job_status_result = _get_job_status(job_id, owner, job_name, dd_name, dd_scan=dd_scan,
+                                        max_workers=max_workers)
 
     return job_status_result
 
 
-def _parse_steps(job_str):
-    """Parse the dd section of output to retrieve step-wise CC's
-
-    Args:
-        job_str (str): The content for a given dd.
-
-    Returns:
-        list[dict]: A list of step names listed as "step executed" the related CC.
-    """
-    stp = []
-    if "STEP WAS EXECUTED" in job_str:
-        steps = re.findall(
-            r"(.*?)\s-\sSTEP\sWAS\sEXECUTED\s-\s(.*?)\n", job_str)
-        for match in steps:
-            st = {
-                "step_name": match[0].split()[-1],
-                "step_cc": int(match[1].split()[-1]) if match[1].split()[-1] is not None else None,
-            }
-            stp.append(st)
-
-    return stp
-
-
-def _get_job_status(job_id="*", owner="*", job_name="*", dd_name=None, duration=0, timeout=0, start_time=timer()):
+def _get_job_status(job_id="*", owner="*", job_name="*", dd_name=None, duration=0, timeout=0, start_time=timer(),
+                    dd_scan=True, dd_content=True, max_workers=DEFAULT_READ_WORKERS, dd_limits=None,
+                    dd_search=None, dd_offsets=None):
     if job_id == "*":
         job_id_temp = None
     else:
@@ -194,16 +486,27 @@ def _get_job_status(job_id="*", owner="*", job_name="*", dd_name=None, duration=
 
     # jls output: owner=job[0], name=job[1], id=job[2], status=job[3], rc=job[4]
     # e.g.: OMVSADM  HELLO    JOB00126 JCLERR   ?
-    # listing(job_id, owner) in 1.2.0 has owner param, 1.1 does not
+    # listing(job_id, owner) in 1.2.0 has owner param, 1.1 does not. When
+    # supported, the owner and job name are filtered by ZOAU so that only the
+    # matching entries are returned; the entries are still checked below since
+    # the filters given to ZOAU can be wider than the requested pattern.
 
-    final_entries = []
-    entries = listing(job_id=job_id_temp)
+    # A single DD name is treated as a list of one, None selects all the DDs
+    if dd_name is not None and not isinstance(dd_name, list):
+        dd_name = [dd_name]
 
-    while ((entries is None or len(entries) == 0) and duration <= timeout):
-        current_time = timer()
-        duration = round(current_time - start_time)
-        sleep(1)
-        entries = listing(job_id=job_id_temp)
+    final_entries = []
+    # (job, dd, job log parser, read_output arguments) for each DD whose content is needed
+    dd_reads = []
+    # (job, job log parser) for each job whose DD content is parsed
+    job_logs = []
+    listing_kwargs = _listing_filters(owner, job_name)
+    listing_kwargs["job_id"] = job_id_temp
+
+    poller = JobPoller(timeout=timeout, start_time=start_time)
+    entries = poller.poll(lambda: _listing(**listing_kwargs))
+    if poller.polls > 1:
+        duration = poller.duration
 
     if entries:
         for entry in entries:
@@ -237,27 +540,42 @@ def _get_job_status(job_id="*", owner="*", job_name="*", dd_name=None, duration=
             job["class"] = ""
             job["content_type"] = ""
             job["ret_code"]["steps"] = []
+            job["ret_code"]["abends"] = []
+            job["ret_code"]["jcl_errors"] = []
             job["ddnames"] = []
-
-            list_of_dds = list_dds(entry.id)
-            while ((list_of_dds is None or len(list_of_dds) == 0) and duration <= timeout):
-                current_time = timer()
-                duration = round(current_time - start_time)
-                sleep(1)
-                list_of_dds = list_dds(entry.id)
+            if dd_search is not None:
+                job["matches"] = []
+            if dd_offsets is not None:
+                job["offsets"] = {}
+
+            # The DD contents are only read when returned, or to find why a job
+            # that reports '?' did not run, so that every path returns the same msg
+            read_content = dd_scan and dd_content
+            read_msg = job["ret_code"]["msg_code"] == "?"
+            job_log = JobLogParser()
+            if read_content or read_msg:
+                job_logs.append((job, job_log))
+
+            poller = JobPoller(timeout=timeout, start_time=start_time)
+            list_of_dds = poller.poll(lambda: list_dds(entry.id))
+            if poller.polls > 1:
+                duration = poller.duration
+            if list_of_dds is None:
+                list_of_dds = []
 
             for single_dd in list_of_dds:
                 dd = {}
 
-                # If dd_name not None, only that specific dd_name should be returned
+                if "dataset" not in single_dd:
+                    continue
+
+                # If dd_name not None, only those specific DDs are returned and
+                # read, the filter is applied before any spool content is read
                 if dd_name is not None:
-                    if dd_name not in single_dd["dataset"]:
+                    if not any(name in single_dd["dataset"] for name in dd_name):
                         continue
-                    else:
-                        dd["ddname"] = single_dd["dataset"]
 
-                if "dataset" not in single_dd:
-                    continue
+                dd["ddname"] = single_dd["dataset"]
 
                 if "recnum" in single_dd:
                     dd["record_count"] = single_dd["recnum"]
@@ -284,53 +602,406 @@ def _get_job_status(job_id="*", owner="*", job_name="*", dd_name=None, duration=
                 else:
                     dd["byte_count"] = 0
 
-                tmpcont = None
+                # Status only, the DDs are listed to drop the jobs without any
+                if dd_scan:
+                    job["ddnames"].append(dd)
+
+                # Metadata only, the DD listing already provided the counts
+                if not read_content:
+                    if read_msg and "stepname" in single_dd:
+                        dd_reads.append((job, None, job_log, (entry.id, single_dd["stepname"],
+                                                              single_dd["dataset"], None)))
+                    continue
+
+                # Defer the read so all the DDs can be fetched concurrently
                 if "stepname" in single_dd:
-                    if "dataset" in single_dd:
-                        tmpcont = read_output(
-                            entry.id, single_dd["stepname"], single_dd["dataset"])
-
-                dd["content"] = tmpcont.split("\n")
-                job["ret_code"]["steps"].extend(_parse_steps(tmpcont))
-
-                job["ddnames"].append(dd)
-                if len(job["class"]) < 1:
-                    if "- CLASS " in tmpcont:
-                        tmptext = tmpcont.split("- CLASS ")[1]
-                        job["class"] = tmptext.split(" ")[0]
-
-                if len(job["system"]) < 1:
-                    if "--  S Y S T E M  " in tmpcont:
-                        tmptext = tmpcont.split("--  S Y S T E M  ")[1]
-                        job["system"] = (tmptext.split(
-                            "--", 1)[0]).replace(" ", "")
-
-                if len(job["subsystem"]) < 1:
-                    if "--  N O D E " in tmpcont:
-                        tmptext = tmpcont.split("--  N O D E ")[1]
-                        job["subsystem"] = (tmptext.split("\n")[
-                                            0]).replace(" ", "")
-
-                # Extract similar: "19.49.44 JOB06848 IEFC452I DOCEASYT - JOB NOT RUN - JCL ERROR 029 "
-                # then further reduce down to: 'JCL ERROR 029'
-                if job["ret_code"]["msg_code"] == "?":
-                    if "JOB NOT RUN -" in tmpcont:
-                        tmptext = tmpcont.split(
-                            "JOB NOT RUN -")[1].split("\n")[0]
-                        job["ret_code"]["msg"] = tmptext.strip()
-                        job["ret_code"]["msg_code"] = None
-                        job["ret_code"]["code"] = None
+                    offset = None
+                    if dd_offsets is not None:
+                        offset = dd_offsets.get(dd["id"], 0)
+                        dd["offset"] = offset
+                        dd["next_offset"] = offset
+                        job["offsets"][dd["id"]] = offset
+
+                        # Nothing was written to the DD since the offset, skip the read
+                        if str(dd["record_count"]).isdigit() and int(dd["record_count"]) <= offset:
+                            if dd_search is None:
+                                dd["content"] = []
+                            if dd_limits:
+                                dd["truncated"] = False
+                            continue
+
+                    dd_reads.append((job, dd, job_log, (entry.id, single_dd["stepname"], single_dd["dataset"], offset)))
+                else:
+                    if dd_search is None:
+                        dd["content"] = []
+                    if dd_limits:
+                        dd["truncated"] = False
+
             if len(list_of_dds) > 0:
                 # The duration should really only be returned for job submit but the code
                 # is used job_output as well, for now we can ignore this point unless
                 # we want to offer a wait_time_s for job output which might be reasonable.
                 job["duration"] = duration
                 final_entries.append(job)
+
+    # Fetch the DD contents concurrently, then parse them in the order they were listed
+    dd_contents = _read_dd_contents([dd_read[3] for dd_read in dd_reads], max_workers, dd_limits)
+
+    for (job, dd, job_log, read_args), (lines, truncated, next_offset) in zip(dd_reads, dd_contents):
+        # Read only for the msg of a job that did not run, the content is not returned
+        if dd is None:
+            if lines is not None:
+                job_log.parse(lines)
+            continue
+
+        if dd_limits:
+            dd["truncated"] = truncated
+
+        if next_offset is not None:
+            dd["next_offset"] = next_offset
+            job["offsets"][dd["id"]] = next_offset
+
+        if lines is None:
+            if dd_search is None:
+                dd["content"] = []
+            continue
+
+        dd["content"] = lines
+        job_log.parse(lines)
+
+        # Only the matching lines are returned, the whole content is still
+        # parsed above so that the ret_code remains accurate
+        if dd_search is not None:
+            del dd["content"]
+            job["matches"].extend(_search_lines(dd, lines, first_line=(read_args[3] or 0) + 1, **dd_search))
+
+    for job, job_log in job_logs:
+        if dd_scan and dd_content:
+            job["class"] = job_log.job_class
+            job["system"] = job_log.system
+            job["subsystem"] = job_log.subsystem
+            job["ret_code"]["steps"].extend(job_log.steps)
+            job["ret_code"]["abends"].extend(job_log.abends)
+            job["ret_code"]["jcl_errors"].extend(job_log.jcl_errors)
+
+        # Extract similar: "19.49.44 JOB06848 IEFC452I DOCEASYT - JOB NOT RUN - JCL ERROR 029 "
+        # then further reduce down to: 'JCL ERROR 029'
+        if job["ret_code"]["msg_code"] == "?" and job_log.not_run_msg is not None:
+            job["ret_code"]["msg"] = job_log.not_run_msg
+            job["ret_code"]["msg_code"] = None
+            job["ret_code"]["code"] = None
+
     if not final_entries:
         final_entries = _job_not_found(job_id, owner, job_name, "unavailable")
     return final_entries
 
 
+def _listing_filters(owner, job_name):
+    """Build the owner and job name filters to pass down to the ZOAU listing
+    call. A job name pattern is reduced to the prefix before its first
+    wildcard so the filter always selects a superset of the matching jobs.
+
+    Arguments:
+        owner {str} -- The owner of the job, '*' or empty for any owner.
+        job_name {str} -- The job name pattern, '*' or empty for any job name.
+
+    Returns:
+        dict -- The keyword arguments to add to the listing call, empty when
+                the installed ZOAU can not filter the listing.
+    """
+    filters = {}
+    if not _listing_filters_supported():
+        return filters
+
+    if owner and owner != "*":
+        filters["owner"] = owner
+
+    if job_name and job_name != "*":
+        prefix = re.split(r"[*?\[]", job_name, maxsplit=1)[0]
+        if prefix:
+            filters["job_name"] = prefix if prefix == job_name else prefix + "*"
+
+    return filters
+
+
+_LISTING_FILTERS_SUPPORTED = None
+
+
+def _listing_filters_supported():
+    """Whether the installed ZOAU jobs.listing accepts the owner and job_name
+    filters, the ZOAU version is only looked up once.
+
+    Returns:
+        bool -- True when the listing filters can be used.
+    """
+    global _LISTING_FILTERS_SUPPORTED
+    if _LISTING_FILTERS_SUPPORTED is None:
+        try:
+            _LISTING_FILTERS_SUPPORTED = zoau_version_checker.is_zoau_version_higher_than(
+                LISTING_FILTERS_ZOAU_VERSION)
+        except Exception:
+            _LISTING_FILTERS_SUPPORTED = False
+    return _LISTING_FILTERS_SUPPORTED
+
+
+def _listing(job_id=None, **filters):
+    """Call the ZOAU listing with the given filters, falling back to an
+    unfiltered listing when this ZOAU does not accept them.
+
+    Keyword Arguments:
+        job_id {str} -- The job ID to list, None for all the jobs. (default: {None})
+        filters {dict} -- The owner and job_name filters from _listing_filters.
+
+    Returns:
+        list[Job] -- The job entries returned by ZOAU.
+    """
+    global _LISTING_FILTERS_SUPPORTED
+    if filters and _LISTING_FILTERS_SUPPORTED:
+        try:
+            return listing(job_id=job_id, **filters)
+        except TypeError:
+            _LISTING_FILTERS_SUPPORTED = False
+    return listing(job_id=job_id)
+
+
+def _read_dd_contents(dd_reads, max_workers=DEFAULT_READ_WORKERS, dd_limits=None):
+    """Read the content of many DDs using a bounded pool of threads. Each read
+    is a separate ZOAU call that mostly waits on JES, so running them
+    concurrently reduces the time spent reading large job logs.
+
+    Arguments:
+        dd_reads {list[tuple]} -- The (job_id, stepname, dataset, offset) arguments
+                                  of each DD read.
+        max_workers {int} -- The maximum number of concurrent reads, 1 or less
+                             reads the DDs serially.
+        dd_limits {dict} -- The max_lines, tail_lines and max_bytes limits
+                            applied to each DD. (default: {None})
+
+    Returns:
+        list[tuple(list[str], bool, int)] -- The lines of each DD, None when there
+            is no content, whether they were truncated and the offset of the next
+            record, in the same order as dd_reads.
+    """
+    dd_limits = dd_limits or {}
+
+    def read(read_args):
+        return _read_dd(*read_args, **dd_limits)
+
+    if max_workers is None or max_workers <= 1 or len(dd_reads) <= 1:
+        return [read(read_args) for read_args in dd_reads]
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(dd_reads))) as executor:
+        return list(executor.map(read, dd_reads))
+
+
+def _read_dd(job_id, stepname, dataset, offset=None, max_lines=None, tail_lines=None, max_bytes=None):
+    """Read the content of a DD. Without limits or offset, the DD is read whole
+    with ZOAU, otherwise it is streamed from the ZOAU pjdd command so that the
+    content is cut while being read rather than after it is fully loaded.
+
+    Arguments:
+        job_id {str} -- The job ID.
+        stepname {str} -- The step name of the DD.
+        dataset {str} -- The DD name.
+
+    Keyword Arguments:
+        offset {int} -- The number of records to skip, when set the offset of the
+                        record following the ones read is returned. (default: {None})
+        max_lines {int} -- Keep at most the first max_lines lines. (default: {None})
+        tail_lines {int} -- Keep at most the last tail_lines lines. (default: {None})
+        max_bytes {int} -- Keep at most max_bytes bytes of lines. (default: {None})
+
+    Raises:
+        DDReadError: When pjdd fails to read the DD.
+
+    Returns:
+        tuple(list[str], bool, int) -- The DD lines, None when there is no content,
+            whether the lines were truncated and the offset of the next record to
+            read, None when no offset was given.
+    """
+    if offset is None and max_lines is None and tail_lines is None and max_bytes is None:
+        content = read_output(job_id, stepname, dataset)
+        return (None if content is None else content.split("\n")), False, None
+
+    with TemporaryFile() as stderr:
+        process = Popen(
+            ["pjdd", job_id, stepname, dataset],
+            stdout=PIPE, stderr=stderr, universal_newlines=True, errors="replace"
+        )
+        records_read = [0]
+        read_all = False
+
+        def records(stream):
+            # The records before the offset are still streamed by pjdd but never kept
+            for line in islice(stream, offset or 0, None):
+                records_read[0] += 1
+                yield line
+
+        try:
+            if tail_lines is not None:
+                lines, truncated = _tail_lines(records(process.stdout), tail_lines, max_bytes)
+                # Every record was read, the ones cut from the head are not returned again
+                next_offset = records_read[0]
+                read_all = True
+            else:
+                lines, truncated = _head_lines(records(process.stdout), max_lines, max_bytes)
+                # Reading stopped at a limit, the next call continues from the first record left out
+                next_offset = len(lines)
+                read_all = not truncated
+        finally:
+            # Stop pjdd early when the limits were reached before the end of the DD
+            if not read_all and process.poll() is None:
+                process.kill()
+            process.stdout.close()
+            process.wait()
+
+        # Only a pjdd that was not stopped early has a meaningful return code
+        if read_all and process.returncode != 0:
+            stderr.seek(0)
+            raise DDReadError(job_id, stepname, dataset, process.returncode,
+                              stderr.read().decode("utf-8", "replace").strip())
+
+    return lines, truncated, None if offset is None else offset + next_offset
+
+
+def _head_lines(stream, max_lines=None, max_bytes=None):
+    """Keep the first lines of a stream, reading stops as soon as a limit is reached.
+
+    Arguments:
+        stream {iterable[str]} -- The lines to read.
+
+    Keyword Arguments:
+        max_lines {int} -- The maximum number of lines to keep. (default: {None})
+        max_bytes {int} -- The maximum number of bytes to keep. (default: {None})
+
+    Returns:
+        tuple(list[str], bool) -- The lines kept and whether any were left out.
+    """
+    lines = []
+    size = 0
+    for line in stream:
+        line = line.rstrip("\n")
+        if max_lines is not None and len(lines) >= max_lines:
+            return lines, True
+        if max_bytes is not None:
+            size += len(line.encode("utf-8")) + 1
+            if size > max_bytes:
+                return lines, True
+        lines.append(line)
+    return lines, False
+
+
+def _tail_lines(stream, tail_lines, max_bytes=None):
+    """Keep the last lines of a stream, holding no more than the lines kept in memory.
+
+    Arguments:
+        stream {iterable[str]} -- The lines to read.
+        tail_lines {int} -- The maximum number of lines to keep.
+
+    Keyword Arguments:
+        max_bytes {int} -- The maximum number of bytes to keep. (default: {None})
+
+    Returns:
+        tuple(list[str], bool) -- The lines kept and whether any were left out.
+    """
+    lines = deque()
+    sizes = deque()
+    size = 0
+    truncated = False
+    for line in stream:
+        line = line.rstrip("\n")
+        lines.append(line)
+        if max_bytes is not None:
+            sizes.append(len(line.encode("utf-8")) + 1)
+            size += sizes[-1]
+        while len(lines) > tail_lines or (max_bytes is not None and size > max_bytes):
+            lines.popleft()
+            if max_bytes is not None:
+                size -= sizes.popleft()
+            truncated = True
+    return list(lines), truncated
+
+
+def _search_lines(dd, lines, patterns, context=0, first_line=1):
+    """Search the lines of a DD for the given patterns.
+
+    Arguments:
+        dd {dict} -- The DD the lines belong to.
+        lines {list[str]} -- The DD content.
+        patterns {list[Pattern]} -- The compiled patterns, a line matching any
+                                    of them is returned.
+
+    Keyword Arguments:
+        context {int} -- Number of lines returned before and after each match. (default: {0})
+        first_line {int} -- The line number of the first line. (default: {1})
+
+    Returns:
+        list[dict] -- The DD name, step name, line number (starting at first_line) and
+                      line of each match, along with the lines around it when
+                      context is greater than 0.
+    """
+    matches = []
+    for index, line in enumerate(lines):
+        if not any(pattern.search(line) for pattern in patterns):
+            continue
+        match = {
+            "ddname": dd.get("ddname"),
+            "stepname": dd.get("stepname"),
+            "line_number": index + first_line,
+            "line": line,
+        }
+        if context > 0:
+            match["before"] = lines[max(0, index - context):index]
+            match["after"] = lines[index + 1:index + 1 + context]
+        matches.append(match)
+    return matches
+
+
+def _search_pattern(contents, resolve_dependencies):
+    """Resolver for search pattern arguments, compiles the regular expression.
+
+    Arguments:
+        contents {str} -- The contents of the argument.
+        resolved_dependencies {dict} -- Contains all of the dependencies and their contents,
+        which have already been handled,
+        for use during current arguments handling operations.
+
+    Raises:
+        ValueError: When contents is not a valid regular expression
+
+    Returns:
+        Pattern -- The compiled regular expression.
+    """
+    try:
+        return re.compile(str(contents))
+    except re.error as err:
+        raise ValueError(
+            'Invalid search pattern "{0}": {1}'.format(contents, str(err))
+        )
+
+
+def _positive_int(contents, resolve_dependencies):
+    """Resolver for the DD limit arguments, which must be greater than 0 when set.
+
+    Arguments:
+        contents {int} -- The contents of the argument.
+        resolved_dependencies {dict} -- Contains all of the dependencies and their contents,
+        which have already been handled,
+        for use during current arguments handling operations.
+
+    Raises:
+        ValueError: When contents is not an integer greater than 0
+
+    Returns:
+        int -- The arguments contents after any necessary operations.
+    """
+    if isinstance(contents, bool) or not isinstance(contents, int) or contents < 1:
+        raise ValueError(
+            'Invalid argument "{0}", expected an integer greater than 0'.format(contents)
+        )
+    return contents
+
+
 def _ddname_pattern(contents, resolve_dependencies):
     """Resolver for ddname_pattern type arguments
 
@@ -357,3 +1028,11 @@ def _ddname_pattern(contents, resolve_dependencies):
             )
         )
     return str(contents)
+
+
+class DDReadError(Exception):
+    def __init__(self, job_id, stepname, dataset, rc, stderr=""):
+        self.msg = 'An error occurred while reading the DD "{0}" of step "{1}" of job {2}. RC={3}, {4}'.format(
+            dataset, stepname, job_id, rc, stderr
+        )
+        super().__init__(self.msg)
@@ -0,0 +1,168 @@
+# Copyright (c) IBM Corporation 2023
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import hashlib
+import json
+import os
+from tempfile import mkstemp
+
+# Size the cache directory is kept under once new entries are added
+DEFAULT_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+CACHE_FILE_SUFFIX = ".json"
+
+
+class JobOutputCache(object):
+    def __init__(self, directory, max_bytes=DEFAULT_CACHE_MAX_BYTES):
+        """A cache of the output of completed jobs, stored on the managed node
+        as one JSON file per job and request, named after the job ID.
+
+        The spool of a completed job no longer changes, so an entry is valid
+        for as long as the job is still listed with the same name and owner.
+        Entries are evicted least recently used first once the files in the
+        directory exceed max_bytes, a cache hit refreshes the file mtime.
+
+        Any error reading or writing the cache is treated as a cache miss, the
+        cache never fails the request.
+
+        Arguments:
+            directory {str} -- The USS directory holding the cache files, it is
+                               created when the first entry is added.
+
+        Keyword Arguments:
+            max_bytes {int} -- The maximum size of the cache files. (default: {DEFAULT_CACHE_MAX_BYTES})
+        """
+        self.directory = directory
+        self.max_bytes = max_bytes
+
+    @staticmethod
+    def key(**request):
+        """Build the key of a request from the arguments that change its result.
+
+        Returns:
+            str -- A short digest of the request arguments.
+        """
+        request = json.dumps(request, sort_keys=True, default=str)
+        return hashlib.sha256(request.encode("utf-8")).hexdigest()[:16]
+
+    def _path(self, job_id, key):
+        return os.path.join(self.directory, "{0}.{1}{2}".format(job_id, key, CACHE_FILE_SUFFIX))
+
+    def _files(self, job_id=None):
+        try:
+            names = os.listdir(self.directory)
+        except OSError:
+            return []
+        prefix = "" if job_id is None else job_id + "."
+        return [
+            os.path.join(self.directory, name) for name in names
+            if name.startswith(prefix) and name.endswith(CACHE_FILE_SUFFIX)
+        ]
+
+    def get(self, job_id, key, job_listing):
+        """Get the cached output of a job.
+
+        Arguments:
+            job_id {str} -- The job ID.
+            key {str} -- The request key built with key().
+            job_listing {Job} -- The current listing entry of the job, the entry
+                                 is discarded when the job name or owner differ.
+
+        Returns:
+            list[dict] -- The cached job output, None on a cache miss.
+        """
+        path = self._path(job_id, key)
+        try:
+            with open(path, "r") as cache_file:
+                cached = json.load(cache_file)
+        except (OSError, IOError, ValueError):
+            return None
+
+        if cached.get("job_name") != job_listing.name or cached.get("owner") != job_listing.owner:
+            # The job ID was reused by another job, the cached output is stale
+            self.invalidate(job_id)
+            return None
+
+        try:
+            os.utime(path, None)
+        except OSError:
+            pass
+        return cached.get("jobs")
+
+    def put(self, job_id, key, job_listing, jobs):
+        """Add the output of a completed job, then evict the least recently
+        used entries when the cache is larger than max_bytes.
+
+        Arguments:
+            job_id {str} -- The job ID.
+            key {str} -- The request key built with key().
+            job_listing {Job} -- The current listing entry of the job.
+            jobs {list[dict]} -- The job output to cache.
+        """
+        cached = dict(job_name=job_listing.name, owner=job_listing.owner,
+                      status=job_listing.status, jobs=jobs)
+        temp_path = None
+        try:
+            if not os.path.isdir(self.directory):
+                os.makedirs(self.directory, 0o700)
+            # Written to a temporary file first so that readers never see a partial entry
+            temp_fd, temp_path = mkstemp(dir=self.directory, suffix=".tmp")
+            with os.fdopen(temp_fd, "w") as cache_file:
+                json.dump(cached, cache_file)
+            os.rename(temp_path, self._path(job_id, key))
+            temp_path = None
+        except (OSError, IOError, TypeError, ValueError):
+            return
+        finally:
+            if temp_path is not None:
+                try:
+                    os.remove(temp_path)
+                except OSError:
+                    pass
+
+        self.evict()
+
+    def invalidate(self, job_id):
+        """Remove every cached entry of a job, such as once it was purged.
+
+        Arguments:
+            job_id {str} -- The job ID.
+        """
+        for path in self._files(job_id):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def evict(self):
+        """Remove the least recently used entries until the cache files are
+        no larger than max_bytes."""
+        files = []
+        for path in self._files():
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            files.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(size for mtime, size, path in files)
+        for mtime, size, path in sorted(files):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
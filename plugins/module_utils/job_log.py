@@ -0,0 +1,131 @@
+# Copyright (c) IBM Corporation 2023
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import re
+
+# e.g.: "1    J E S 2  J O B  L O G  --  S Y S T E M  S T L 1  --  N O D E  S T L 1"
+SYSTEM_PATTERN = re.compile(r"--  S Y S T E M  (.*?)(?:--|$)")
+NODE_PATTERN = re.compile(r"--  N O D E (.*)$")
+# e.g.: " 10.25.48 JOB00134  $HASP373 HELLO    STARTED - INIT 3    - CLASS R        - SYS STL1"
+CLASS_PATTERN = re.compile(r"- CLASS ([^ ]*)")
+# e.g.: " IEF142I HELLO STEP0001 - STEP WAS EXECUTED - COND CODE 0000"
+STEP_PATTERN = re.compile(r"(\S+)\s-\sSTEP\sWAS\sEXECUTED\s-\s.*?(\S+)\s*$")
+# e.g.: " IEF450I HELLO STEP0001 - ABEND=S0C4 U0000 REASON=00000004"
+ABEND_PATTERN = re.compile(
+    r"IEF450I\s+\S+\s+(\S+)(?:\s+(\S+))?\s+-\s+ABEND=(S[0-9A-F]{3})\s+(U\d{4})(?:\s+REASON=(\S+))?")
+# e.g.: "19.49.44 JOB06848 IEFC452I DOCEASYT - JOB NOT RUN - JCL ERROR 029 "
+JOB_NOT_RUN_PATTERN = re.compile(r"JOB NOT RUN -(.*)$")
+# e.g.: " IEFC605I UNIDENTIFIED OPERATION FIELD" or " IEF212I HELLO STEP0001 SYSUT1 - DATA SET NOT FOUND"
+JCL_ERROR_PATTERN = re.compile(r"\b(IEFC\d{3}I|IEF212I|IEF453I)\s+(.*?)\s*$")
+
+
+class JobLogParser(object):
+    def __init__(self):
+        """Parses the content of the job DDs in a single pass, line by line,
+        collecting the job log header fields (class, system and node), the
+        step condition codes, the ABEND codes and the JCL error messages.
+
+        Lines are first checked for a fixed string before any pattern is
+        applied and the header fields are no longer searched for once they
+        have all been found.
+        """
+        self.job_class = ""
+        self.system = ""
+        self.subsystem = ""
+        self.steps = []
+        self.abends = []
+        self.jcl_errors = []
+        self.not_run_msg = None
+
+    @property
+    def header_found(self):
+        """Whether the class, system and node were all found."""
+        return bool(self.job_class and self.system and self.subsystem)
+
+    def parse(self, lines):
+        """Parse the lines of a single DD, the results are added to the ones
+        from the DDs already parsed.
+
+        Arguments:
+            lines {iterable[str]} -- The DD content, one record per item.
+
+        Returns:
+            JobLogParser -- This parser, to allow chaining.
+        """
+        search_header = not self.header_found
+
+        for line in lines:
+            if search_header:
+                if not self.system and "S Y S T E M" in line:
+                    match = SYSTEM_PATTERN.search(line)
+                    if match:
+                        self.system = match.group(1).replace(" ", "")
+
+                if not self.subsystem and "N O D E" in line:
+                    match = NODE_PATTERN.search(line)
+                    if match:
+                        self.subsystem = match.group(1).replace(" ", "")
+
+                if not self.job_class and "- CLASS " in line:
+                    match = CLASS_PATTERN.search(line)
+                    if match:
+                        self.job_class = match.group(1)
+
+                search_header = not self.header_found
+
+            if "STEP WAS EXECUTED" in line:
+                match = STEP_PATTERN.search(line)
+                if match and match.group(2).isdigit():
+                    self.steps.append({
+                        "step_name": match.group(1),
+                        "step_cc": int(match.group(2)),
+                    })
+            elif "ABEND=" in line:
+                match = ABEND_PATTERN.search(line)
+                if match:
+                    self.abends.append({
+                        "step_name": match.group(1),
+                        "procstep": match.group(2),
+                        "system_code": match.group(3),
+                        "user_code": match.group(4),
+                        "reason": match.group(5),
+                    })
+            elif "IEF" in line:
+                if self.not_run_msg is None and "JOB NOT RUN -" in line:
+                    self.not_run_msg = JOB_NOT_RUN_PATTERN.search(line).group(1).strip()
+
+                match = JCL_ERROR_PATTERN.search(line)
+                if match:
+                    self.jcl_errors.append({
+                        "msg_id": match.group(1),
+                        "msg_txt": match.group(2),
+                    })
+
+        return self
+
+
+def parse_job_log(content):
+    """Parse the content of a single DD.
+
+    Arguments:
+        content {Union[str, iterable[str]]} -- The DD content, either as a
+            single string or one record per item.
+
+    Returns:
+        JobLogParser -- The parser holding the parsed fields.
+    """
+    if isinstance(content, str):
+        content = content.split("\n")
+    return JobLogParser().parse(content)
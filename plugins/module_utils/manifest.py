@@ -0,0 +1,234 @@
+# Copyright (c) IBM Corporation 2023
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import hashlib
+import json
+import os
+from tempfile import mkstemp
+
+# Directory on the managed node holding the sync state of each destination
+SYNC_STATE_DIR = "~/.ansible/zos_copy_sync"
+
+CHECKSUM_BLOCK_SIZE = 1024 * 1024
+
+
+def file_checksum(path):
+    """Calculate the SHA256 hash of a file.
+
+    Arguments:
+        path {str} -- The path of the file.
+
+    Returns:
+        str -- The SHA256 hash of the file content.
+    """
+    hash_digest = hashlib.sha256()
+    with open(path, "rb") as infile:
+        block = infile.read(CHECKSUM_BLOCK_SIZE)
+        while block:
+            hash_digest.update(block)
+            block = infile.read(CHECKSUM_BLOCK_SIZE)
+    return hash_digest.hexdigest()
+
+
+def _walk(root):
+    """Yield the relative path and stat of every directory and file under root,
+    in a stable order. Anything that is not a directory or a file is skipped."""
+    for dirpath, dirs, files in os.walk(root):
+        dirs.sort()
+        for name in dirs + sorted(files):
+            path = os.path.join(dirpath, name)
+            try:
+                path_stat = os.stat(path)
+            except OSError:
+                continue
+            yield os.path.relpath(path, root), path, path_stat
+
+
+def build_manifest(root):
+    """Build the manifest of a directory tree, with the size, modification
+    time and checksum of each file.
+
+    Arguments:
+        root {str} -- The directory.
+
+    Returns:
+        dict -- The 'files' by relative path, each a dict with its 'size',
+                'mtime' and 'checksum', and the list of 'directories'.
+    """
+    manifest = dict(files={}, directories=[])
+    for rel_path, path, path_stat in _walk(root):
+        if os.path.isdir(path):
+            manifest["directories"].append(rel_path)
+        elif os.path.isfile(path):
+            manifest["files"][rel_path] = dict(
+                size=path_stat.st_size,
+                mtime=path_stat.st_mtime,
+                checksum=file_checksum(path),
+            )
+    return manifest
+
+
+def dest_manifest(root, state, hash_files=False):
+    """Build the manifest of a destination directory tree, the checksum of
+    each file is the checksum of the source file it was copied from.
+
+    The checksums come from the sync state recorded by the last sync, an
+    entry is only used while the file keeps the size and modification time
+    it had then. Files without a valid entry are hashed when hash_files is
+    set, which is only correct when the files are copied without encoding
+    conversion, otherwise their checksum is None and they are copied again.
+
+    Arguments:
+        root {str} -- The destination directory.
+        state {dict} -- The sync state of the destination, from load_sync_state.
+
+    Keyword Arguments:
+        hash_files {bool} -- Whether to hash the files without a valid state entry. (default: {False})
+
+    Returns:
+        dict -- The 'files' by relative path, each mapped to its checksum or
+                None, and the list of 'directories'.
+    """
+    manifest = dict(files={}, directories=[])
+    if not os.path.isdir(root):
+        return manifest
+
+    for rel_path, path, path_stat in _walk(root):
+        if os.path.isdir(path):
+            manifest["directories"].append(rel_path)
+        elif os.path.isfile(path):
+            entry = state.get(rel_path) or {}
+            checksum = None
+            if entry.get("size") == path_stat.st_size and entry.get("mtime") == path_stat.st_mtime:
+                checksum = entry.get("checksum")
+            elif hash_files:
+                checksum = file_checksum(path)
+            manifest["files"][rel_path] = checksum
+    return manifest
+
+
+def diff_manifests(src, dest):
+    """Compare a source manifest with a destination manifest.
+
+    Arguments:
+        src {dict} -- The source manifest, from build_manifest.
+        dest {dict} -- The destination manifest, from dest_manifest.
+
+    Returns:
+        tuple(list[str], list[str]) -- The files of the source that are new or
+            differ in the destination, and the files and directories of the
+            destination that are not in the source, deepest paths first so
+            they can be removed in order.
+    """
+    dest_files = dest.get("files") or {}
+    src_files = src.get("files") or {}
+    changed = [
+        rel_path for rel_path, entry in sorted(src_files.items())
+        if dest_files.get(rel_path) != entry.get("checksum")
+    ]
+
+    src_directories = set(src.get("directories") or [])
+    extraneous = [rel_path for rel_path in dest_files if rel_path not in src_files]
+    extraneous.extend(
+        rel_path for rel_path in dest.get("directories") or []
+        if rel_path not in src_directories
+    )
+    extraneous.sort(key=lambda rel_path: (-rel_path.count(os.sep), rel_path))
+    return changed, extraneous
+
+
+def sync_conversion(encoding=None, is_binary=False):
+    """The conversion settings a sync copies the files with, the sync state
+    recorded with other settings does not describe the destination files.
+
+    Keyword Arguments:
+        encoding {dict} -- The 'from' and 'to' encodings, None when the
+                           files are not converted. (default: {None})
+        is_binary {bool} -- Whether the files are copied as binary. (default: {False})
+
+    Returns:
+        dict -- The 'from' and 'to' encodings and 'is_binary'.
+    """
+    encoding = encoding or {}
+    return {"from": encoding.get("from"), "to": encoding.get("to"), "is_binary": bool(is_binary)}
+
+
+def _sync_state_path(state_dir, dest):
+    key = hashlib.sha256(os.path.realpath(dest).encode("utf-8")).hexdigest()[:16]
+    return os.path.join(os.path.expanduser(state_dir), "{0}.json".format(key))
+
+
+def load_sync_state(dest, conversion=None, state_dir=SYNC_STATE_DIR):
+    """Load the sync state recorded for a destination directory.
+
+    Arguments:
+        dest {str} -- The destination directory.
+
+    Keyword Arguments:
+        conversion {dict} -- The conversion settings of this sync, from
+                             sync_conversion. (default: {None})
+        state_dir {str} -- The directory holding the sync states. (default: {SYNC_STATE_DIR})
+
+    Returns:
+        dict -- The 'size', 'mtime' and source 'checksum' of each file by
+                relative path, empty when no valid state was recorded or it
+                was recorded with other conversion settings.
+    """
+    try:
+        with open(_sync_state_path(state_dir, dest), "r") as state_file:
+            state = json.load(state_file)
+    except (OSError, IOError, ValueError):
+        return {}
+    if state.get("dest") != os.path.realpath(dest):
+        return {}
+    if state.get("conversion") != (conversion or sync_conversion()):
+        return {}
+    return state.get("files") or {}
+
+
+def save_sync_state(dest, files, conversion=None, state_dir=SYNC_STATE_DIR):
+    """Record the sync state of a destination directory, failing to record
+    it only means the next sync copies the files again.
+
+    Arguments:
+        dest {str} -- The destination directory.
+        files {dict} -- The 'size', 'mtime' and source 'checksum' of each file
+                        by relative path.
+
+    Keyword Arguments:
+        conversion {dict} -- The conversion settings the files were copied
+                             with, from sync_conversion. (default: {None})
+        state_dir {str} -- The directory holding the sync states. (default: {SYNC_STATE_DIR})
+    """
+    path = _sync_state_path(state_dir, dest)
+    temp_path = None
+    try:
+        if not os.path.isdir(os.path.dirname(path)):
+            os.makedirs(os.path.dirname(path), 0o700)
+        temp_fd, temp_path = mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        with os.fdopen(temp_fd, "w") as state_file:
+            json.dump(dict(
+                dest=os.path.realpath(dest), conversion=conversion or sync_conversion(), files=files
+            ), state_file)
+        os.rename(temp_path, path)
+        temp_path = None
+    except (OSError, IOError, TypeError, ValueError):
+        pass
+    finally:
+        if temp_path is not None:
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
@@ -30,6 +30,26 @@ author:
   - "Demetrios Dimatos (@ddimatos)"
   - "Ivan Moreno (@rexemin)"
 options:
+  archive_transfer:
+    description:
+      - How a local source directory is transferred to the managed node.
+      - C(none) transfers each file of the directory with SFTP, which takes
+        one SFTP round trip per file.
+      - C(tar) builds a tar archive of the directory on the controller,
+        transfers it as a single file and unpacks it on the managed node
+        before the copy, which is faster for directories with many small
+        files.
+      - C(gz) is the same as C(tar) with the archive compressed with gzip,
+        which also reduces the amount of data transferred.
+      - Only used when I(src) is a local directory, ignored otherwise.
+    type: str
+    required: false
+    default: none
+    choices:
+      - none
+      - tar
+      - gz
+    version_added: "1.5.0"
   backup:
     description:
       - Specifies whether a backup of the destination should be created before
@@ -59,6 +79,114 @@ options:
         generated member name.
     required: false
     type: str
+  batch:
+    description:
+      - A list of copies to run in a single task, each item is a dictionary
+        with the C(src) or C(content) and the C(dest) of one copy.
+      - An item can also set C(is_binary), C(encoding), C(force), C(backup),
+        C(backup_name), C(remote_src), C(local_follow), C(validate),
+        C(volume), C(dest_data_set), C(mode), C(owner), C(group) and
+        C(skip_identical), the options of the task are used for the ones it
+        does not set.
+      - The local sources of all the items are transferred to the managed
+        node in a single archive and the items run in a single module run.
+        Items whose destinations and sources do not overlap run in parallel,
+        the others run in the order of the list.
+      - A failed item does not stop the others, the task fails when any item
+        failed and the result of each item is returned in C(batch_results).
+      - Mutually exclusive with C(src), C(content), C(dest) and C(sync).
+    type: list
+    elements: dict
+    required: false
+    version_added: "1.5.0"
+    suboptions:
+      src:
+        description:
+          - The source of the copy, as in the I(src) option.
+        type: str
+        required: false
+      content:
+        description:
+          - The content to copy, as in the I(content) option.
+        type: str
+        required: false
+      dest:
+        description:
+          - The destination of the copy, as in the I(dest) option.
+        type: str
+        required: true
+      is_binary:
+        description:
+          - Overrides the I(is_binary) option for this item.
+        type: bool
+        required: false
+      encoding:
+        description:
+          - Overrides the I(encoding) option for this item, with the same
+            C(from) and C(to) keys.
+        type: dict
+        required: false
+      force:
+        description:
+          - Overrides the I(force) option for this item.
+        type: bool
+        required: false
+      backup:
+        description:
+          - Overrides the I(backup) option for this item.
+        type: bool
+        required: false
+      backup_name:
+        description:
+          - Overrides the I(backup_name) option for this item.
+        type: str
+        required: false
+      remote_src:
+        description:
+          - Overrides the I(remote_src) option for this item.
+        type: bool
+        required: false
+      local_follow:
+        description:
+          - Overrides the I(local_follow) option for this item.
+        type: bool
+        required: false
+      validate:
+        description:
+          - Overrides the I(validate) option for this item.
+        type: bool
+        required: false
+      volume:
+        description:
+          - Overrides the I(volume) option for this item.
+        type: str
+        required: false
+      dest_data_set:
+        description:
+          - Overrides the I(dest_data_set) option for this item, with the
+            same keys.
+        type: dict
+        required: false
+      mode:
+        description:
+          - Overrides the I(mode) option for this item.
+        type: str
+        required: false
+      owner:
+        description:
+          - Overrides the I(owner) option for this item.
+        type: str
+        required: false
+      group:
+        description:
+          - Overrides the I(group) option for this item.
+        type: str
+        required: false
+      skip_identical:
+        description:
+          - Overrides the I(skip_identical) option for this item.
+        type: bool
+        required: false
   content:
     description:
       - When used instead of C(src), sets the contents of a file or data set
@@ -67,6 +195,8 @@ options:
         partitioned data set member.
       - If C(dest) is a directory, then content will be copied to
         C(/path/to/dest/inline_copy).
+      - Content of up to 256 KB is sent to the managed node with the module
+        arguments, larger content is transferred with SFTP.
     type: str
     required: false
   dest:
@@ -102,8 +232,9 @@ options:
         by specifying C(volume) if the storage class being used has
         GUARANTEED_SPACE=YES specified, otherwise, the allocation will
         fail. See C(volume) for more volume related processes.
+      - Required unless C(batch) is used.
     type: str
-    required: true
+    required: false
   encoding:
     description:
       - Specifies which encodings the destination file or data set should be
@@ -213,6 +344,8 @@ options:
       - If C(src) is a local path or a USS path, it can be absolute or relative.
       - If C(src) is a directory, C(dest) must be a partitioned data set or
         a USS directory.
+      - When copying a directory into a PDSE created by the module or with
+        C(dest_data_set.type=PDSE), the members are copied concurrently.
       - If C(src) is a file and C(dest) ends with "/" or is a
         directory, the file is copied to the directory with the same filename as
         C(src).
@@ -224,6 +357,50 @@ options:
         PDS/PDSE.
       - Required unless using C(content).
     type: str
+  skip_identical:
+    description:
+      - Compare the content of the source with the content of an existing
+        sequential data set or data set member before copying, and leave the
+        destination unchanged when they are the same.
+      - The source is converted to the encoding of the destination and
+        compared record by record, the blanks padding records of a fixed
+        record length are ignored.
+      - When the content is the same, no backup is taken, I(force) is not
+        needed and C(changed) is false.
+      - Only used for text copies of a file, sequential data set or member
+        into an existing sequential data set or member, otherwise ignored.
+    type: bool
+    required: false
+    default: false
+    version_added: "1.5.0"
+  sync:
+    description:
+      - Sync a source directory into a USS destination directory, only the
+        files that are new or changed since the last sync are copied.
+      - When the source is a local directory, the managed node returns the
+        manifest of the destination directory first and only the new or
+        changed files are transferred. When nothing changed, no file is
+        transferred and C(changed) is false.
+      - The source checksum of each synced file is recorded on the managed
+        node in C(~/.ansible/zos_copy_sync), a destination file is copied
+        again when its size or modification time changed since then. When
+        no encoding conversion is done, destination files copied without
+        this module are compared by checksum.
+      - I(force) is not needed to replace the changed files of an existing
+        destination directory.
+      - Only used when I(src) is a directory and I(dest) is a USS path.
+    type: bool
+    required: false
+    default: false
+    version_added: "1.5.0"
+  sync_delete:
+    description:
+      - When I(sync=true), remove the files and directories of the
+        destination directory that are not in the source directory.
+    type: bool
+    required: false
+    default: false
+    version_added: "1.5.0"
   validate:
     description:
       - Specifies whether to perform checksum validation for source and
@@ -405,11 +582,46 @@ EXAMPLES = r"""
     src: /path/to/file.txt
     dest: /tmp/file.txt
 
+- name: Copy a local file to a sequential data set only when its content changed
+  zos_copy:
+    src: /path/to/sample_seq_data_set
+    dest: SAMPLE.SEQ.DATA.SET
+    skip_identical: true
+    force: true
+
+- name: Copy the files and members of an application in a single task
+  zos_copy:
+    batch:
+      - src: /path/to/app/conf/app.properties
+        dest: /u/app/conf/app.properties
+      - src: /path/to/app/jcl/
+        dest: APP.JCL
+      - src: APP.LOADLIB
+        dest: APP.PROD.LOADLIB
+        remote_src: true
+        is_binary: true
+      - content: "APPLID=APP1"
+        dest: APP.PARMLIB(APPCFG)
+    force: true
+
 - name: Copy a local directory to a PDSE
   zos_copy:
     src: /path/to/local/dir/
     dest: HLQ.DEST.PDSE
 
+- name: Copy a local directory with many files to a PDSE as a single compressed archive
+  zos_copy:
+    src: /path/to/local/copybooks
+    dest: HLQ.DATA.PDSE
+    archive_transfer: gz
+
+- name: Sync a local directory to a USS directory, transferring only the changed files
+  zos_copy:
+    src: /path/to/local/app/
+    dest: /u/app/bin
+    sync: true
+    sync_delete: true
+
 - name: Copy file with permission details
   zos_copy:
     src: /path/to/foo.conf
@@ -608,6 +820,33 @@ state:
     returned: success and if dest is USS
     type: str
     sample: file
+sync:
+    description: The files synced into the destination directory.
+    returned: success and I(sync=true)
+    type: dict
+    contains:
+        copied:
+            description: The paths, relative to the destination directory,
+              of the files that were new or changed and got copied.
+            type: list
+            elements: str
+            sample: ["bin/app.sh", "conf/app.conf"]
+        deleted:
+            description: The paths, relative to the destination directory,
+              of the files and directories removed because of I(sync_delete).
+            type: list
+            elements: str
+            sample: ["conf/old.conf"]
+failed_copy_attempts:
+    description:
+      - Number of member copies that failed because the members are program
+        objects and were repeated with the C(-X) option of the copy.
+      - A library with an undefined record format is known to hold program
+        objects before the copy, otherwise the first member that fails this
+        way makes the rest of the members be copied as program objects.
+    returned: success and dest is a PDS/PDSE
+    type: int
+    sample: 0
 note:
     description: A note to the user after module terminates.
     returned: C(force) is C(false) and dest exists
@@ -648,6 +887,49 @@ cmd:
     returned: failure
     type: str
     sample: REPRO INDATASET(SAMPLE.DATA.SET) OUTDATASET(SAMPLE.DEST.DATA.SET)
+batch_results:
+    description:
+      - The result of each item of C(batch), in the order of the list.
+      - Each result has the keys returned by a copy of a single source, like
+        C(src), C(dest), C(changed) and C(checksum), or C(failed) and C(msg)
+        when the item failed.
+    returned: C(batch) is used
+    type: list
+    elements: dict
+    sample:
+      - src: /path/to/app/conf/app.properties
+        dest: /u/app/conf/app.properties
+        changed: true
+        is_binary: false
+      - dest: APP.PARMLIB(APPCFG)
+        changed: false
+        failed: true
+        msg: "APP.PARMLIB(APPCFG) already exists on the system, unable to overwrite unless force=True is specified."
+member_errors:
+    description:
+      - The members of a partitioned data set that could not be copied.
+      - All the members are attempted, the first failure does not stop the
+        copy of the others.
+    returned: failure copying into partitioned data set members
+    type: list
+    elements: dict
+    contains:
+        member:
+            description: Name of the destination member.
+            type: str
+            sample: MEMBER1
+        rc:
+            description: The return code of the copy of the member.
+            type: int
+            sample: 1
+        stdout:
+            description: The stdout of the copy of the member.
+            type: str
+            sample: ""
+        stderr:
+            description: The stderr of the copy of the member.
+            type: str
+            sample: "BGYSC1004E Unable to open data set"
 """
 
 
@@ -655,23 +937,26 @@ from ansible_collections.ibm.ibm_zos_core.plugins.module_utils.import_handler im
     MissingZOAUImport,
 )
 from ansible_collections.ibm.ibm_zos_core.plugins.module_utils.mvs_cmd import (
-    idcams
+    idcams, iebcopy
 )
 from ansible_collections.ibm.ibm_zos_core.plugins.module_utils import (
-    better_arg_parser, data_set, encode, backup, copy
-)
-from ansible_collections.ibm.ibm_zos_core.plugins.module_utils.ansible_module import (
-    AnsibleModuleHelper,
+    better_arg_parser, data_set, encode, backup, copy, manifest
 )
 from ansible.module_utils._text import to_bytes, to_native
 from ansible.module_utils.basic import AnsibleModule
 from ansible.module_utils.six import PY3
-from re import IGNORECASE
+from re import IGNORECASE, findall
 from hashlib import sha256
+from operator import methodcaller
+from concurrent.futures import ThreadPoolExecutor
+from subprocess import Popen, PIPE, DEVNULL
+import base64
 import glob
+import threading
 import shutil
 import stat
 import math
+import tarfile
 import tempfile
 import os
 
@@ -686,6 +971,25 @@ try:
 except Exception:
     datasets = MissingZOAUImport()
 
+# Maximum number of members copied concurrently into a PDSE
+DEFAULT_MEMBER_WORKERS = 8
+
+# Maximum number of items of a batch copied concurrently
+DEFAULT_BATCH_WORKERS = 4
+
+# Message IEBCOPY writes for each member it copied
+IEBCOPY_COPIED_MEMBER = r"IEB154I\s+(\S+)\s+HAS BEEN SUCCESSFULLY COPIED"
+
+# Options an item of a batch can set, the ones of the task are used for the
+# others. The action plugin also sets the options it computes for each item.
+BATCH_ITEM_OPTIONS = (
+    "src", "content", "dest", "is_binary", "encoding", "force", "backup",
+    "backup_name", "remote_src", "local_follow", "validate", "volume",
+    "dest_data_set", "mode", "skip_identical",
+    "is_uss", "is_pds", "is_src_dir", "is_mvs_dest", "size", "temp_path",
+    "copy_member", "src_member", "content_b64",
+)
+
 
 class CopyHandler(object):
     def __init__(
@@ -915,57 +1219,59 @@ class CopyHandler(object):
             result.update(arg)
         return result
 
-    def file_has_crlf_endings(self, src):
-        """Reads src as a binary file and checks whether it uses CRLF or LF
-        line endings.
-
-        Arguments:
-            src {str} -- Path to a USS file
-
-        Returns:
-            {bool} -- True if the file uses CRLF endings, False if it uses LF
-                      ones.
-        """
-        with open(src, "rb") as src_file:
-            # readline() will read until it finds a \n.
-            content = src_file.readline()
+    def create_temp_with_lf_endings(self, src, from_code=None, to_code=None):
+        """Creates a temporary file with the same content as src but with the
+        carriage returns before each newline removed. The file is streamed in
+        blocks, so memory use does not grow with its size.
 
-        # In EBCDIC, \r\n are bytes 0d and 15, respectively.
-        if content.endswith(b'\x0d\x15'):
-            return True
-        else:
-            return False
-
-    def create_temp_with_lf_endings(self, src):
-        """Creates a temporary file with the same content as src but without
-        carriage returns.
+        When both code sets are given, the file is converted to to_code in
+        the same pass, by streaming the output of iconv.
 
         Arguments:
             src {str} -- Path to a USS source file.
 
+        Keyword Arguments:
+            from_code {str} -- Code set of the source file. (default: {None})
+            to_code {str} -- Code set to convert the source file to. (default: {None})
+
         Raises:
             CopyOperationError: If the conversion fails.
 
         Returns:
             {str} -- Path to the temporary file created.
         """
+        process = converted_src = None
         try:
             fd, converted_src = tempfile.mkstemp()
             os.close(fd)
 
             with open(converted_src, "wb") as converted_file:
-                with open(src, "rb") as src_file:
-                    current_line = src_file.read()
-                    converted_file.write(current_line.replace(b'\x0d', b''))
+                if from_code and to_code:
+                    process = Popen(["iconv", "-f", from_code, "-t", to_code, src], stdout=PIPE, stderr=PIPE)
+                    normalize_line_endings(process.stdout, converted_file)
+                    stderr = process.communicate()[1]
+                    if process.returncode != 0:
+                        raise EncodingConversionError(src, from_code, to_code)
+                else:
+                    with open(src, "rb") as src_file:
+                        normalize_line_endings(src_file, converted_file)
 
             self._tag_file_encoding(converted_src, encode.Defaults.DEFAULT_EBCDIC_MVS_CHARSET)
 
             return converted_src
         except Exception as err:
+            if converted_src and os.path.exists(converted_src):
+                os.remove(converted_src)
+            if isinstance(err, EncodingConversionError):
+                raise CopyOperationError(msg=err.msg, stderr=to_native(stderr))
             raise CopyOperationError(
                 msg="Error while trying to convert EOL sequence for source.",
                 stderr=to_native(err)
             )
+        finally:
+            if process is not None and process.poll() is None:
+                process.kill()
+                process.wait()
 
 
 class USSCopyHandler(CopyHandler):
@@ -1089,10 +1395,7 @@ class USSCopyHandler(CopyHandler):
 
         new_src = temp_path or conv_path or src
         try:
-            if self.is_binary:
-                copy.copy_uss2uss_binary(new_src, dest)
-            else:
-                shutil.copy(new_src, dest)
+            copy.copy_file(new_src, dest)
         except OSError as err:
             raise CopyOperationError(
                 msg="Destination {0} is not writable".format(dest),
@@ -1149,7 +1452,7 @@ class USSCopyHandler(CopyHandler):
         try:
             if copy_directory:
                 dest = os.path.join(dest_dir, os.path.basename(os.path.normpath(src_dir)))
-            dest = shutil.copytree(new_src_dir, dest, dirs_exist_ok=force)
+            dest = copy.copy_tree(new_src_dir, dest, dirs_exist_ok=force)
 
             # Restoring permissions for preexisting files and subdirectories.
             for filepath, permissions in original_permissions:
@@ -1162,6 +1465,118 @@ class USSCopyHandler(CopyHandler):
             )
         return dest, changed_files
 
+    def sync_to_uss(
+        self,
+        src,
+        dest,
+        conv_path,
+        temp_path,
+        src_manifest=None,
+        hash_files=False,
+        delete=False,
+        encoding=None
+    ):
+        """Sync a USS directory into another USS directory, only the files
+        that are new or changed since the last sync are copied. If the path
+        for src does not end with a trailing slash ("/"), the src directory
+        itself is synced into dest.
+
+        Arguments:
+            src {str} -- USS source directory
+            dest {str} -- USS dest directory
+            conv_path {str} -- Path to the converted source directory
+            temp_path {str} -- Path to the location where the control node
+                               transferred data to, only the changed files
+                               are expected under it
+
+        Keyword Arguments:
+            src_manifest {dict} -- The manifest of the whole source directory,
+                                   built from src when None (default: {None})
+            hash_files {bool} -- Whether the destination files without a sync
+                                 state can be hashed to compare them with the
+                                 source, only when there is no encoding
+                                 conversion (default: {False})
+            delete {bool} -- Whether to remove the files and directories of
+                             dest that are not in src (default: {False})
+            encoding {dict} -- The encodings the files are converted from and
+                               to, the sync state is only used when the
+                               files were copied with the same conversion (default: {None})
+
+        Raises:
+            CopyOperationError -- When syncing into the directory fails.
+
+        Returns:
+            {tuple} -- Destination directory, the relative paths of the files
+                       copied and of the files and directories removed.
+        """
+        src_dir = os.path.normpath(src)
+        if not src.endswith("/"):
+            dest = os.path.join(dest, os.path.basename(src_dir))
+        if temp_path:
+            temp_path = "{0}/{1}".format(temp_path, os.path.basename(src_dir))
+        new_src_dir = os.path.normpath(temp_path or conv_path or src_dir)
+
+        if src_manifest is None:
+            src_manifest = manifest.build_manifest(src_dir)
+        conversion = manifest.sync_conversion(encoding, self.is_binary)
+        dest_manifest = manifest.dest_manifest(
+            dest, manifest.load_sync_state(dest, conversion=conversion), hash_files=hash_files
+        )
+        changed_files, extraneous = manifest.diff_manifests(src_manifest, dest_manifest)
+
+        deleted = []
+        try:
+            for dir_path in [""] + src_manifest.get("directories"):
+                dir_path = os.path.join(dest, dir_path)
+                if not os.path.isdir(dir_path):
+                    os.makedirs(dir_path)
+
+            copy.copy_files(
+                [(os.path.join(new_src_dir, file_path), os.path.join(dest, file_path)) for file_path in changed_files],
+                preserve_times=True
+            )
+
+            if delete:
+                for file_path in extraneous:
+                    path = os.path.join(dest, file_path)
+                    if os.path.isdir(path) and not os.path.islink(path):
+                        shutil.rmtree(path)
+                    elif os.path.lexists(path):
+                        os.remove(path)
+                    deleted.append(file_path)
+        except Exception as err:
+            raise CopyOperationError(
+                msg="Error while syncing data to destination directory {0}".format(dest),
+                stdout=str(err),
+            )
+
+        if self.common_file_args is not None:
+            mode = self.common_file_args.get("mode")
+            group = self.common_file_args.get("group")
+            owner = self.common_file_args.get("owner")
+            if mode is not None:
+                for file_path in changed_files:
+                    self.module.set_mode_if_different(os.path.join(dest, file_path), mode, False)
+            if group is not None:
+                self.module.set_group_if_different(dest, group, False)
+            if owner is not None:
+                self.module.set_owner_if_different(dest, owner, False)
+
+        # The destination files are recorded with the checksum of their source
+        # so that the next sync can compare them without reading them
+        sync_state = {}
+        for file_path, entry in src_manifest.get("files").items():
+            try:
+                file_stat = os.stat(os.path.join(dest, file_path))
+            except OSError:
+                continue
+            sync_state[file_path] = dict(
+                size=file_stat.st_size, mtime=file_stat.st_mtime, checksum=entry.get("checksum")
+            )
+        manifest.save_sync_state(dest, sync_state, conversion=conversion)
+
+        return dest, changed_files, deleted
+
     def _get_changed_files(self, src, dest, copy_directory):
         """Traverses a source directory and gets all the paths to files and
         subdirectories that got copied into a destination.
@@ -1210,26 +1625,21 @@ class USSCopyHandler(CopyHandler):
         Returns:
             list -- List of relative paths to all content inside dir.
         """
-        original_working_dir = os.getcwd()
-        # The function gets relative paths, so it changes the current working
-        # directory to the root of src.
-        os.chdir(dir)
+        # The paths are made relative without changing the current working
+        # directory, which the copies of a batch share.
         paths = []
 
-        for dirpath, subdirs, files in os.walk(".", True):
+        for dirpath, subdirs, files in os.walk(dir, True):
+            rel_dir = os.path.relpath(dirpath, dir)
             paths += [
-                os.path.join(dirpath, subdir).replace("./", "")
+                os.path.normpath(os.path.join(rel_dir, subdir))
                 for subdir in subdirs
             ]
             paths += [
-                os.path.join(dirpath, filepath).replace("./", "")
+                os.path.normpath(os.path.join(rel_dir, filepath))
                 for filepath in files
             ]
 
-        # Returning the current working directory to what it was before to not
-        # interfere with the rest of the module.
-        os.chdir(original_working_dir)
-
         return paths
 
     def _mvs_copy_to_uss(
@@ -1285,7 +1695,8 @@ class PDSECopyHandler(CopyHandler):
         self,
         module,
         is_binary=False,
-        backup_name=None
+        backup_name=None,
+        max_workers=1
     ):
         """ Utility class to handle copying to partitioned data sets or
         partitioned data set members.
@@ -1298,12 +1709,21 @@ class PDSECopyHandler(CopyHandler):
             is_binary {bool} -- Whether the data set to be copied contains
                                 binary data
             backup_name {str} -- The USS path or data set name of destination backup
+            max_workers {int} -- The maximum number of members copied concurrently,
+                                 only a PDSE can be written concurrently (default: {1})
         """
         super().__init__(
             module,
             is_binary=is_binary,
             backup_name=backup_name
         )
+        self.max_workers = max_workers
+        # Whether members are copied as program objects, None until it is
+        # known from the libraries or the result of a copy.
+        self.is_executable = None
+        # Number of member copies that failed and were repeated with "-X"
+        self.failed_attempts = 0
+        self._lock = threading.Lock()
 
     def copy_to_pdse(
         self,
@@ -1368,32 +1788,159 @@ class PDSECopyHandler(CopyHandler):
                 for member in members
             ]
 
-        existing_members = datasets.list_members(dest)
-        overwritten_members = []
-        new_members = []
-
-        for src_member, destination_member in zip(src_members, dest_members):
-            if destination_member in existing_members:
-                overwritten_members.append(destination_member)
-            else:
-                new_members.append(destination_member)
-
-            result = self.copy_to_member(src_member, "{0}({1})".format(dest, destination_member))
+        existing_members = set(member.upper() for member in datasets.list_members(dest) or [])
+        overwritten_members = [member for member in dest_members if member.upper() in existing_members]
+        new_members = [member for member in dest_members if member.upper() not in existing_members]
+
+        # *********************************************************************
+        # Between two partitioned data sets all the members are copied by a
+        # single IEBCOPY, instead of a copy per member. IEBCOPY reads the
+        # source data set as is, so it is not used when the source had to be
+        # converted. When IEBCOPY fails, for example because the record
+        # formats are incompatible, only the members it did not copy are
+        # copied one by one.
+        # *********************************************************************
+        if (
+            src_ds_type in data_set.DataSet.MVS_PARTITIONED
+            and not conv_path
+            and src_data_set_name.upper() != dest.upper()
+        ):
+            # Without a member or a member pattern in the source the whole
+            # data set is copied, leaving IEBCOPY to copy the aliases too
+            copy_all = new_src.upper() == src_data_set_name.upper()
+            if not copy_all and not members:
+                return
+
+            result = self.copy_pds_to_pdse(
+                src_data_set_name,
+                dest,
+                members=None if copy_all else members,
+                dest_members=None if copy_all else dest_members,
+            )
+            if result["rc"] == 0:
+                return
+
+            copied_members = iebcopy_copied_members(result["out"])
+            remaining = [
+                (src_member, destination_member)
+                for member, src_member, destination_member in zip(members, src_members, dest_members)
+                if member.upper() not in copied_members
+            ]
+            if not remaining:
+                return
+            src_members, dest_members = [list(names) for names in zip(*remaining)]
+
+        if self.is_executable is None and self.is_load_library(
+            src_data_set_name if src_ds_type in data_set.DataSet.MVS_PARTITIONED else None,
+            dest
+        ):
+            self.is_executable = True
+
+        results = self.copy_members(src_members, dest, dest_members)
+        member_errors = [
+            dict(member=destination_member, rc=result["rc"], stdout=result["out"], stderr=result["err"])
+            for destination_member, result in zip(dest_members, results)
+            if result["rc"] != 0
+        ]
 
-            if result["rc"] != 0:
+        if member_errors:
+            if len(member_errors) == 1:
                 msg = "Unable to copy source {0} to data set member {1}({2})".format(
                     new_src,
                     dest,
-                    destination_member
+                    member_errors[0]["member"]
                 )
-                raise CopyOperationError(
-                    msg=msg,
-                    rc=result["rc"],
-                    stdout=result["out"],
-                    stderr=result["err"],
-                    overwritten_members=overwritten_members,
-                    new_members=new_members
+            else:
+                msg = "Unable to copy source {0} to data set members {1} of {2}".format(
+                    new_src,
+                    ", ".join(error["member"] for error in member_errors),
+                    dest
                 )
+            raise CopyOperationError(
+                msg=msg,
+                rc=member_errors[0]["rc"],
+                stdout=member_errors[0]["stdout"],
+                stderr=member_errors[0]["stderr"],
+                overwritten_members=overwritten_members,
+                new_members=new_members,
+                member_errors=member_errors
+            )
+
+    def copy_members(self, src_members, dest, dest_members):
+        """Copy sources to members of a PDS/PDSE, up to max_workers of them at
+        a time. Every member is attempted, a failure does not stop the others.
+
+        Arguments:
+            src_members {list[str]} -- Paths to USS files or data set names.
+            dest {str} -- Name of the destination data set.
+            dest_members {list[str]} -- Names of the destination members.
+
+        Returns:
+            list[dict] -- The result of copy_to_member for each member, in the
+                          same order as src_members.
+        """
+        targets = [
+            (src_member, "{0}({1})".format(dest, destination_member))
+            for src_member, destination_member in zip(src_members, dest_members)
+        ]
+
+        def copy(target):
+            return self.copy_to_member(*target)
+
+        if self.max_workers is None or self.max_workers <= 1 or len(targets) <= 1:
+            return [copy(target) for target in targets]
+
+        # The first member is copied alone, so that when it needs "-X" the
+        # other members are copied with it from the start.
+        results = [copy(targets[0])]
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(targets) - 1)) as executor:
+            results.extend(executor.map(copy, targets[1:]))
+        return results
+
+    def is_load_library(self, *names):
+        """Checks whether any of the given PDS/PDSEs holds load modules or
+        program objects, which have an undefined record format.
+
+        Arguments:
+            names {str} -- Names of data sets, None values are skipped.
+
+        Returns:
+            bool -- Whether any of the data sets has an undefined record format.
+        """
+        for name in names:
+            if not name:
+                continue
+            try:
+                listing = datasets.listing(name)
+            except Exception:
+                continue
+            if listing and str(listing[0].recfm).upper() == "U":
+                return True
+        return False
+
+    def copy_pds_to_pdse(self, src, dest, members=None, dest_members=None):
+        """Copy members from a PDS/PDSE to another PDS/PDSE with a single
+        IEBCOPY, replacing the members that already exist in the destination.
+
+        Arguments:
+            src {str} -- Name of the source data set.
+            dest {str} -- Name of the destination data set.
+
+        Keyword Arguments:
+            members {list[str]} -- Members to copy, all of them when not given. (default: {None})
+            dest_members {list[str]} -- New names of the members in the destination. (default: {None})
+
+        Returns:
+            dict -- Dictionary containing the return code, stdout, and stderr from
+                    IEBCOPY.
+        """
+        dds = dict(OUTPUT=dest.upper(), INPUT=src.upper())
+        rc, out, err = iebcopy(build_iebcopy_sysin(members, dest_members), dds=dds)
+        return dict(
+            rc=rc,
+            out=out,
+            err=err
+        )
 
     def copy_to_member(
         self,
@@ -1417,20 +1964,26 @@ class PDSECopyHandler(CopyHandler):
         dest = dest.replace("$", "\\$").upper()
         opts = dict()
 
-        if self.is_binary:
+        if self.is_executable:
+            opts["options"] = "-X"
+        elif self.is_binary:
             opts["options"] = "-B"
 
         response = datasets._copy(src, dest, None, **opts)
         rc, out, err = response.rc, response.stdout_response, response.stderr_response
 
-        if rc != 0:
+        if rc != 0 and not self.is_executable:
             # *****************************************************************
             # An error occurs while attempting to write a data set member to a
             # PDSE containing program object members, a PDSE cannot contain
             # both program object members and data members. This can be
-            # resolved by copying the program object with a "-X" flag.
+            # resolved by copying the program object with a "-X" flag, which
+            # is then used for the rest of the members too.
             # *****************************************************************
             if ("FSUM8976" in err and "EDC5091I" in err) or ("FSUM8976" in out and "EDC5091I" in out):
+                with self._lock:
+                    self.failed_attempts += 1
+                    self.is_executable = True
                 opts["options"] = "-X"
                 response = datasets._copy(src, dest, None, **opts)
                 rc, out, err = response.rc, response.stdout_response, response.stderr_response
@@ -1442,32 +1995,138 @@ class PDSECopyHandler(CopyHandler):
         )
 
 
-def get_file_record_length(file):
-    """Gets the longest line length from a file.
+def iebcopy_copied_members(output):
+    """Finds the members IEBCOPY reported as copied in its SYSPRINT.
 
     Arguments:
-        file (str) -- Path of the file.
+        output (str) -- The output of IEBCOPY.
 
     Returns:
-        int -- Length of the longest line in the file.
+        set[str] -- The names of the copied members, in uppercase.
     """
-    max_line_length = 0
+    return set(member.upper() for member in findall(IEBCOPY_COPIED_MEMBER, output or ""))
 
-    with open(file, "r") as src_file:
-        current_line = src_file.readline()
 
-        while current_line:
-            line_length = len(current_line.rstrip("\n\r"))
+def build_iebcopy_sysin(members=None, dest_members=None):
+    """Builds the IEBCOPY control statements that copy members from the INPUT
+    DD into the OUTPUT DD, replacing the members that already exist.
 
-            if line_length > max_line_length:
-                max_line_length = line_length
+    Each member is selected as (NAME,NEWNAME,R), with as many of them in a
+    SELECT statement as fit in its 71 columns, IEBCOPY accepts any number of
+    SELECT statements after a COPY statement.
 
-            current_line = src_file.readline()
+    Arguments:
+        members (list[str], optional) -- Members to copy, when not given all of
+                                         them are copied, aliases included.
+        dest_members (list[str], optional) -- New names of the members, a name
+                                              equal to the member's keeps it.
 
-    if max_line_length == 0:
-        max_line_length = 80
+    Returns:
+        str -- The SYSIN for IEBCOPY.
+    """
+    statements = ["   COPY OUTDD=OUTPUT,INDD=((INPUT,R))"]
+    if members is None:
+        return "\n".join(statements)
+
+    dest_members = dest_members or members
+    selected = []
+    for member, dest_member in zip(members, dest_members):
+        member = member.upper()
+        dest_member = dest_member.upper()
+        selected.append("({0},{1},R)".format(member, "" if dest_member == member else dest_member))
+
+    prefix = "   SELECT MEMBER=("
+    line = []
+    for entry in selected:
+        if line and len(prefix) + len(",".join(line + [entry])) + 1 > 71:
+            statements.append("{0}{1})".format(prefix, ",".join(line)))
+            line = []
+        line.append(entry)
+    statements.append("{0}{1})".format(prefix, ",".join(line)))
+
+    return "\n".join(statements)
+
+
+# Bytes read at a time when profiling a source file
+PROFILE_BLOCK_SIZE = 1024 * 1024
+
+# Record length given to data sets allocated for files without any text
+DEFAULT_RECORD_LENGTH = 80
 
-    return max_line_length
+# Removes the carriage returns at the end of a record
+_strip_carriage_returns = methodcaller("rstrip", b"\x0d")
+
+
+def profile_source(path, block_size=PROFILE_BLOCK_SIZE):
+    """Reads a source file once, in binary mode and in large blocks, and
+    gathers everything needed to allocate a data set for it and to copy it.
+
+    The record delimiter is the first ASCII line feed or EBCDIC newline found
+    in the file, carriage returns at the end of a record are not counted in
+    its length.
+
+    Arguments:
+        path (str) -- Path of the file.
+        block_size (int, optional) -- Number of bytes read at a time.
+
+    Returns:
+        dict -- The 'size' in bytes, the 'record_count', the
+                'max_record_length' and the 'line_ending' style of the first
+                record ('crlf', 'lf' or None when the file has a single
+                record).
+    """
+    size = record_count = max_record_length = 0
+    newline = line_ending = None
+    # Length of the record being read and the carriage returns it ends with
+    record_length = trailing_crs = 0
+
+    def extend_record(piece):
+        stripped = piece.rstrip(b"\x0d")
+        if stripped:
+            return record_length + len(piece), len(piece) - len(stripped)
+        return record_length + len(piece), trailing_crs + len(piece)
+
+    with open(path, "rb") as src_file:
+        block = src_file.read(block_size)
+        while block:
+            size += len(block)
+
+            if newline is None:
+                positions = [
+                    (block.find(delimiter), delimiter) for delimiter in (b"\x0a", b"\x15")
+                    if block.find(delimiter) >= 0
+                ]
+                if positions:
+                    newline = min(positions)[1]
+
+            pieces = block.split(newline) if newline else [block]
+            if len(pieces) > 1:
+                # The first piece ends the record carried over from the previous block
+                record_length, trailing_crs = extend_record(pieces[0])
+                if line_ending is None:
+                    line_ending = "crlf" if trailing_crs else "lf"
+                max_record_length = max(max_record_length, record_length - trailing_crs)
+                # The records whole in this block are measured without a Python loop
+                if len(pieces) > 2:
+                    max_record_length = max(
+                        max_record_length, max(map(len, map(_strip_carriage_returns, pieces[1:-1])))
+                    )
+                record_count += len(pieces) - 1
+                record_length = trailing_crs = 0
+            record_length, trailing_crs = extend_record(pieces[-1])
+
+            block = src_file.read(block_size)
+
+    if record_length:
+        max_record_length = max(max_record_length, record_length - trailing_crs)
+        record_count += 1
+
+    return dict(
+        size=size,
+        record_count=record_count,
+        max_record_length=max_record_length,
+        line_ending=line_ending,
+    )
 
 
 def dump_data_set_member_to_file(data_set_member, is_binary):
@@ -1572,7 +2231,8 @@ def create_seq_dataset_from_file(
     dest,
     force,
     is_binary,
-    volume=None
+    volume=None,
+    src_profile=None
 ):
     """Creates a new sequential dataset with attributes suitable to copy the
     contents of a file into it.
@@ -1583,19 +2243,21 @@ def create_seq_dataset_from_file(
         force (bool) -- Whether to replace an existing data set.
         is_binary (bool) -- Whether the file has binary data.
         volume (str, optional) -- Volume where the data set should be.
+        src_profile (dict, optional) -- Profile of the file from profile_source,
+                                        read from the file when not given.
     """
-    src_size = os.stat(file).st_size
+    src_profile = src_profile or profile_source(file)
     record_format = record_length = None
 
     # When src is a binary file, the module will use default attributes
     # for the data set, such as a record format of "VB".
     if not is_binary:
         record_format = "FB"
-        record_length = get_file_record_length(file)
+        record_length = src_profile["max_record_length"] or DEFAULT_RECORD_LENGTH
 
     dest_params = get_data_set_attributes(
         name=dest,
-        size=src_size,
+        size=src_profile["size"],
         is_binary=is_binary,
         record_format=record_format,
         record_length=record_length,
@@ -1614,20 +2276,21 @@ def backup_data(ds_name, ds_type, backup_name, tmphlq=None):
         ds_type {str} -- Type of the file or data set
         backup_name {str} -- Path to USS location or name of data set
         where data will be backed up
+    Raises:
+        CopyOperationError -- When the backup fails.
     Returns:
         {str} -- The USS path or data set name where data was backed up
     """
-    module = AnsibleModuleHelper(argument_spec={})
     try:
         if ds_type == "USS":
             return backup.uss_file_backup(ds_name, backup_name=backup_name)
         return backup.mvs_file_backup(ds_name, backup_name, tmphlq)
     except Exception as err:
-        module.fail_json(
-            msg=str(err.msg),
-            stdout=err.stdout,
-            stderr=err.stderr,
-            rc=err.rc
+        raise CopyOperationError(
+            msg=str(getattr(err, "msg", err)),
+            stdout=getattr(err, "stdout", None),
+            stderr=getattr(err, "stderr", None),
+            rc=getattr(err, "rc", None)
         )
 
 
@@ -1661,10 +2324,10 @@ def restore_backup(
         if dest_type == "USS":
             if os.path.isfile(backup):
                 os.remove(dest)
-                shutil.copy(backup, dest)
+                copy.copy_file(backup, dest)
             else:
                 shutil.rmtree(dest, ignore_errors=True)
-                shutil.copytree(backup, dest)
+                copy.copy_tree(backup, dest)
         else:
             if dest_type in data_set.DataSet.MVS_VSAM:
                 data_set.DataSet.ensure_absent(dest, volumes)
@@ -1918,14 +2581,152 @@ def get_file_checksum(src):
     return hash_digest.hexdigest()
 
 
+# Record delimiter, blank and carriage return of the EBCDIC text written to data sets
+EBCDIC_NEWLINE = b"\x15"
+EBCDIC_BLANK = b"\x40"
+EBCDIC_CR = b"\x0d"
+
+
+def iter_records(stream, newline=EBCDIC_NEWLINE, block_size=1024 * 1024):
+    """Yields the records of a binary stream, split on the newline character,
+    reading it in blocks instead of holding all of it in memory.
+
+    Arguments:
+        stream (file) -- Stream opened in binary mode.
+        newline (bytes, optional) -- Record delimiter.
+        block_size (int, optional) -- Number of bytes read at a time.
+
+    Returns:
+        generator -- The records, without their delimiter.
+    """
+    pending = b""
+    block = stream.read(block_size)
+    while block:
+        records = (pending + block).split(newline)
+        pending = records.pop()
+        for record in records:
+            yield record
+        block = stream.read(block_size)
+    if pending:
+        yield pending
+
+
+def normalize_line_endings(infile, outfile, newline=EBCDIC_NEWLINE, block_size=PROFILE_BLOCK_SIZE):
+    """Copies a binary stream into another one, removing the carriage returns
+    found right before each newline. The stream is copied in blocks, the
+    carriage returns at the end of a block are held back until the next block
+    shows whether a newline follows them.
+
+    Arguments:
+        infile (file) -- Stream opened in binary mode to read from.
+        outfile (file) -- Stream opened in binary mode to write to.
+        newline (bytes, optional) -- Record delimiter.
+        block_size (int, optional) -- Number of bytes read at a time.
+    """
+    pending = b""
+    block = infile.read(block_size)
+    while block:
+        records = (pending + block).split(newline)
+        last = records.pop()
+        outfile.write(b"".join(record.rstrip(EBCDIC_CR) + newline for record in records))
+
+        # Only the carriage returns that end the block are kept for later
+        stripped = last.rstrip(EBCDIC_CR)
+        outfile.write(stripped)
+        pending = last[len(stripped):]
+        block = infile.read(block_size)
+    outfile.write(pending)
+
+
+def get_records_checksum(records, strip_blanks=False):
+    """Calculate the SHA256 hash of text records the way they are stored in a
+    data set, so that the content of a source can be compared with the
+    content of a data set. Carriage returns at the end of the records are
+    ignored, as they are removed when copying.
+
+    Arguments:
+        records (iterable[bytes]) -- The records, from iter_records.
+        strip_blanks (bool, optional) -- Whether to ignore trailing blanks,
+                                         which pad the records of data sets
+                                         with a fixed record length.
+
+    Returns:
+        str -- The SHA256 hash of the records.
+    """
+    hash_digest = sha256()
+    for record in records:
+        record = record.rstrip(EBCDIC_CR)
+        if strip_blanks:
+            record = record.rstrip(EBCDIC_BLANK)
+        hash_digest.update(record)
+        hash_digest.update(EBCDIC_NEWLINE)
+    return hash_digest.hexdigest()
+
+
+def get_data_set_checksum(name, strip_blanks=False):
+    """Calculate the SHA256 hash of the text records of a sequential data set
+    or a member, streamed from cat.
+
+    Arguments:
+        name (str) -- Name of the data set or member.
+        strip_blanks (bool, optional) -- Whether to ignore trailing blanks.
+
+    Returns:
+        str -- The SHA256 hash of the records, None if they could not be read.
+    """
+    process = Popen(["cat", "//'{0}'".format(name)], stdout=PIPE, stderr=DEVNULL)
+    try:
+        checksum = get_records_checksum(iter_records(process.stdout), strip_blanks=strip_blanks)
+    finally:
+        process.stdout.close()
+        rc = process.wait()
+    return checksum if rc == 0 else None
+
+
+def is_content_identical(src, src_ds_type, dest, dest_name):
+    """Compares the text content of a source with the content of an existing
+    sequential data set or member, record by record and ignoring the padding
+    of fixed length records.
+
+    Arguments:
+        src (str) -- Path to the USS file, already converted to the encoding
+                     of the destination, or name of the data set or member.
+        src_ds_type (str) -- Type of the source.
+        dest (str) -- Name of the destination data set or member.
+        dest_name (str) -- Name of the destination data set.
+
+    Returns:
+        bool -- Whether the content is the same, False when it can not be read.
+    """
+    try:
+        formats = [datasets.listing(dest_name)[0].recfm]
+        if src_ds_type != "USS":
+            formats.append(datasets.listing(data_set.extract_dsname(src))[0].recfm)
+        strip_blanks = any(str(record_format).upper().startswith("F") for record_format in formats)
+
+        if src_ds_type == "USS":
+            with open(src, "rb") as infile:
+                src_checksum = get_records_checksum(iter_records(infile), strip_blanks=strip_blanks)
+        else:
+            src_checksum = get_data_set_checksum(src, strip_blanks=strip_blanks)
+
+        dest_checksum = get_data_set_checksum(dest, strip_blanks=strip_blanks)
+    except Exception:
+        return False
+
+    return src_checksum is not None and src_checksum == dest_checksum
+
+
 def cleanup(src_list):
     """Remove all files or directories listed in src_list. Also perform
     additional cleanup of the /tmp directory.
 
     Arguments:
         src_list {list} -- A list of file paths
+
+    Raises:
+        CopyOperationError -- When a file can not be removed.
     """
-    module = AnsibleModuleHelper(argument_spec={})
     tmp_prefix = tempfile.gettempprefix()
     tmp_dir = os.path.realpath("/" + tmp_prefix)
     dir_list = glob.glob(tmp_dir + "/ansible-zos-copy-payload*")
@@ -1942,11 +2743,257 @@ def cleanup(src_list):
         except OSError as err:
             err = str(err)
             if "Permission denied" not in err:
-                module.fail_json(
+                raise CopyOperationError(
                     msg="Error during clean up of file {0}".format(file), stderr=err
                 )
 
 
+def extract_transfer_archive(path):
+    """Unpack the archive of a local directory transferred by the action
+    plugin, the archive is replaced by a directory with the same path holding
+    its content, the same layout an SFTP transfer of the directory creates.
+
+    Arguments:
+        path {str} -- The path of the archive on USS.
+
+    Raises:
+        tarfile.TarError: When an archive member would be written outside of path.
+    """
+    archive_path = "{0}.archive".format(path)
+    os.rename(path, archive_path)
+    try:
+        os.mkdir(path)
+        with tarfile.open(archive_path, "r:*") as archive:
+            members = archive.getmembers()
+            for member in members:
+                name = os.path.normpath(member.name)
+                if (os.path.isabs(name) or name.startswith("..")
+                        or not (member.isreg() or member.isdir())):
+                    raise tarfile.TarError("Invalid archive member {0}".format(member.name))
+            archive.extractall(path, members=members)
+    finally:
+        os.remove(archive_path)
+
+
+class BatchItemModule(object):
+    """Stands in for the AnsibleModule of the task while run_module copies one
+    item of a batch. It holds the parameters of the item, and exit_json and
+    fail_json end the copy of the item instead of the module run.
+    """
+
+    def __init__(self, module, params):
+        """
+        Arguments:
+            module {AnsibleModule} -- The AnsibleModule of the task.
+            params {dict} -- The parameters of the item.
+        """
+        self.module = module
+        self.params = params
+
+    def exit_json(self, **kwargs):
+        raise BatchItemExit(kwargs)
+
+    def fail_json(self, **kwargs):
+        kwargs["failed"] = True
+        raise BatchItemExit(kwargs)
+
+    def __getattr__(self, name):
+        return getattr(self.module, name)
+
+
+def _batch_path_key(name):
+    """Get the USS path or the data set name written or read by an item of a
+    batch, members of the same data set share it."""
+    if "/" in name:
+        return os.path.normpath(name)
+    return data_set.extract_dsname(name).upper()
+
+
+def _batch_paths_overlap(path, other):
+    if path == other:
+        return True
+    if path.startswith("/") and other.startswith("/"):
+        return (
+            other.startswith(path.rstrip("/") + "/")
+            or path.startswith(other.rstrip("/") + "/")
+        )
+    return False
+
+
+def get_batch_groups(items):
+    """Group the items of a batch that can not be copied concurrently, an
+    item is grouped with the earlier items whose destination or remote source
+    overlaps its destination, or whose destination overlaps its source.
+
+    Arguments:
+        items {list[dict]} -- The parameters of each item.
+
+    Returns:
+        list[list[int]] -- The indexes of the items of each group, the items
+            of a group are copied in order and the groups concurrently.
+    """
+    keys = []
+    for item in items:
+        src = item.get("src")
+        keys.append((
+            _batch_path_key(item.get("dest")),
+            _batch_path_key(src) if src and item.get("remote_src") else None,
+        ))
+
+    group_of = list(range(len(items)))
+
+    def find(index):
+        while group_of[index] != index:
+            index = group_of[index]
+        return index
+
+    for index, (dest, src) in enumerate(keys):
+        for other_index in range(index):
+            other_dest, other_src = keys[other_index]
+            if (
+                _batch_paths_overlap(dest, other_dest)
+                or (other_src and _batch_paths_overlap(dest, other_src))
+                or (src and _batch_paths_overlap(src, other_dest))
+            ):
+                group_of[find(index)] = find(other_index)
+
+    groups = []
+    group_positions = dict()
+    for index in range(len(items)):
+        root = find(index)
+        if root not in group_positions:
+            group_positions[root] = len(groups)
+            groups.append([])
+        groups[group_positions[root]].append(index)
+    return groups
+
+
+def run_batch_item(module, params, arg_def):
+    """Copy one item of a batch with run_module.
+
+    Arguments:
+        module {AnsibleModule} -- The AnsibleModule of the task.
+        params {dict} -- The parameters of the item.
+        arg_def {dict} -- The BetterArgParser definition for the item.
+
+    Returns:
+        tuple(dict, list[str]) -- The result of the item, and the temporary
+            files it left to clean up.
+    """
+    temp_path = conv_path = None
+    try:
+        res_args, temp_path, conv_path = run_module(BatchItemModule(module, params), arg_def)
+    except BatchItemExit as item_exit:
+        res_args = item_exit.result
+    except CopyOperationError as err:
+        res_args = dict(err.json_args, failed=True)
+    except Exception as err:
+        res_args = dict(
+            msg="Unable to copy {0} to {1}".format(params.get("src") or "content", params.get("dest")),
+            stderr=str(err),
+            failed=True
+        )
+    return res_args, [temp_path, conv_path]
+
+
+def run_batch(module, arg_def):
+    """Copy the items of a batch. Each item gets the parameters of the task
+    updated with the ones it sets, the items are copied concurrently when
+    get_batch_groups allows it.
+
+    Arguments:
+        module {AnsibleModule} -- The AnsibleModule of the task.
+        arg_def {dict} -- The BetterArgParser definition of the task.
+
+    Returns:
+        tuple(list[dict], list[str]) -- The result of each item, and the
+            temporary files left to clean up.
+    """
+    params = dict((name, value) for name, value in module.params.items() if name != "batch")
+    # The plugin transferred the local sources of all the items in one
+    # archive, unpacked before the items run.
+    params.update(archive_transfer="none", temp_path=None, sync=False, sync_query=False)
+
+    items = []
+    for item in module.params.get("batch"):
+        item_params = dict(params)
+        item_params.update((name, value) for name, value in item.items() if value is not None)
+        for name in ("encoding", "dest_data_set"):
+            if item_params.get(name):
+                item_params[name] = dict(item_params[name])
+        item_arg_def = dict(arg_def)
+        update_encoding_params(item_params, item_arg_def)
+        items.append((item_params, item_arg_def))
+
+    results = [None] * len(items)
+    cleanup_paths = []
+
+    def run_group(indexes):
+        for index in indexes:
+            results[index], item_paths = run_batch_item(module, *items[index])
+            cleanup_paths.extend(item_paths)
+
+    groups = get_batch_groups([item_params for item_params, item_arg_def in items])
+    with ThreadPoolExecutor(max_workers=DEFAULT_BATCH_WORKERS) as executor:
+        for future in [executor.submit(run_group, group) for group in groups]:
+            future.result()
+
+    return results, cleanup_paths
+
+
+def update_encoding_params(params, arg_def):
+    """Set the default encoding conversion of text copied from the controller,
+    and have BetterArgParser check the code sets of the conversion.
+
+    Arguments:
+        params {dict} -- The module parameters, updated in place.
+        arg_def {dict} -- The BetterArgParser definition, updated in place.
+    """
+    if (
+        not params.get("encoding")
+        and not params.get("remote_src")
+        and not params.get("is_binary")
+    ):
+        params["encoding"] = {
+            "from": params.get("local_charset"),
+            "to": encode.Defaults.get_default_system_charset(),
+        }
+
+    if params.get("encoding"):
+        params.update(
+            dict(
+                from_encoding=params.get("encoding").get("from"),
+                to_encoding=params.get("encoding").get("to"),
+            )
+        )
+        arg_def.update(
+            dict(
+                from_encoding=dict(arg_type="encoding"),
+                to_encoding=dict(arg_type="encoding"),
+            )
+        )
+
+
+def write_inline_content(content_b64):
+    """Write the content the action plugin sent in base64 to a temporary
+    file.
+
+    Arguments:
+        content_b64 {str} -- The content, encoded in base64.
+
+    Returns:
+        str -- The path of the temporary file.
+    """
+    fd, path = tempfile.mkstemp()
+    try:
+        with os.fdopen(fd, "wb") as outfile:
+            outfile.write(base64.b64decode(content_b64))
+    except Exception:
+        os.remove(path)
+        raise
+    return path
+
+
 def is_member_wildcard(src):
     """Determine whether src specifies a data set member wildcard in the
     form 'SOME.DATA.SET(*)' or 'SOME.DATA.SET(ABC*)'
@@ -1974,7 +3021,8 @@ def allocate_destination_data_set(
     force,
     is_binary,
     dest_data_set=None,
-    volume=None
+    volume=None,
+    src_profile=None
 ):
     """
     Allocates a new destination data set to copy into, erasing a preexistent one if
@@ -1991,6 +3039,7 @@ def allocate_destination_data_set(
         dest_data_set (dict, optional) -- Parameters containing a full definition
             of the new data set; they will take precedence over any other allocation logic.
         volume (str, optional) -- Volume where the data set should be allocated into.
+        src_profile (dict, optional) -- Profile of a USS source file from profile_source.
 
     Returns:
         bool -- True if the data set was created, False otherwise.
@@ -2016,7 +3065,7 @@ def allocate_destination_data_set(
 
         if src_ds_type == "USS":
             # Taking the temp file when a local file was copied with sftp.
-            create_seq_dataset_from_file(src, dest, force, is_binary, volume=volume)
+            create_seq_dataset_from_file(src, dest, force, is_binary, volume=volume, src_profile=src_profile)
         elif src_ds_type in data_set.DataSet.MVS_SEQ:
             data_set.DataSet.allocate_model_data_set(ds_name=dest, model=src_name, vol=volume)
         else:
@@ -2045,16 +3094,16 @@ def allocate_destination_data_set(
         elif src_ds_type == "USS":
             if os.path.isfile(src):
                 # This is almost the same as allocating a sequential dataset.
-                size = os.stat(src).st_size
+                src_profile = src_profile or profile_source(src)
                 record_format = record_length = None
 
                 if not is_binary:
                     record_format = "FB"
-                    record_length = get_file_record_length(src)
+                    record_length = src_profile["max_record_length"] or DEFAULT_RECORD_LENGTH
 
                 dest_params = get_data_set_attributes(
                     dest,
-                    size,
+                    src_profile["size"],
                     is_binary,
                     record_format=record_format,
                     record_length=record_length,
@@ -2115,6 +3164,50 @@ def run_module(module, arg_def):
     copy_member = module.params.get('copy_member')
     tmphlq = module.params.get('tmp_hlq')
     force = module.params.get('force')
+    skip_identical = module.params.get('skip_identical')
+    archive_transfer = module.params.get('archive_transfer')
+    sync = module.params.get('sync')
+    sync_delete = module.params.get('sync_delete')
+    sync_manifest = module.params.get('sync_manifest')
+    content_b64 = module.params.get('content_b64')
+
+    # ********************************************************************
+    # When the plugin transferred a local directory as an archive, unpack
+    # it where the directory would have been transferred to.
+    # ********************************************************************
+    if temp_path and is_src_dir and archive_transfer != "none":
+        try:
+            extract_transfer_archive(temp_path)
+        except (OSError, IOError, tarfile.TarError) as err:
+            module.fail_json(
+                msg="Unable to unpack the archive of {0}".format(src), stderr=str(err))
+
+    # ********************************************************************
+    # Small content is sent by the plugin in the module arguments instead
+    # of being transferred, it is written where the transfer would have
+    # written it and copied the same way.
+    # ********************************************************************
+    if content_b64 and not temp_path:
+        try:
+            temp_path = write_inline_content(content_b64)
+        except (OSError, IOError, ValueError, TypeError) as err:
+            module.fail_json(msg="Unable to write the content to a temporary file", stderr=str(err))
+
+    # ********************************************************************
+    # Before a sync from a local directory, the plugin gets the manifest of
+    # the destination directory to only transfer the files that changed.
+    # ********************************************************************
+    if module.params.get('sync_query'):
+        sync_dest = dest if src.endswith("/") else os.path.join(dest, os.path.basename(os.path.normpath(src)))
+        module.exit_json(
+            changed=False,
+            dest=sync_dest,
+            sync_manifest=manifest.dest_manifest(
+                sync_dest,
+                manifest.load_sync_state(sync_dest, conversion=manifest.sync_conversion(encoding, is_binary)),
+                hash_files=not encoding
+            )
+        )
 
     dest_data_set = module.params.get('dest_data_set')
     if dest_data_set:
@@ -2233,6 +3326,12 @@ def run_module(module, arg_def):
     except Exception as err:
         module.fail_json(msg=str(err))
 
+    # A sync only updates the changed files of an existing directory, it
+    # does not need force to replace them.
+    is_sync = sync and is_uss and is_src_dir and src_ds_type == "USS"
+    if is_sync:
+        force = True
+
     # ********************************************************************
     # Some src and dest combinations are incompatible. For example, it is
     # not possible to copy a PDS member to a VSAM data set or a USS file
@@ -2253,6 +3352,46 @@ def run_module(module, arg_def):
             )
         )
 
+    # ********************************************************************
+    # When asked to, compare the text content of a single source with an
+    # existing sequential data set or member before any backup, allocation
+    # or copy, and leave the destination alone when nothing would change.
+    # The source is converted to the encoding of the destination first.
+    # ********************************************************************
+    if (
+        skip_identical
+        and dest_exists
+        and not is_binary
+        and not is_src_dir
+        and (
+            dest_ds_type in data_set.DataSet.MVS_SEQ
+            or (copy_member and dest_member_exists)
+        )
+        and (
+            (src_ds_type == "USS" and os.path.isfile(temp_path or src))
+            or src_ds_type in data_set.DataSet.MVS_SEQ
+            or src_member
+        )
+    ):
+        try:
+            if encoding:
+                encoding["to"] = encode.Defaults.DEFAULT_EBCDIC_MVS_CHARSET
+                conv_path = CopyHandler(module, is_binary=is_binary).convert_encoding(src, temp_path, encoding)
+        except CopyOperationError as err:
+            module.fail_json(**(err.json_args))
+
+        if is_content_identical(conv_path or temp_path or src, src_ds_type, dest, dest_name):
+            res_args.update(
+                dict(
+                    changed=False,
+                    src=src,
+                    dest=dest.upper(),
+                    ds_type=dest_ds_type,
+                    dest_exists=dest_exists,
+                )
+            )
+            return res_args, temp_path, conv_path
+
     # ********************************************************************
     # Backup should only be performed if dest is an existing file or
     # data set. Otherwise ignored.
@@ -2344,7 +3483,16 @@ def run_module(module, arg_def):
             emergency_backup = data_set.DataSet.temp_name()
             data_set.DataSet.allocate_model_data_set(emergency_backup, dest_name)
 
+    # ********************************************************************
+    # A single USS file copied into a data set is read once to gather its
+    # size, record lengths and line endings, both the allocation and the
+    # copy take them from this profile.
+    # ********************************************************************
+    src_profile = None
     try:
+        if not is_uss and src_ds_type == "USS" and os.path.isfile(temp_path or src):
+            src_profile = profile_source(temp_path or src)
+
         if not is_uss:
             res_args["changed"] = allocate_destination_data_set(
                 temp_path or src,
@@ -2354,7 +3502,8 @@ def run_module(module, arg_def):
                 force,
                 is_binary,
                 dest_data_set=dest_data_set,
-                volume=volume
+                volume=volume,
+                src_profile=src_profile
             )
     except Exception as err:
         if dest_exists and not force:
@@ -2376,7 +3525,7 @@ def run_module(module, arg_def):
     )
 
     try:
-        if encoding:
+        if encoding and not conv_path:
             # 'conv_path' points to the converted src file or directory
             if is_mvs_dest:
                 encoding["to"] = encode.Defaults.DEFAULT_EBCDIC_MVS_CHARSET
@@ -2394,39 +3543,54 @@ def run_module(module, arg_def):
                 backup_name=backup_name,
             )
 
-            original_checksum = None
-            if dest_exists:
-                original_checksum = get_file_checksum(dest)
+            if is_sync:
+                dest, copied_files, deleted_files = uss_copy_handler.sync_to_uss(
+                    src,
+                    dest,
+                    conv_path,
+                    temp_path,
+                    src_manifest=sync_manifest,
+                    hash_files=not encoding,
+                    delete=sync_delete,
+                    encoding=encoding
+                )
+                res_args["size"] = os.stat(dest).st_size
+                res_args["sync"] = dict(copied=copied_files, deleted=deleted_files)
+                res_args["changed"] = bool(res_args.get("changed") or copied_files or deleted_files)
+            else:
+                original_checksum = None
+                if dest_exists:
+                    original_checksum = get_file_checksum(dest)
 
-            dest = uss_copy_handler.copy_to_uss(
-                src,
-                dest,
-                conv_path,
-                temp_path,
-                src_ds_type,
-                src_member,
-                member_name,
-                force
-            )
-            res_args['size'] = os.stat(dest).st_size
-            remote_checksum = dest_checksum = None
+                dest = uss_copy_handler.copy_to_uss(
+                    src,
+                    dest,
+                    conv_path,
+                    temp_path,
+                    src_ds_type,
+                    src_member,
+                    member_name,
+                    force
+                )
+                res_args['size'] = os.stat(dest).st_size
+                remote_checksum = dest_checksum = None
 
-            try:
-                remote_checksum = get_file_checksum(temp_path or src)
-                dest_checksum = get_file_checksum(dest)
+                try:
+                    remote_checksum = get_file_checksum(temp_path or src)
+                    dest_checksum = get_file_checksum(dest)
 
-                if validate:
-                    res_args["checksum"] = dest_checksum
+                    if validate:
+                        res_args["checksum"] = dest_checksum
 
-                    if remote_checksum != dest_checksum:
-                        raise CopyOperationError(msg="Validation failed for copied files")
+                        if remote_checksum != dest_checksum:
+                            raise CopyOperationError(msg="Validation failed for copied files")
 
-                res_args["changed"] = (
-                    res_args.get("changed") or dest_checksum != original_checksum or os.path.isdir(dest)
-                )
-            except Exception as err:
-                if validate:
-                    raise CopyOperationError(msg="Unable to calculate checksum", stderr=str(err))
+                    res_args["changed"] = (
+                        res_args.get("changed") or dest_checksum != original_checksum or os.path.isdir(dest)
+                    )
+                except Exception as err:
+                    if validate:
+                        raise CopyOperationError(msg="Unable to calculate checksum", stderr=str(err))
 
         # ------------------------------- o -----------------------------------
         # Copy to sequential data set (PS / SEQ)
@@ -2445,7 +3609,17 @@ def run_module(module, arg_def):
                 if src_tag == "untagged":
                     src_tag = encode.Defaults.DEFAULT_EBCDIC_USS_CHARSET
 
-                if src_tag not in encode.Defaults.DEFAULT_EBCDIC_MVS_CHARSET:
+                needs_conversion = src_tag not in encode.Defaults.DEFAULT_EBCDIC_MVS_CHARSET
+
+                # The line endings do not change with the encoding conversion,
+                # when both are needed they are done in a single pass.
+                if (src_profile or profile_source(new_src))["line_ending"] == "crlf":
+                    new_src = copy_handler.create_temp_with_lf_endings(
+                        new_src,
+                        from_code=src_tag if needs_conversion else None,
+                        to_code=encode.Defaults.DEFAULT_EBCDIC_MVS_CHARSET if needs_conversion else None
+                    )
+                elif needs_conversion:
                     fd, converted_src = tempfile.mkstemp()
                     os.close(fd)
 
@@ -2458,9 +3632,6 @@ def run_module(module, arg_def):
                     copy_handler._tag_file_encoding(converted_src, encode.Defaults.DEFAULT_EBCDIC_MVS_CHARSET)
                     new_src = converted_src
 
-                if copy_handler.file_has_crlf_endings(new_src):
-                    new_src = copy_handler.create_temp_with_lf_endings(new_src)
-
                 conv_path = new_src
 
             copy_handler.copy_to_seq(
@@ -2479,13 +3650,20 @@ def run_module(module, arg_def):
             if not remote_src and not copy_member and os.path.isdir(temp_path):
                 temp_path = os.path.join(temp_path, os.path.basename(src))
 
+            # A PDS can only have one member open for output at a time, only
+            # the members of a destination known to be a PDSE are written
+            # concurrently.
             pdse_copy_handler = PDSECopyHandler(
-                module, is_binary=is_binary, backup_name=backup_name
+                module,
+                is_binary=is_binary,
+                backup_name=backup_name,
+                max_workers=DEFAULT_MEMBER_WORKERS if dest_ds_type == "PDSE" else 1
             )
 
             pdse_copy_handler.copy_to_pdse(
                 src, temp_path, conv_path, dest_name, src_ds_type, src_member=src_member, dest_member=dest_member
             )
+            res_args["failed_copy_attempts"] = pdse_copy_handler.failed_attempts
             res_args["changed"] = True
             dest = dest.upper()
 
@@ -2518,81 +3696,102 @@ def run_module(module, arg_def):
 
 
 def main():
-    module = AnsibleModule(
-        argument_spec=dict(
-            src=dict(type='path'),
-            dest=dict(required=True, type='str'),
-            is_binary=dict(type='bool', default=False),
-            encoding=dict(
-                type='dict',
-                required=False,
-                options={
-                    'from': dict(
-                        type='str',
-                        required=True,
-                    ),
-                    "to": dict(
-                        type='str',
-                        required=True,
-                    )
-                }
-            ),
-            content=dict(type='str', no_log=True),
-            backup=dict(type='bool', default=False),
-            backup_name=dict(type='str'),
-            local_follow=dict(type='bool', default=True),
-            remote_src=dict(type='bool', default=False),
-            ignore_sftp_stderr=dict(type='bool', default=False),
-            validate=dict(type='bool', default=False),
-            volume=dict(type='str', required=False),
-            dest_data_set=dict(
-                type='dict',
-                required=False,
-                options=dict(
-                    type=dict(
-                        type='str',
-                        choices=['BASIC', 'KSDS', 'ESDS', 'RRDS',
-                                 'LDS', 'SEQ', 'PDS', 'PDSE', 'MEMBER'],
-                        required=True,
-                    ),
-                    space_primary=dict(
-                        type='int', required=False),
-                    space_secondary=dict(
-                        type='int', required=False),
-                    space_type=dict(
-                        type='str',
-                        choices=['K', 'M', 'G', 'CYL', 'TRK'],
-                        required=False,
-                    ),
-                    record_format=dict(
-                        type='str',
-                        choices=["FB", "VB", "FBA", "VBA", "U"],
-                        required=False
-                    ),
-                    record_length=dict(type='int', required=False),
-                    block_size=dict(type='int', required=False),
-                    directory_blocks=dict(type="int", required=False),
-                    key_offset=dict(type="int", required=False, no_log=False),
-                    key_length=dict(type="int", required=False, no_log=False),
-                    sms_storage_class=dict(type="str", required=False),
-                    sms_data_class=dict(type="str", required=False),
-                    sms_management_class=dict(type="str", required=False),
+    argument_spec = dict(
+        src=dict(type='path'),
+        dest=dict(type='str'),
+        is_binary=dict(type='bool', default=False),
+        archive_transfer=dict(type='str', default='none', choices=['none', 'tar', 'gz']),
+        sync=dict(type='bool', default=False),
+        sync_delete=dict(type='bool', default=False),
+        sync_manifest=dict(type='dict', required=False),
+        sync_query=dict(type='bool', default=False),
+        skip_identical=dict(type='bool', default=False),
+        encoding=dict(
+            type='dict',
+            required=False,
+            options={
+                'from': dict(
+                    type='str',
+                    required=True,
+                ),
+                "to": dict(
+                    type='str',
+                    required=True,
                 )
-            ),
-            is_uss=dict(type='bool'),
-            is_pds=dict(type='bool'),
-            is_src_dir=dict(type='bool'),
-            is_mvs_dest=dict(type='bool'),
-            size=dict(type='int'),
-            temp_path=dict(type='str'),
-            copy_member=dict(type='bool'),
-            src_member=dict(type='bool'),
-            local_charset=dict(type='str'),
-            force=dict(type='bool', default=False),
-            mode=dict(type='str', required=False),
-            tmp_hlq=dict(type='str', required=False, default=None),
+            }
         ),
+        content=dict(type='str', no_log=True),
+        content_b64=dict(type='str', no_log=True),
+        backup=dict(type='bool', default=False),
+        backup_name=dict(type='str'),
+        local_follow=dict(type='bool', default=True),
+        remote_src=dict(type='bool', default=False),
+        ignore_sftp_stderr=dict(type='bool', default=False),
+        validate=dict(type='bool', default=False),
+        volume=dict(type='str', required=False),
+        dest_data_set=dict(
+            type='dict',
+            required=False,
+            options=dict(
+                type=dict(
+                    type='str',
+                    choices=['BASIC', 'KSDS', 'ESDS', 'RRDS',
+                             'LDS', 'SEQ', 'PDS', 'PDSE', 'MEMBER'],
+                    required=True,
+                ),
+                space_primary=dict(
+                    type='int', required=False),
+                space_secondary=dict(
+                    type='int', required=False),
+                space_type=dict(
+                    type='str',
+                    choices=['K', 'M', 'G', 'CYL', 'TRK'],
+                    required=False,
+                ),
+                record_format=dict(
+                    type='str',
+                    choices=["FB", "VB", "FBA", "VBA", "U"],
+                    required=False
+                ),
+                record_length=dict(type='int', required=False),
+                block_size=dict(type='int', required=False),
+                directory_blocks=dict(type="int", required=False),
+                key_offset=dict(type="int", required=False, no_log=False),
+                key_length=dict(type="int", required=False, no_log=False),
+                sms_storage_class=dict(type="str", required=False),
+                sms_data_class=dict(type="str", required=False),
+                sms_management_class=dict(type="str", required=False),
+            )
+        ),
+        is_uss=dict(type='bool'),
+        is_pds=dict(type='bool'),
+        is_src_dir=dict(type='bool'),
+        is_mvs_dest=dict(type='bool'),
+        size=dict(type='int'),
+        temp_path=dict(type='str'),
+        copy_member=dict(type='bool'),
+        src_member=dict(type='bool'),
+        local_charset=dict(type='str'),
+        force=dict(type='bool', default=False),
+        mode=dict(type='str', required=False),
+        tmp_hlq=dict(type='str', required=False, default=None),
+    )
+    batch_item_spec = dict(
+        (name, dict((key, value) for key, value in argument_spec[name].items() if key != 'default'))
+        for name in BATCH_ITEM_OPTIONS
+    )
+    batch_item_spec["dest"]["required"] = True
+    batch_item_spec.update(
+        owner=dict(type='str', required=False),
+        group=dict(type='str', required=False),
+    )
+    argument_spec["batch"] = dict(type='list', elements='dict', options=batch_item_spec)
+
+    module = AnsibleModule(
+        argument_spec=argument_spec,
         add_file_common_args=True,
+        mutually_exclusive=[['batch', 'src'], ['batch', 'content'], ['batch', 'dest']],
+        required_one_of=[['batch', 'dest']],
     )
 
     arg_def = dict(
@@ -2630,39 +3829,69 @@ def main():
         ),
     )
 
-    if (
-        not module.params.get("encoding")
-        and not module.params.get("remote_src")
-        and not module.params.get("is_binary")
-    ):
-        module.params["encoding"] = {
-            "from": module.params.get("local_charset"),
-            "to": encode.Defaults.get_default_system_charset(),
-        }
+    if module.params.get("batch"):
+        if module.params.get("sync"):
+            module.fail_json(msg="'sync' is not supported with 'batch'")
 
-    if module.params.get("encoding"):
-        module.params.update(
-            dict(
-                from_encoding=module.params.get("encoding").get("from"),
-                to_encoding=module.params.get("encoding").get("to"),
-            )
+        temp_path = module.params.get("temp_path")
+        batch_results = []
+        cleanup_paths = []
+        unpack_error = cleanup_error = None
+        try:
+            if temp_path:
+                extract_transfer_archive(temp_path)
+            batch_results, cleanup_paths = run_batch(module, arg_def)
+        except (OSError, IOError, tarfile.TarError) as err:
+            unpack_error = str(err)
+        finally:
+            try:
+                cleanup([temp_path] + cleanup_paths)
+            except CopyOperationError as err:
+                cleanup_error = err
+
+        if unpack_error is not None:
+            module.fail_json(msg="Unable to unpack the sources of the batch", stderr=unpack_error)
+
+        res_args = dict(
+            changed=any(result.get("changed") for result in batch_results),
+            batch_results=batch_results,
         )
-        arg_def.update(
-            dict(
-                from_encoding=dict(arg_type="encoding"),
-                to_encoding=dict(arg_type="encoding"),
+        # The items were copied, the results are still returned with the error
+        if cleanup_error is not None:
+            module.fail_json(**dict(cleanup_error.json_args, **res_args))
+        failed_count = len([result for result in batch_results if result.get("failed")])
+        if failed_count:
+            module.fail_json(
+                msg="{0} of the {1} items of the batch failed".format(failed_count, len(batch_results)),
+                **res_args
             )
-        )
+        module.exit_json(**res_args)
+
+    update_encoding_params(module.params, arg_def)
 
     res_args = temp_path = conv_path = None
+    copy_error = cleanup_error = None
     try:
         res_args, temp_path, conv_path = run_module(module, arg_def)
-        module.exit_json(**res_args)
     except CopyOperationError as err:
-        cleanup([])
-        module.fail_json(**(err.json_args))
+        copy_error = err
     finally:
-        cleanup([temp_path, conv_path])
+        try:
+            cleanup([temp_path, conv_path])
+        except CopyOperationError as err:
+            cleanup_error = err
+
+    if copy_error is not None:
+        module.fail_json(**(copy_error.json_args))
+    if cleanup_error is not None:
+        module.fail_json(**(cleanup_error.json_args))
+    module.exit_json(**res_args)
+
+
+class BatchItemExit(Exception):
+    def __init__(self, result):
+        self.result = result
+        super().__init__(result.get("msg"))
 
 
 class EncodingConversionError(Exception):
@@ -2697,7 +3926,8 @@ class CopyOperationError(Exception):
         cmd=None,
         dest_exists=None,
         overwritten_members=None,
-        new_members=None
+        new_members=None,
+        member_errors=None
     ):
         self.json_args = dict(
             msg=msg,
@@ -2709,6 +3939,8 @@ class CopyOperationError(Exception):
             cmd=cmd,
             dest_exists=dest_exists,
         )
+        if member_errors:
+            self.json_args["member_errors"] = member_errors
         self.overwritten_members = overwritten_members
         self.new_members = new_members
         super().__init__(msg)
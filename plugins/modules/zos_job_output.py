@@ -33,6 +33,8 @@ description:
     like "*".
   - If there is no ddname, or if ddname="?", output of all the ddnames under
     the given job will be displayed.
+  - Only the content of the selected ddnames is read from the spool, when
+    I(return_content=false) no content is read at all.
 version_added: "1.0.0"
 author:
   - "Jack Ho (@jacklotusho)"
@@ -59,8 +61,150 @@ options:
     description:
       - Data definition name (show only this DD on a found job).
         (e.g "JESJCL", "?")
+      - A list of data definition names can be provided to show only those
+        DDs on a found job. (e.g "JESMSGLG,JESYSMSG")
+    type: list
+    elements: str
+    required: false
+  return_content:
+    description:
+      - Whether to return the content of the selected ddnames.
+      - When false, only the data definition names, record counts and byte
+        counts of the DDs are returned and the job spool is not read.
+        Fields parsed from the job log, such as the I(class), the I(subsystem)
+        and the steps in I(ret_code) are not returned.
+    type: bool
+    required: false
+    default: true
+  max_lines:
+    description:
+      - The maximum number of lines returned for each ddname, starting from the
+        first line.
+      - The spool is no longer read once the limit is reached.
+      - Mutually exclusive with I(tail_lines).
+    type: int
+    required: false
+  tail_lines:
+    description:
+      - The maximum number of lines returned for each ddname, ending with the
+        last line.
+      - Mutually exclusive with I(max_lines).
+    type: int
+    required: false
+  max_bytes:
+    description:
+      - The maximum number of bytes returned for each ddname, the content is
+        cut on a line boundary.
+      - Can be combined with I(max_lines) or I(tail_lines), in which case both
+        limits apply.
+    type: int
+    required: false
+  search:
+    description:
+      - One or more regular expressions searched for in the content of the
+        selected ddnames on the managed node.
+      - When set, the ddname content is not returned, instead only the lines
+        matching any of the regular expressions are returned in I(matches)
+        along with their ddname and line number.
+    type: list
+    elements: str
+    required: false
+  search_context:
+    description:
+      - The number of lines returned before and after each line matching
+        I(search).
+    type: int
+    required: false
+    default: 0
+  offsets:
+    description:
+      - Follow the output of a job, only the records written to each ddname
+        since a previous call are returned.
+      - A dictionary mapping the I(id) of each ddname to the number of its
+        records already returned, as found in the I(offsets) of the job
+        returned by the previous call.
+      - Set to an empty dictionary to start following a job from the first
+        record of each ddname.
+      - A ddname with no new records is not read from the spool.
+    type: dict
+    required: false
+  content_format:
+    description:
+      - The format the ddname content is returned in.
+      - C(lines) returns the content of each ddname as a list of lines in
+        I(content).
+      - C(gzip_base64) returns the content of each ddname as a single gzip
+        compressed, base64 encoded string in I(content_gzip_base64) instead,
+        which reduces the size of the module result for large job output.
+        Filter C(ibm.ibm_zos_core.decompress_content) restores the I(content)
+        lines on the controller.
     type: str
     required: false
+    default: lines
+    choices:
+      - lines
+      - gzip_base64
+  cache_dir:
+    description:
+      - A USS directory on the managed node used to cache the output of
+        completed jobs, the cache is only used when I(job_id) is a single job ID.
+      - The spool of a job that ended with a CC, an ABEND, a JCL error or was
+        canceled no longer changes, later requests for the same job output
+        only list the job instead of reading its spool again.
+      - Active jobs are never cached and the cached output of a job is removed
+        once the job is purged.
+      - The directory is created when it does not exist. When not set, no
+        cache is used.
+    type: path
+    required: false
+  cache_max_mb:
+    description:
+      - The maximum size in megabytes of I(cache_dir), the least recently
+        used job output is removed once it is exceeded.
+    type: int
+    required: false
+    default: 64
+  dest:
+    description:
+      - A directory on the controller to write the content of the selected
+        ddnames to, instead of returning it in the module result.
+      - Each ddname is written on the managed node to a file in a temporary
+        USS directory, the files of all the jobs are then transferred to the
+        controller in a single SFTP transfer and the temporary directory is
+        removed.
+      - The files are written to I(dest)/<inventory_hostname>/<job_id>/ and
+        named <stepname>.<ddname>.<id>.txt, an existing file with the same
+        name is replaced.
+      - The I(content) of the ddnames is not returned, each ddname returns
+        the I(dest) path and the I(checksum) of its file instead, the
+        checksum is verified once the file is on the controller.
+      - Can not be used with I(return_content=false) or I(search).
+    type: path
+    required: false
+  ignore_sftp_stderr:
+    description:
+      - During data transfer through SFTP, the module fails if the SFTP command
+        directs any content to stderr. The user is able to override this
+        behavior by setting this parameter to C(true). By doing so, the module
+        would essentially ignore the stderr stream produced by SFTP and continue
+        execution.
+      - Only used when I(dest) is set.
+      - When Ansible verbosity is set to greater than 3, either through the
+        command line interface (CLI) using B(-vvvv) or through environment
+        variables such as B(verbosity = 4), then this parameter will
+        automatically be set to C(true).
+    type: bool
+    required: false
+    default: false
+notes:
+  - When I(max_lines), I(tail_lines), I(max_bytes) or I(offsets) are set, the
+    I(class), I(subsystem) and I(steps) in I(ret_code) are parsed from the
+    returned content only.
+  - When I(dest) is set, the files are written on the managed node in the
+    temporary directory of the remote user, there must be enough space in it
+    for the content of all the selected ddnames.
+  - When I(dest) is set, the files are transferred with SFTP, so SFTP must be
+    enabled on the managed node.
 """
 
 EXAMPLES = r"""
@@ -79,6 +223,62 @@ EXAMPLES = r"""
     job_name: "*"
     owner: "IBMUSER"
     ddname: "?"
+
+- name: Job output for only the JESMSGLG and JESYSMSG ddnames
+  zos_job_output:
+    job_id: "JOB02560"
+    ddname:
+      - "JESMSGLG"
+      - "JESYSMSG"
+
+- name: List the ddnames, record and byte counts of a job without reading its content
+  zos_job_output:
+    job_id: "JOB02560"
+    return_content: false
+
+- name: Search the job output for step completion and abend messages
+  zos_job_output:
+    job_id: "JOB02560"
+    search:
+      - "IEF142I"
+      - "ABEND"
+    search_context: 2
+
+- name: Follow the output of an active job, returning only new records
+  zos_job_output:
+    job_id: "JOB02560"
+    ddname:
+      - "JESMSGLG"
+      - "SYSPRINT"
+    offsets: "{{ previous_output.jobs[0].offsets | default({}) }}"
+  register: previous_output
+
+- name: Compressed job output, decompressed on the controller when needed
+  zos_job_output:
+    job_id: "JOB02560"
+    content_format: gzip_base64
+  register: job_output
+
+- name: Print the JESMSGLG of the compressed job output
+  debug:
+    msg: "{{ (job_output.jobs | ibm.ibm_zos_core.decompress_content)[0].ddnames[0].content }}"
+
+- name: Job output of a completed job, cached for later requests
+  zos_job_output:
+    job_id: "JOB02560"
+    cache_dir: /tmp/ansible-job-output-cache
+
+- name: Archive the output of a job on the controller without returning its content
+  zos_job_output:
+    job_id: "JOB02560"
+    dest: /var/log/zos/jobs
+
+- name: Job output with only the last 100 lines of SYSPRINT, up to 64 KB
+  zos_job_output:
+    job_id: "JOB02560"
+    ddname: "SYSPRINT"
+    tail_lines: 100
+    max_bytes: 65536
 """
 
 RETURN = r"""
@@ -154,9 +354,56 @@ jobs:
               Byte size in a print data set.
           type: int
           sample: 574
+        truncated:
+          description:
+             Whether the ddname content was cut by I(max_lines), I(tail_lines)
+             or I(max_bytes), the I(record_count) and I(byte_count) are those
+             of the whole ddname.
+             Only returned when one of those options is set.
+          type: bool
+          sample: false
+        offset:
+          description:
+             The number of records skipped at the start of the ddname.
+             Only returned when I(offsets) is set.
+          type: int
+          sample: 17
+        next_offset:
+          description:
+             The number of records of the ddname returned so far, the offset
+             to continue from in the next call.
+             Only returned when I(offsets) is set.
+          type: int
+          sample: 19
+        dest:
+          description:
+             The path of the file on the controller holding the ddname content.
+             Only returned when I(dest) is set, in place of I(content).
+          type: str
+          sample: /var/log/zos/jobs/zos_host/JOB00134/STEP0001.SYSPRINT.102.txt
+        checksum:
+          description:
+             The SHA256 checksum of the file holding the ddname content.
+             Only returned when I(dest) is set.
+          type: str
+          sample: 8d320d5f68b048fc97559d771ede68b37a71e8374d1d678d96dcfa2b2da7a64e
+        content_gzip_base64:
+          description:
+             The ddname content, gzip compressed and base64 encoded.
+             Only returned when I(content_format=gzip_base64), in place of I(content).
+          type: str
+          sample: H4sIAAAAAAACA/NIzcnJVyjPL8pJAQBSntaLCwAAAA==
+        content_format:
+          description:
+             The format of the ddname content.
+             Only returned when I(content_format=gzip_base64).
+          type: str
+          sample: gzip_base64
         content:
           description:
              The ddname content.
+             Not returned when I(return_content=false), I(search) or I(dest)
+             is set.
           type: list
           elements: str
           sample:
@@ -175,6 +422,55 @@ jobs:
                "         6 //SYSUT2   DD SYSOUT=*                                                          ",
                "         7 //                                                                              "
              ]
+    offsets:
+      description:
+         The I(next_offset) of each ddname by its I(id), to pass as I(offsets)
+         to the next call.
+         Only returned when I(offsets) is set.
+      type: dict
+      sample: {"2": 19, "4": 22}
+    matches:
+      description:
+         The lines matching I(search), in the order of the ddnames.
+         Only returned when I(search) is set.
+      type: list
+      elements: dict
+      contains:
+        ddname:
+          description:
+             Data definition name the line was found in.
+          type: str
+          sample: JESYSMSG
+        stepname:
+          description:
+             The step name of the ddname the line was found in.
+          type: str
+          sample: JES2
+        line_number:
+          description:
+             The line number within the ddname, starting at 1, also counting
+             the records skipped by I(offsets).
+          type: int
+          sample: 7
+        line:
+          description:
+             The matching line.
+          type: str
+          sample: " IEF142I HELLO STEP0001 - STEP WAS EXECUTED - COND CODE 0000"
+        before:
+          description:
+             The lines before the matching line.
+             Only returned when I(search_context) is greater than 0.
+          type: list
+          elements: str
+          sample: [" IEF237I JES2 ALLOCATED TO SYSUT2"]
+        after:
+          description:
+             The lines after the matching line.
+             Only returned when I(search_context) is greater than 0.
+          type: list
+          elements: str
+          sample: [" IEF285I   OMVSADM.HELLO.JOB00134.D0000102.?            SYSOUT"]
     ret_code:
       description:
          Return code output collected from job log.
@@ -217,6 +513,55 @@ jobs:
                 The CC returned for this step in the DD section.
               type: int
               sample: 0
+        abends:
+          description:
+            The ABENDs reported in the job log, one for each step that ended
+            abnormally.
+          type: list
+          elements: dict
+          contains:
+            step_name:
+              description:
+                Name of the step that ended abnormally.
+              type: str
+              sample: "STEP0001"
+            procstep:
+              description:
+                Name of the procedure step that ended abnormally, when the
+                step runs a procedure.
+              type: str
+              sample: "PROC1"
+            system_code:
+              description:
+                The system completion code of the ABEND.
+              type: str
+              sample: "S0C4"
+            user_code:
+              description:
+                The user completion code of the ABEND.
+              type: str
+              sample: "U0000"
+            reason:
+              description:
+                The reason code of the ABEND, when one is reported.
+              type: str
+              sample: "00000004"
+        jcl_errors:
+          description:
+            The JCL error messages reported in the job log.
+          type: list
+          elements: dict
+          contains:
+            msg_id:
+              description:
+                The ID of the message reporting the JCL error.
+              type: str
+              sample: "IEFC605I"
+            msg_txt:
+              description:
+                The text of the message reporting the JCL error.
+              type: str
+              sample: "UNIDENTIFIED OPERATION FIELD"
       sample:
         ret_code: {
          "code": 0,
@@ -358,6 +703,13 @@ jobs:
         "subsystem": "STL1"
       }
   ]
+dest:
+    description:
+      The directory on the controller the files holding the ddname content
+      were written to.
+    returned: success and I(dest) is set
+    type: str
+    sample: /var/log/zos/jobs/zos_host
 changed:
     description:
       Indicates if any changes were made during module operation
@@ -370,6 +722,51 @@ from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.ibm.ibm_zos_core.plugins.module_utils.job import (
     job_output,
 )
+from ansible_collections.ibm.ibm_zos_core.plugins.module_utils.content_format import (
+    CONTENT_FORMATS,
+    format_job_content,
+)
+from hashlib import sha256
+import os
+import re
+import shutil
+import tempfile
+
+
+def write_job_content(jobs, directory):
+    """Write the content of each DD of the jobs to a file, the content is
+    replaced in each DD by the path of its file relative to the directory and
+    the checksum of the file.
+
+    Arguments:
+        jobs {list[dict]} -- The jobs returned by job_output.
+        directory {str} -- The directory the files are written to, each job
+                           has its own subdirectory named after its job ID.
+
+    Returns:
+        list[dict] -- The updated jobs.
+    """
+    for job in jobs:
+        for dd in job.get("ddnames") or []:
+            if "content" not in dd:
+                continue
+            name = "{0}.{1}.{2}.txt".format(dd.get("stepname"), dd.get("ddname"), dd.get("id"))
+            dd_path = os.path.join(_safe_file_name(job["job_id"]), _safe_file_name(name))
+            job_dir = os.path.join(directory, os.path.dirname(dd_path))
+            if not os.path.isdir(job_dir):
+                os.makedirs(job_dir)
+
+            content = "\n".join(dd.pop("content")).encode("utf-8")
+            with open(os.path.join(directory, dd_path), "wb") as dd_file:
+                dd_file.write(content)
+            dd["dest"] = dd_path
+            dd["checksum"] = sha256(content).hexdigest()
+    return jobs
+
+
+def _safe_file_name(name):
+    # Step names can be missing and DD names come from the JCL, keep them to one path component
+    return re.sub(r"[^\w#@$.-]", "_", str(name))
 
 
 def run_module():
@@ -377,24 +774,71 @@ def run_module():
         job_id=dict(type="str", required=False),
         job_name=dict(type="str", required=False),
         owner=dict(type="str", required=False),
-        ddname=dict(type="str", required=False),
+        ddname=dict(type="list", elements="str", required=False),
+        return_content=dict(type="bool", required=False, default=True),
+        max_lines=dict(type="int", required=False),
+        tail_lines=dict(type="int", required=False),
+        max_bytes=dict(type="int", required=False),
+        search=dict(type="list", elements="str", required=False),
+        search_context=dict(type="int", required=False, default=0),
+        offsets=dict(type="dict", required=False),
+        content_format=dict(type="str", required=False, default="lines", choices=CONTENT_FORMATS),
+        cache_dir=dict(type="path", required=False),
+        cache_max_mb=dict(type="int", required=False, default=64),
+        dest=dict(type="path", required=False),
+        ignore_sftp_stderr=dict(type="bool", required=False, default=False),
     )
 
-    module = AnsibleModule(argument_spec=module_args, supports_check_mode=True)
+    module = AnsibleModule(
+        argument_spec=module_args,
+        mutually_exclusive=[["max_lines", "tail_lines"], ["dest", "search"]],
+        supports_check_mode=True
+    )
 
     job_id = module.params.get("job_id")
     job_name = module.params.get("job_name")
     owner = module.params.get("owner")
     ddname = module.params.get("ddname")
+    return_content = module.params.get("return_content")
+    max_lines = module.params.get("max_lines")
+    tail_lines = module.params.get("tail_lines")
+    max_bytes = module.params.get("max_bytes")
+    search = module.params.get("search")
+    search_context = module.params.get("search_context")
+    offsets = module.params.get("offsets")
+    content_format = module.params.get("content_format")
+    cache_dir = module.params.get("cache_dir")
+    cache_max_mb = module.params.get("cache_max_mb")
+    dest = module.params.get("dest")
 
     if not job_id and not job_name and not owner:
         module.fail_json(msg="Please provide a job_id or job_name or owner")
 
+    if cache_max_mb <= 0:
+        module.fail_json(msg="The value for option `cache_max_mb` must be greater than 0.")
+
+    if dest and not return_content:
+        module.fail_json(msg="The option `dest` can not be used with `return_content=false`.")
+
+    remote_path = None
     try:
         results = {}
-        results["jobs"] = job_output(job_id=job_id, owner=owner, job_name=job_name, dd_name=ddname)
+        jobs = job_output(job_id=job_id, owner=owner, job_name=job_name, dd_name=ddname,
+                          dd_content=return_content, max_lines=max_lines,
+                          tail_lines=tail_lines, max_bytes=max_bytes, search=search,
+                          search_context=search_context, cache_dir=cache_dir,
+                          cache_max_bytes=cache_max_mb * 1024 * 1024, dd_offsets=offsets)
+        if dest:
+            # The action plugin transfers the directory to dest, then removes it
+            remote_path = tempfile.mkdtemp(prefix="ansible-zos-job-output-")
+            results["jobs"] = write_job_content(jobs, remote_path)
+            results["remote_path"] = remote_path
+        else:
+            results["jobs"] = format_job_content(jobs, content_format)
         results["changed"] = False
     except Exception as e:
+        if remote_path is not None:
+            shutil.rmtree(remote_path, ignore_errors=True)
         module.fail_json(msg=repr(e))
 
     module.exit_json(**results)
@@ -295,13 +295,14 @@ def validate_arguments(params):
 
 def query_jobs(job_name, job_id, owner):
 
+    # Only the job listing is needed to report the status, skip reading the DDs
     jobs = []
     if job_id:
-        jobs = job_status(job_id=job_id)
+        jobs = job_status(job_id=job_id, dd_scan=False)
     elif owner:
-        jobs = job_status(owner=owner, job_name=job_name)
+        jobs = job_status(owner=owner, job_name=job_name, dd_scan=False)
     else:
-        jobs = job_status(job_name=job_name)
+        jobs = job_status(job_name=job_name, dd_scan=False)
     if not jobs:
         raise RuntimeError("List FAILED! no such job was found.")
     return jobs
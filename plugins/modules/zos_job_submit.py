@@ -32,7 +32,7 @@ description:
 version_added: "1.0.0"
 options:
   src:
-    required: true
+    required: false
     type: str
     description:
       - The source file or data set containing the JCL to submit.
@@ -41,6 +41,44 @@ options:
       - Or a USS file. (e.g "/u/tester/demo/sample.jcl")
       - Or a LOCAL file in ansible control node.
         (e.g "/User/tester/ansible-playbook/sample.jcl")
+      - Required unless I(batch) is used, mutually exclusive with I(batch).
+  batch:
+    required: false
+    type: list
+    elements: dict
+    description:
+      - Submit the JCL of many sources in a single module call.
+      - All the JCL is submitted up front, then every submitted job is waited
+        for up to I(wait_time_s) seconds with a single listing of the jobs
+        per poll, the output of each job is collected as soon as it completes.
+      - Mutually exclusive with I(src).
+      - I(location=LOCAL) is not supported with I(batch).
+    suboptions:
+      src:
+        required: true
+        type: str
+        description:
+          - The data set or USS file containing the JCL to submit.
+      location:
+        required: false
+        type: str
+        choices:
+          - DATA_SET
+          - USS
+        description:
+          - The JCL location, defaults to the value of the task I(location).
+      volume:
+        required: false
+        type: str
+        description:
+          - The volume serial where the data set resides, defaults to the value
+            of the task I(volume).
+      max_rc:
+        required: false
+        type: int
+        description:
+          - The maximum return code allowed for any job step of this job,
+            defaults to the value of the task I(max_rc).
   location:
     required: false
     default: DATA_SET
@@ -74,8 +112,12 @@ options:
         L(zos_job_submit,./zos_job_submit.html) will wait for a submitted job
         to complete. The time begins when the module is executed on the managed
         node.
-      - I(wait_time_s) is measured in seconds and must be a value greater than 0
-        and less than 86400.
+      - I(wait_time_s) is measured in seconds and must be a value greater than
+        or equal to 0 and less than 86400.
+      - When I(wait_time_s=0), the module returns as soon as the job is
+        submitted with the job ID and its current status, without the job
+        output. Use module L(zos_job_wait,./zos_job_wait.html) to wait for
+        the job to complete.
   max_rc:
     required: false
     type: int
@@ -98,6 +140,21 @@ options:
         catalog the data set for the volume serial. If it is not able to, the
         module will fail.
       - Ignored for I(location=USS) and I(location=LOCAL).
+  content_format:
+    required: false
+    default: lines
+    type: str
+    choices:
+      - lines
+      - gzip_base64
+    description:
+      - The format the DD content of the jobs is returned in.
+      - C(lines) returns the content of each DD as a list of lines in I(content).
+      - C(gzip_base64) returns the content of each DD as a single gzip
+        compressed, base64 encoded string in I(content_gzip_base64) instead,
+        which reduces the size of the module result for large job output.
+        Filter C(ibm.ibm_zos_core.decompress_content) restores the I(content)
+        lines on the controller.
   encoding:
     description:
       - Specifies which encoding the local JCL file should be converted from
@@ -196,6 +253,18 @@ jobs:
               Byte size in a print data set.
           type: int
           sample: 574
+        content_gzip_base64:
+          description:
+             The ddname content, gzip compressed and base64 encoded.
+             Only returned when I(content_format=gzip_base64), in place of I(content).
+          type: str
+          sample: H4sIAAAAAAACA/NIzcnJVyjPL8pJAQBSntaLCwAAAA==
+        content_format:
+          description:
+             The format of the ddname content.
+             Only returned when I(content_format=gzip_base64).
+          type: str
+          sample: gzip_base64
         content:
           description:
              The ddname content.
@@ -264,6 +333,55 @@ jobs:
                 The CC returned for this step in the DD section.
               type: int
               sample: 0
+        abends:
+          description:
+            The ABENDs reported in the job log, one for each step that ended
+            abnormally.
+          type: list
+          elements: dict
+          contains:
+            step_name:
+              description:
+                Name of the step that ended abnormally.
+              type: str
+              sample: "STEP0001"
+            procstep:
+              description:
+                Name of the procedure step that ended abnormally, when the
+                step runs a procedure.
+              type: str
+              sample: "PROC1"
+            system_code:
+              description:
+                The system completion code of the ABEND.
+              type: str
+              sample: "S0C4"
+            user_code:
+              description:
+                The user completion code of the ABEND.
+              type: str
+              sample: "U0000"
+            reason:
+              description:
+                The reason code of the ABEND, when one is reported.
+              type: str
+              sample: "00000004"
+        jcl_errors:
+          description:
+            The JCL error messages reported in the job log.
+          type: list
+          elements: dict
+          contains:
+            msg_id:
+              description:
+                The ID of the message reporting the JCL error.
+              type: str
+              sample: "IEFC605I"
+            msg_txt:
+              description:
+                The text of the message reporting the JCL error.
+              type: str
+              sample: "UNIDENTIFIED OPERATION FIELD"
       sample:
         ret_code: {
           "code": 0,
@@ -492,6 +610,36 @@ jobs:
               "subsystem": "STL1"
           }
      ]
+batch:
+  description:
+     The outcome of every item of I(batch), in the order the items were given.
+     The output of the jobs is returned in I(jobs).
+  returned: when I(batch) is used
+  type: list
+  elements: dict
+  contains:
+    src:
+      description: The source of the JCL submitted.
+      type: str
+      sample: HLQ.DATA.LLQ(SAMPLE)
+    job_id:
+      description: The z/OS job ID of the submitted job, null when the submission failed.
+      type: str
+      sample: JOB00134
+    changed:
+      description: Whether the job completed with a return code of 0.
+      type: bool
+      sample: true
+    failed:
+      description:
+        Whether the job submission failed, the job did not complete within
+        I(wait_time_s) or its return code is greater than the allowed I(max_rc).
+      type: bool
+      sample: false
+    msg:
+      description: The reason the item failed, empty when it did not fail.
+      type: str
+      sample: ""
 message:
   description: This option is being deprecated
   returned: success
@@ -543,6 +691,35 @@ EXAMPLES = r"""
     src: HLQ.DATA.LLQ
     location: DATA_SET
     max_rc: 16
+
+- name: Submit JCL without waiting for the job to complete.
+  zos_job_submit:
+    src: HLQ.DATA.LLQ(LONGRUN)
+    location: DATA_SET
+    wait_time_s: 0
+  register: submitted
+
+- name: Submit JCL with the job output compressed, then restore it on the controller.
+  zos_job_submit:
+    src: HLQ.DATA.LLQ(SAMPLE)
+    location: DATA_SET
+    content_format: gzip_base64
+  register: response
+
+- name: Print the job output of the compressed response.
+  debug:
+    msg: "{{ (response | ibm.ibm_zos_core.decompress_content).jobs[0].ddnames }}"
+
+- name: Submit many jobs at once and wait up to 60 seconds for all of them.
+  zos_job_submit:
+    batch:
+      - src: HLQ.DATA.LLQ(JOB1)
+      - src: HLQ.DATA.LLQ(JOB2)
+        max_rc: 4
+      - src: /u/tester/demo/sample.jcl
+        location: USS
+    location: DATA_SET
+    wait_time_s: 60
 """
 
 from ansible_collections.ibm.ibm_zos_core.plugins.module_utils.encode import (
@@ -553,6 +730,14 @@ from ansible_collections.ibm.ibm_zos_core.plugins.module_utils.better_arg_parser
 )
 from ansible_collections.ibm.ibm_zos_core.plugins.module_utils.job import (
     job_output,
+    job_status,
+    is_job_complete,
+    poll_jobs,
+    JobPoller,
+)
+from ansible_collections.ibm.ibm_zos_core.plugins.module_utils.content_format import (
+    CONTENT_FORMATS,
+    format_job_content,
 )
 from ansible_collections.ibm.ibm_zos_core.plugins.module_utils.import_handler import (
     MissingZOAUImport,
@@ -568,7 +753,6 @@ from ansible.module_utils.six import PY3
 from timeit import default_timer as timer
 from tempfile import NamedTemporaryFile
 from os import remove
-from time import sleep
 import re
 
 try:
@@ -589,7 +773,6 @@ else:
 
 
 JOB_COMPLETION_MESSAGES = frozenset(["CC", "ABEND", "SEC ERROR", "JCL ERROR", "JCLERR"])
-JOB_ERROR_MESSAGES = frozenset(["ABEND", "SEC ERROR", "SEC", "JCL ERROR", "JCLERR"])
 MAX_WAIT_TIME_S = 86400
 
 
@@ -602,7 +785,8 @@ def submit_src_jcl(module, src, src_name=None, timeout=0, hfs=True, volume=None,
                             - Data set, can be PS, PDS, PDSE Member
             src_name (str)  - the src name that was provided in the module because through
                               the runtime src could be replace with a temporary file name
-            timeout (int)   - how long to wait in seconds for a job to complete
+            timeout (int)   - how long to wait in seconds for a job to complete, 0 to
+                              return as soon as the job is submitted
             hfs (boolean)   - True if JCL is a file in USS, otherwise False; Note that all
                               JCL local to a controller is transfered to USS thus would be
                               True
@@ -616,12 +800,14 @@ def submit_src_jcl(module, src, src_name=None, timeout=0, hfs=True, volume=None,
             duration          - how long the job ran for in this method
     """
 
+    # A wait_time_s of 0 only submits the job, its completion is not waited for
+    wait = timeout > 0
     kwargs = {
-        "timeout": timeout,
         "hfs": hfs,
     }
+    if wait:
+        kwargs["timeout"] = timeout
 
-    wait = True  # Wait is always true because the module requires wait_time_s > 0
     present = False
     duration = 0
     job_submitted = None
@@ -644,33 +830,14 @@ def submit_src_jcl(module, src, src_name=None, timeout=0, hfs=True, volume=None,
 
         job_submitted = jobs.submit(src, wait, None, **kwargs)
 
-        # Introducing a sleep to ensure we have the result of job sumbit carrying the job id
-        while (job_submitted is None and duration <= timeout):
-            current_time = timer()
-            duration = round(current_time - start_time)
-            sleep(0.5)
-
-        # Second sleep is to wait long enough for the job rc to not equal a `?`
-        # which is what ZOAU sends back, opitonally we can check the 'status' as
-        # that is sent back as `AC` when the job is not complete but the problem
-        # with monitoring 'AC' is that STARTED tasks never exit the AC status.
-        if job_submitted:
-            job_listing_rc = jobs.listing(job_submitted.id)[0].rc
-            job_listing_status = jobs.listing(job_submitted.id)[0].status
-
-            # Before moving forward lets ensure our job has completed but if we see
-            # status that matches one in JOB_ERROR_MESSAGES, don't wait, let the code
-            # drop through and get analyzed in the main as it will scan the job ouput
-            # Any match to JOB_ERROR_MESSAGES ends our processing and wait times
-            while (job_listing_status not in JOB_ERROR_MESSAGES and
-                    job_listing_status == 'AC' and
-                    ((job_listing_rc is None or len(job_listing_rc) == 0 or
-                      job_listing_rc == '?') and duration < timeout)):
-                current_time = timer()
-                duration = round(current_time - start_time)
-                sleep(1)
-                job_listing_rc = jobs.listing(job_submitted.id)[0].rc
-                job_listing_status = jobs.listing(job_submitted.id)[0].status
+        # Wait long enough for the job rc to not equal a `?` which is what ZOAU
+        # sends back, opitonally we can check the 'status' as that is sent back
+        # as `AC` when the job is not complete but the problem with monitoring
+        # 'AC' is that STARTED tasks never exit the AC status.
+        if job_submitted and wait:
+            poller = JobPoller(timeout=timeout, start_time=start_time)
+            poller.poll(lambda: jobs.listing(job_submitted.id)[0], is_job_complete)
+            duration = poller.duration
 
     # ZOAU throws a ZOAUException when the job sumbission fails thus there is no
     # JCL RC to share with the user, if there is a RC, that will be processed
@@ -728,9 +895,133 @@ def submit_src_jcl(module, src, src_name=None, timeout=0, hfs=True, volume=None,
     return job_submitted.id if job_submitted else None, duration
 
 
+def submit_batch_jcl(module, batch, return_output=True, timeout=0, start_time=timer()):
+    """Submit the JCL of every batch item up front, then wait for all the
+    submitted jobs with a single poller that lists them once per poll, the
+    output of each job is collected as soon as it completes.
+
+        Arguments:
+            module - module instance to access the module api
+            batch (list)          - the batch items, each with a src, location,
+                                    volume and max_rc
+            return_output (bool)  - whether to keep the DD output in the result
+            timeout (int)         - how long to wait in seconds for all the jobs to complete
+            start_time            - time the JCL started its submission
+
+        Returns:
+            result (dict)  - the module result, 'jobs' holds the output of every
+                             job and 'batch' the outcome of every batch item
+    """
+    result = dict(changed=False, failed=False, jobs=[], batch=[])
+    submitted = []
+    owners = set()
+
+    for item in batch:
+        src = item.get("src")
+        item_result = dict(src=src, job_id=None, changed=False, failed=False, msg="")
+        result["batch"].append(item_result)
+
+        try:
+            if item.get("location") == "DATA_SET" and item.get("volume") is not None:
+                present, changed = DataSet.attempt_catalog_if_necessary(
+                    data_set.extract_dsname(src), [item.get("volume")])
+                if not present:
+                    item_result["failed"] = True
+                    item_result["msg"] = ("Unable to submit job {0} because the data set could "
+                                          "not be cataloged on the volume {1}.".format(src, item.get("volume")))
+                    continue
+
+            # Do not wait on the submission, all the jobs are polled together below
+            kwargs = {"hfs": item.get("location") == "USS"}
+            if timeout:
+                kwargs["timeout"] = timeout
+            job_submitted = jobs.submit(src, False, None, **kwargs)
+        except Exception as err:
+            item_result["failed"] = True
+            item_result["msg"] = ("Unable to submit job {0}, the job submission has "
+                                  "failed: {1}".format(src, str(err)))
+            continue
+
+        item_result["job_id"] = job_submitted.id
+        submitted.append((item, item_result))
+        owners.add(job_submitted.owner)
+
+    outputs = {}
+    output_errors = {}
+
+    def collect_output(job_listing):
+        try:
+            outputs[job_listing.id] = job_output(
+                job_id=job_listing.id, owner=None, job_name=None, dd_name=None,
+                duration=round(timer() - start_time), timeout=timeout, start_time=start_time)
+        except Exception as err:
+            output_errors[job_listing.id] = str(err)
+
+    if submitted and timeout:
+        # The jobs are listed by the submitting user rather than the whole spool
+        poll_jobs([item_result["job_id"] for item, item_result in submitted],
+                  is_job_complete, timeout=timeout, start_time=start_time,
+                  owner=owners.pop() if len(owners) == 1 else None,
+                  on_done=collect_output)
+
+    result["duration"] = round(timer() - start_time)
+
+    for item, item_result in submitted:
+        job_id = item_result["job_id"]
+        job_result = {}
+
+        try:
+            if job_id in output_errors:
+                raise Exception(output_errors[job_id])
+
+            if not timeout:
+                # The job is not waited for, only its current status is returned
+                job_result["jobs"] = job_status(job_id=job_id, dd_scan=False)
+                item_result["changed"] = True
+
+            elif job_id not in outputs:
+                # Still running once wait_time_s has passed, report its current status
+                job_result["jobs"] = job_output(
+                    job_id=job_id, owner=None, job_name=None, dd_name=None,
+                    duration=result["duration"], timeout=timeout, start_time=start_time)
+                raise Exception(
+                    "The JCL submitted with job id {0} but appears to be a long "
+                    "running job that exceeded its maximum wait time of {1} "
+                    "second(s).".format(job_id, str(timeout)))
+
+            else:
+                item_result["changed"] = assert_job_output(
+                    outputs[job_id], item.get("max_rc"), return_output, job_result)
+        except Exception as err:
+            item_result["failed"] = True
+            item_result["msg"] = str(err)
+
+        result["jobs"].extend(job_result.get("jobs") or [])
+
+    failed_count = len([item_result for item_result in result["batch"] if item_result["failed"]])
+    result["changed"] = any(item_result["changed"] for item_result in result["batch"])
+    if failed_count:
+        result["failed"] = True
+        result["msg"] = ("{0} of the {1} jobs in the batch failed, review the 'batch' "
+                         "results for further details.".format(failed_count, len(batch)))
+
+    return result
+
+
 def run_module():
     module_args = dict(
-        src=dict(type="str", required=True),
+        src=dict(type="str", required=False),
+        batch=dict(
+            type="list",
+            elements="dict",
+            required=False,
+            options=dict(
+                src=dict(type="str", required=True),
+                location=dict(type="str", required=False, choices=["DATA_SET", "USS"]),
+                volume=dict(type="str", required=False),
+                max_rc=dict(type="int", required=False),
+            ),
+        ),
         wait=dict(type="bool", required=False, default=False,
                   removed_at_date='2022-11-30',
                   removed_from_collection='ibm.ibm_zos_core'),
@@ -760,9 +1051,15 @@ def run_module():
         wait_time_s=dict(type="int", default=10),
         max_rc=dict(type="int", required=False),
         temp_file=dict(type="path", required=False),
+        content_format=dict(type="str", required=False, default="lines", choices=CONTENT_FORMATS),
     )
 
-    module = AnsibleModule(argument_spec=module_args, supports_check_mode=True)
+    module = AnsibleModule(
+        argument_spec=module_args,
+        mutually_exclusive=[["src", "batch"]],
+        required_one_of=[["src", "batch"]],
+        supports_check_mode=True,
+    )
 
     if module.params.get("encoding"):
         module.params.update(
@@ -780,7 +1077,18 @@ def run_module():
         )
 
     arg_defs = dict(
-        src=dict(arg_type="data_set_or_path", required=True),
+        src=dict(arg_type="data_set_or_path", required=False),
+        batch=dict(
+            arg_type="list",
+            elements="dict",
+            required=False,
+            options=dict(
+                src=dict(arg_type="data_set_or_path", required=True),
+                location=dict(arg_type="str", required=False, choices=["DATA_SET", "USS"]),
+                volume=dict(arg_type="volume", required=False),
+                max_rc=dict(arg_type="int", required=False),
+            ),
+        ),
         wait=dict(arg_type="bool", required=False, removed_at_date='2022-11-30',
                   removed_from_collection='ibm.ibm_zos_core'),
         location=dict(
@@ -798,6 +1106,7 @@ def run_module():
         wait_time_s=dict(arg_type="int", required=False, default=10),
         max_rc=dict(arg_type="int", required=False),
         temp_file=dict(arg_type="path", required=False),
+        content_format=dict(arg_type="str", default="lines", choices=CONTENT_FORMATS),
     )
 
     # ********************************************************************
@@ -816,6 +1125,7 @@ def run_module():
     volume = parsed_args.get("volume")
     parsed_args.get("wait")
     src = parsed_args.get("src")
+    batch = parsed_args.get("batch")
     return_output = parsed_args.get("return_output")
     wait_time_s = parsed_args.get("wait_time_s")
     max_rc = parsed_args.get("max_rc")
@@ -823,17 +1133,38 @@ def run_module():
     to_encoding = parsed_args.get("to_encoding")
     # temporary file names for copied files when user sets location to LOCAL
     temp_file = parsed_args.get("temp_file")
+    content_format = parsed_args.get("content_format")
     temp_file_encoded = None
 
     # Default 'changed' is False in case the module is not able to execute
     result = dict(changed=False)
 
-    if wait_time_s <= 0 or wait_time_s > MAX_WAIT_TIME_S:
+    if wait_time_s < 0 or wait_time_s > MAX_WAIT_TIME_S:
         result["failed"] = True
         result["msg"] = ("The value for option `wait_time_s` is not valid, it must "
-                         "be greater than 0 and less than {0}.".format(str(MAX_WAIT_TIME_S)))
+                         "be 0 or greater and less than {0}.".format(str(MAX_WAIT_TIME_S)))
         module.fail_json(**result)
 
+    if batch:
+        if location == "LOCAL":
+            result["failed"] = True
+            result["msg"] = ("Option `batch` does not support location LOCAL, the "
+                             "JCL must be in a data set or in USS.")
+            module.fail_json(**result)
+
+        # Batch items inherit the location, volume and max_rc of the task
+        for item in batch:
+            for option, value in (("location", location), ("volume", volume), ("max_rc", max_rc)):
+                if item.get(option) is None:
+                    item[option] = value
+
+        result = submit_batch_jcl(module, batch, return_output=return_output,
+                                  timeout=wait_time_s, start_time=timer())
+        format_job_content(result.get("jobs"), content_format)
+        if result.get("failed"):
+            module.fail_json(**result)
+        module.exit_json(**result)
+
     if temp_file:
         temp_file_encoded = NamedTemporaryFile(delete=True)
 
@@ -877,6 +1208,13 @@ def run_module():
         # used and return undersirable results
         job_output_txt = None
 
+        if wait_time_s == 0:
+            # The job is not waited for, only its current status is returned
+            result["jobs"] = job_status(job_id=job_submitted_id, dd_scan=False)
+            result["duration"] = duration
+            result["changed"] = True
+            module.exit_json(**result)
+
         job_output_txt = job_output(
             job_id=job_submitted_id, owner=None, job_name=None, dd_name=None,
             duration=duration, timeout=wait_time_s, start_time=start_time)
@@ -895,59 +1233,10 @@ def run_module():
                 "a long running job or increase option 'wait_times_s` to a value "
                 "greater than {2}.".format(
                     str(job_submitted_id), str(wait_time_s), str(duration)))
+            format_job_content(result.get("jobs"), content_format)
             module.exit_json(**result)
 
-        # Job has submitted, the module changed the managed node
-        is_changed = True
-
-        if job_output_txt:
-            result["jobs"] = job_output_txt
-            job_ret_code = job_output_txt[0].get("ret_code")
-
-            if job_ret_code:
-                job_msg = job_ret_code.get("msg")
-                job_code = job_ret_code.get("code")
-
-                # retcode["msg"] should never be empty where a retcode["code"] can be None,
-                # "msg" could  be an ABEND which has no corresponding "code"
-                if job_msg is None:
-                    _msg = ("Unable to find a 'msg' in the 'ret_code' dictionary, "
-                            "please review the job log.")
-                    result["stderr"] = _msg
-                    raise Exception(_msg)
-
-                if return_output is True and max_rc is not None:
-                    is_changed = assert_valid_return_code(max_rc, job_code, job_ret_code)
-
-                if re.search("^(?:{0})".format("|".join(JOB_COMPLETION_MESSAGES)), job_msg):
-                    # If the job_msg doesn't have a CC, it is an improper completion (error/abend)
-                    if re.search("^(?:CC)", job_msg) is None:
-                        _msg = ("The job completion code (CC) was not in the job log. "
-                                "Please review the error {0} and the job log.".format(job_msg))
-                        result["stderr"] = _msg
-                        raise Exception(_msg)
-
-                if job_code is None:
-                    raise Exception("The job return code was not available in the job log, "
-                                    "please review the job log and error {0}.".format(job_msg))
-
-                if job_code != 0 and max_rc is None:
-                    raise Exception("The job return code {0} was non-zero in the "
-                                    "job output, this job has failed.".format(str(job_code)))
-
-                if not return_output:
-                    for job in result.get("jobs", []):
-                        job["ddnames"] = []
-            else:
-                _msg = "The 'ret_code' dictionary was unavailable in the job log."
-                result["ret_code"] = None
-                result["stderr"] = _msg
-                raise Exception(_msg)
-        else:
-            _msg = "The job output log is unavailable."
-            result["stderr"] = _msg
-            result["jobs"] = None
-            raise Exception(_msg)
+        is_changed = assert_job_output(job_output_txt, max_rc, return_output, result)
 
     except Exception as err:
         result["failed"] = True
@@ -956,6 +1245,7 @@ def run_module():
                          "there was an error, please review "
                          "the error for further details: {1}".format
                          (str(job_submitted_id), str(err)))
+        format_job_content(result.get("jobs"), content_format)
         module.exit_json(**result)
 
     finally:
@@ -965,9 +1255,81 @@ def run_module():
     # If max_rc is set, we don't want to default to changed=True, rely on 'is_changed'
     result["changed"] = True if is_changed else False
     result["failed"] = False
+    format_job_content(result.get("jobs"), content_format)
     module.exit_json(**result)
 
 
+def assert_job_output(job_output_txt, max_rc, return_output, result):
+    """Assert the output of a submitted job is a successful completion.
+
+    Arguments:
+        job_output_txt {list[dict]} -- The job output returned by job_output.
+        max_rc {int} -- The maximum return code allowed for any job step, None
+                        to only allow a return code of 0.
+        return_output {bool} -- Whether to keep the DD output in the result.
+        result {dict} -- The result the jobs and any error details are added to.
+
+    Raises:
+        Exception: When the job did not complete successfully.
+
+    Returns:
+        bool -- Whether the job changed the managed node.
+    """
+    # Job has submitted, the module changed the managed node
+    is_changed = True
+
+    if job_output_txt:
+        result["jobs"] = job_output_txt
+        job_ret_code = job_output_txt[0].get("ret_code")
+
+        if job_ret_code:
+            job_msg = job_ret_code.get("msg")
+            job_code = job_ret_code.get("code")
+
+            # retcode["msg"] should never be empty where a retcode["code"] can be None,
+            # "msg" could  be an ABEND which has no corresponding "code"
+            if job_msg is None:
+                _msg = ("Unable to find a 'msg' in the 'ret_code' dictionary, "
+                        "please review the job log.")
+                result["stderr"] = _msg
+                raise Exception(_msg)
+
+            if return_output is True and max_rc is not None:
+                is_changed = assert_valid_return_code(max_rc, job_code, job_ret_code)
+
+            if re.search("^(?:{0})".format("|".join(JOB_COMPLETION_MESSAGES)), job_msg):
+                # If the job_msg doesn't have a CC, it is an improper completion (error/abend)
+                if re.search("^(?:CC)", job_msg) is None:
+                    _msg = ("The job completion code (CC) was not in the job log. "
+                            "Please review the error {0} and the job log.".format(job_msg))
+                    result["stderr"] = _msg
+                    raise Exception(_msg)
+
+            if job_code is None:
+                raise Exception("The job return code was not available in the job log, "
+                                "please review the job log and error {0}.".format(job_msg))
+
+            if job_code != 0 and max_rc is None:
+                raise Exception("The job return code {0} was non-zero in the "
+                                "job output, this job has failed.".format(str(job_code)))
+
+            if not return_output:
+                for job in result.get("jobs", []):
+                    job["ddnames"] = []
+        else:
+            _msg = "The 'ret_code' dictionary was unavailable in the job log."
+            result["ret_code"] = None
+            result["stderr"] = _msg
+            raise Exception(_msg)
+    else:
+        _msg = "The job output log is unavailable."
+        result["stderr"] = _msg
+        result["jobs"] = None
+        raise Exception(_msg)
+
+    return is_changed
+
+
 def assert_valid_return_code(max_rc, job_rc, ret_code):
     if job_rc is None:
         raise Exception(
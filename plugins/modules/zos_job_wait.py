@@ -0,0 +1,332 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright (c) IBM Corporation 2023
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+
+DOCUMENTATION = r"""
+---
+module: zos_job_wait
+short_description: Wait for jobs to complete
+description:
+  - Wait for one or more z/OS jobs to complete and return their output.
+  - All the jobs are tracked by a single poller that lists them once per
+    poll, polling starts quickly and backs off while the jobs are running.
+  - The output of each job is collected as soon as it completes.
+  - Jobs submitted with L(zos_job_submit,./zos_job_submit.html) and
+    I(wait_time_s=0) can be waited for with this module.
+version_added: "1.5.0"
+author:
+  - "IBM z/OS core collection maintainers (@ansible-collections)"
+options:
+  job_id:
+    description:
+      - The job IDs of the jobs to wait for. (e.g "JOB00134", "J0012345")
+    type: list
+    elements: str
+    required: true
+  condition:
+    description:
+      - Whether to wait for C(all) the jobs to complete or for C(any) of the
+        jobs to complete.
+    type: str
+    required: false
+    default: all
+    choices:
+      - all
+      - any
+  wait_time_s:
+    description:
+      - The total time in seconds to wait for the jobs to complete, it must be
+        a value greater than 0 and less than 86400.
+      - The module fails when I(condition) is not met within I(wait_time_s).
+    type: int
+    required: false
+    default: 10
+  return_output:
+    description:
+      - Whether to return the DD output of the completed jobs.
+      - If false, an empty list will be returned in the ddnames field.
+    type: bool
+    required: false
+    default: true
+"""
+
+EXAMPLES = r"""
+- name: Submit two jobs without waiting for them to complete.
+  zos_job_submit:
+    batch:
+      - src: HLQ.DATA.LLQ(JOB1)
+      - src: HLQ.DATA.LLQ(JOB2)
+    wait_time_s: 0
+  register: submitted
+
+- name: Wait up to 5 minutes for both jobs to complete.
+  zos_job_wait:
+    job_id: "{{ submitted.batch | map(attribute='job_id') | list }}"
+    wait_time_s: 300
+
+- name: Wait for the first of two jobs to complete without returning its DDs.
+  zos_job_wait:
+    job_id:
+      - JOB00134
+      - JOB00135
+    condition: any
+    return_output: false
+"""
+
+RETURN = r"""
+jobs:
+  description:
+    The output of the completed jobs, in the order of I(job_id), with the
+    same structure returned by L(zos_job_output,./zos_job_output.html).
+  returned: always
+  type: list
+  elements: dict
+  contains:
+    job_id:
+      description:
+         The z/OS job ID of the job.
+      type: str
+      sample: JOB00134
+    job_name:
+      description:
+         The name of the batch job.
+      type: str
+      sample: HELLO
+    owner:
+      description:
+         The owner who ran the job.
+      type: str
+      sample: ADMIN
+    duration:
+      description: The time in seconds the job was waited for until it completed.
+      type: int
+      sample: 2
+    ddnames:
+      description:
+         Data definition names, empty when I(return_output=false).
+      type: list
+      elements: dict
+    ret_code:
+      description:
+         Return code output collected from job log.
+      type: dict
+      contains:
+        msg:
+          description:
+            Return code or abend resulting from the job submission.
+          type: str
+          sample: CC 0000
+        msg_code:
+          description:
+            Return code extracted from the `msg` so that it can be evaluated.
+            For example, ABEND(S0C4) would yield "S0C4".
+          type: str
+          sample: S0C4
+        msg_txt:
+          description:
+             Returns additional information related to the job.
+          type: str
+          sample: "No job can be located with this job name: HELLO"
+        code:
+          description:
+             Return code converted to integer value (when possible).
+          type: int
+          sample: 00
+        steps:
+          description:
+            Series of JCL steps that were executed and their return codes.
+          type: list
+          elements: dict
+          contains:
+            step_name:
+              description:
+                Name of the step shown as "was executed" in the DD section.
+              type: str
+              sample: "STEP0001"
+            step_cc:
+              description:
+                The CC returned for this step in the DD section.
+              type: int
+              sample: 0
+pending:
+  description:
+    The job IDs of the jobs that did not complete within I(wait_time_s) or
+    were not waited for once I(condition=any) was met.
+  returned: always
+  type: list
+  elements: str
+  sample: ["JOB00135"]
+duration:
+  description: The time in seconds spent waiting for the jobs.
+  returned: always
+  type: int
+  sample: 2
+changed:
+  description:
+    Always false, waiting for jobs does not change the managed node.
+  returned: always
+  type: bool
+msg:
+  description:
+     Message returned on failure.
+  type: str
+  returned: failure
+  sample: "1 of the 2 jobs did not complete within 10 second(s): JOB00135."
+"""
+
+from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.ibm.ibm_zos_core.plugins.module_utils.better_arg_parser import (
+    BetterArgParser,
+)
+from ansible_collections.ibm.ibm_zos_core.plugins.module_utils.job import (
+    job_output,
+    is_job_complete,
+    poll_jobs,
+)
+from timeit import default_timer as timer
+import re
+
+MAX_WAIT_TIME_S = 86400
+
+
+def wait_jobs(job_ids, condition="all", timeout=10, return_output=True, start_time=None):
+    """Wait for the jobs to complete with a single poller and collect the
+    output of each job as soon as it completes.
+
+    Arguments:
+        job_ids {list[str]} -- The job IDs of the jobs to wait for.
+
+    Keyword Arguments:
+        condition {str} -- 'all' to wait for all the jobs, 'any' to wait for
+                           the first job to complete. (default: {"all"})
+        timeout {int} -- How long in seconds to wait for the jobs. (default: {10})
+        return_output {bool} -- Whether to keep the DD output of the jobs. (default: {True})
+        start_time {float} -- The timer value the timeout is measured from. (default: {None})
+
+    Returns:
+        tuple(list[dict], list[str], int) -- The output of the completed jobs,
+            the job IDs of the jobs that did not complete and the duration.
+    """
+    start_time = timer() if start_time is None else start_time
+    outputs = {}
+
+    def collect_output(job_listing):
+        # The DDs are always read so that the steps in ret_code are returned
+        outputs[job_listing.id] = job_output(
+            job_id=job_listing.id, owner=None, job_name=None, dd_name=None,
+            duration=round(timer() - start_time), timeout=timeout, start_time=start_time)
+
+    entries, poller = poll_jobs(
+        job_ids, is_job_complete, timeout=timeout, start_time=start_time,
+        on_done=collect_output, wait_for_all=condition == "all")
+
+    jobs = []
+    pending = []
+    for job_id in job_ids:
+        if job_id not in outputs:
+            pending.append(job_id)
+            continue
+        for job in outputs[job_id]:
+            if not return_output:
+                job["ddnames"] = []
+            jobs.append(job)
+
+    return jobs, pending, poller.duration
+
+
+def _job_id_type(contents, resolve_dependencies):
+    """Resolver for job_id type arguments
+
+    Arguments:
+        contents {str} -- The contents of the argument.
+        resolved_dependencies {dict} -- Contains all of the dependencies and their contents,
+        which have already been handled,
+        for use during current arguments handling operations.
+
+    Raises:
+        ValueError: When contents is invalid argument type
+
+    Returns:
+        str -- The arguments contents after any necessary operations.
+    """
+    if not re.fullmatch(r"(?:JOB|TSU|STC)[0-9]{5}|(?:J|T|S)[0-9]{7}", str(contents), re.IGNORECASE):
+        raise ValueError(
+            'Invalid argument type for "{0}". expected "job_id"'.format(contents)
+        )
+    return str(contents).upper()
+
+
+def run_module():
+    module_args = dict(
+        job_id=dict(type="list", elements="str", required=True),
+        condition=dict(type="str", required=False, default="all", choices=["all", "any"]),
+        wait_time_s=dict(type="int", required=False, default=10),
+        return_output=dict(type="bool", required=False, default=True),
+    )
+
+    module = AnsibleModule(argument_spec=module_args, supports_check_mode=True)
+
+    arg_defs = dict(
+        job_id=dict(arg_type="list", elements=_job_id_type, required=True),
+        condition=dict(arg_type="str", default="all", choices=["all", "any"]),
+        wait_time_s=dict(arg_type="int", default=10),
+        return_output=dict(arg_type="bool", default=True),
+    )
+
+    try:
+        parser = BetterArgParser(arg_defs)
+        parsed_args = parser.parse_args(module.params)
+    except ValueError as err:
+        module.fail_json(msg="Parameter verification failed", stderr=str(err))
+
+    job_ids = parsed_args.get("job_id")
+    condition = parsed_args.get("condition")
+    wait_time_s = parsed_args.get("wait_time_s")
+    return_output = parsed_args.get("return_output")
+
+    result = dict(changed=False, jobs=[], pending=[])
+
+    if wait_time_s <= 0 or wait_time_s > MAX_WAIT_TIME_S:
+        result["msg"] = ("The value for option `wait_time_s` is not valid, it must "
+                         "be greater than 0 and less than {0}.".format(str(MAX_WAIT_TIME_S)))
+        module.fail_json(**result)
+
+    try:
+        jobs, pending, duration = wait_jobs(
+            job_ids, condition=condition, timeout=wait_time_s, return_output=return_output)
+    except Exception as err:
+        result["msg"] = ("Unable to wait for the jobs {0}, please review the error for "
+                         "further details: {1}".format(", ".join(job_ids), str(err)))
+        module.fail_json(**result)
+
+    result.update(jobs=jobs, pending=pending, duration=duration)
+
+    if not jobs or (condition == "all" and pending):
+        result["msg"] = ("{0} of the {1} jobs did not complete within {2} second(s): "
+                         "{3}.".format(len(pending), len(job_ids), str(wait_time_s), ", ".join(pending)))
+        module.fail_json(**result)
+
+    module.exit_json(**result)
+
+
+def main():
+    run_module()
+
+
+if __name__ == "__main__":
+    main()
@@ -1198,6 +1198,21 @@ options:
         that is not available, then the value C(TMPHLQ) is used.
     required: false
     type: str
+  content_format:
+    description:
+      - The format the content of the DDs with I(return_content) is returned in.
+      - C(lines) returns the content of each DD as a list of lines in I(content).
+      - C(gzip_base64) returns the content of each DD as a single gzip
+        compressed, base64 encoded string in I(content_gzip_base64) instead,
+        which reduces the size of the module result for large program output.
+        Filter C(ibm.ibm_zos_core.decompress_content) restores the I(content)
+        lines on the controller.
+    required: false
+    type: str
+    default: lines
+    choices:
+      - lines
+      - gzip_base64
 notes:
     - When executing programs using L(zos_mvs_raw,./zos_mvs_raw.html), you may encounter errors
       that originate in the programs implementation. Two such known issues are
@@ -1237,6 +1252,16 @@ dd_names:
       description: The content contained in the data definition.
       type: list
       elements: str
+    content_gzip_base64:
+      description:
+        The content contained in the data definition, gzip compressed and
+        base64 encoded. Only returned when I(content_format=gzip_base64), in
+        place of I(content).
+      type: str
+    content_format:
+      description:
+        The format of the content. Only returned when I(content_format=gzip_base64).
+      type: str
     record_count:
       description: The lines of the content.
       type: int
@@ -1522,6 +1547,25 @@ EXAMPLES = r"""
         dd_name: sysprint
         return_content:
           type: text
+
+- name: List data sets matching a pattern with the SYSPRINT content compressed.
+  zos_mvs_raw:
+    program_name: idcams
+    auth: yes
+    content_format: gzip_base64
+    dds:
+      - dd_output:
+          dd_name: sysprint
+          return_content:
+            type: text
+      - dd_input:
+          dd_name: sysin
+          content: " LISTCAT ENTRIES('SOME.DATASET.*')"
+  register: listcat
+
+- name: Print the decompressed SYSPRINT content.
+  debug:
+    msg: "{{ (listcat.dd_names | ibm.ibm_zos_core.decompress_content)[0].content }}"
 """
 
 from ansible_collections.ibm.ibm_zos_core.plugins.module_utils.better_arg_parser import (
@@ -1540,6 +1584,11 @@ from ansible_collections.ibm.ibm_zos_core.plugins.module_utils.dd_statement impo
 )
 
 from ansible_collections.ibm.ibm_zos_core.plugins.module_utils.data_set import DataSet
+from ansible_collections.ibm.ibm_zos_core.plugins.module_utils.content_format import (
+    CONTENT_FORMATS,
+    LINES,
+    format_content,
+)
 from ansible_collections.ibm.ibm_zos_core.plugins.module_utils.zos_mvs_raw import MVSCmd
 from ansible_collections.ibm.ibm_zos_core.plugins.module_utils import (
     backup as zos_backup,
@@ -1752,6 +1801,7 @@ def run_module():
         verbose=dict(type="bool", default=False),
         parm=dict(type="str", required=False),
         tmp_hlq=dict(type="str", required=False, default=None),
+        content_format=dict(type="str", required=False, default="lines", choices=CONTENT_FORMATS),
         dds=dict(
             type="list",
             elements="dict",
@@ -1798,7 +1848,7 @@ def run_module():
                     "{0} {1}".format(program_response.stdout, program_response.stderr),
                 )
 
-            response = build_response(program_response.rc, dd_statements)
+            response = build_response(program_response.rc, dd_statements, parms.get("content_format"))
             result["changed"] = True
         except Exception as e:
             result["backups"] = backups
@@ -1978,6 +2028,7 @@ def parse_and_validate_args(params):
         verbose=dict(type="bool", default=False),
         parm=dict(type="str", required=False),
         tmp_hlq=dict(type="qualifier_or_empty", required=False, default=None),
+        content_format=dict(type="str", default="lines", choices=CONTENT_FORMATS),
         dds=dict(
             type="list",
             elements="dict",
@@ -2798,19 +2849,22 @@ def run_zos_program(
     return response
 
 
-def build_response(rc, dd_statements):
+def build_response(rc, dd_statements, content_format=LINES):
     """Build response dictionary to return at module completion.
 
     Args:
         rc (int): The return code of the program.
         dd_statements (list[DDStatement]): The DD statements for the program.
+        content_format (str, optional): The format of the DD content. Defaults to "lines".
 
     Returns:
         dict: Response dictionary in format expected for response on module completion.
     """
     response = {"ret_code": {"code": rc}}
     response["backups"] = gather_backups(dd_statements)
-    response["dd_names"] = gather_output(dd_statements)
+    response["dd_names"] = [
+        format_content(dd_response, content_format) for dd_response in gather_output(dd_statements)
+    ]
     return response
 
 
@@ -29,6 +29,22 @@ def pytest_addoption(parser):
         default="test_config.yml",
         help="Absolute path to YAML file containing inventory info for functional testing.",
     )
+    parser.addoption(
+        "--run-benchmarks",
+        action="store_true",
+        default=False,
+        help="Run the test cases marked as benchmark, some write large files on the managed node.",
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """ Skip the benchmark test cases unless --run-benchmarks is given. """
+    if config.getoption("--run-benchmarks"):
+        return
+    skip_benchmark = pytest.mark.skip(reason="benchmark, run with --run-benchmarks")
+    for item in items:
+        if "benchmark" in item.keywords:
+            item.add_marker(skip_benchmark)
 
 
 @pytest.fixture(scope="session")
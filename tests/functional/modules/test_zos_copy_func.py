@@ -18,6 +18,7 @@ import os
 import shutil
 import re
 import tempfile
+import time
 from tempfile import mkstemp
 
 __metaclass__ = type
@@ -342,6 +343,31 @@ def test_copy_inline_content_to_uss_dir(ansible_zos_module):
         hosts.all.file(path=dest_path, state="absent")
 
 
+@pytest.mark.uss
+@pytest.mark.parametrize("line_count", [10, 10000])
+def test_copy_inline_content_to_uss_file(ansible_zos_module, line_count):
+    """The smaller content is sent in the module arguments, the larger one
+    is transferred with SFTP."""
+    hosts = ansible_zos_module
+    dest_path = "/tmp/inline_copy_file"
+    content = "DUMMY DATA ---- LINE 001 ------\n" * line_count
+
+    try:
+        copy_res = hosts.all.zos_copy(content=content, dest=dest_path)
+        verify_res = hosts.all.shell(
+            cmd="cat {0}".format(dest_path), executable=SHELL_EXECUTABLE
+        )
+
+        for result in copy_res.contacted.values():
+            assert result.get("msg") is None
+            assert result.get("changed") is True
+            assert result.get("dest") == dest_path
+        for result in verify_res.contacted.values():
+            assert result.get("stdout") == content.rstrip("\n")
+    finally:
+        hosts.all.file(path=dest_path, state="absent")
+
+
 @pytest.mark.uss
 def test_copy_dir_to_existing_uss_dir_not_forced(ansible_zos_module):
     hosts = ansible_zos_module
@@ -635,6 +661,244 @@ def test_copy_local_nested_dir_to_uss(ansible_zos_module, create_dest):
         shutil.rmtree(source_path)
 
 
+@pytest.mark.uss
+@pytest.mark.parametrize("archive_transfer", ["none", "tar", "gz"])
+def test_copy_local_dir_with_many_files_archive_transfer(ansible_zos_module, archive_transfer):
+    hosts = ansible_zos_module
+    dest_path = "/tmp/new_dir"
+    file_count = 1000
+
+    source_path = tempfile.mkdtemp()
+    subdir_path = "{0}/subdir".format(source_path)
+
+    try:
+        os.mkdir(subdir_path)
+        for i in range(file_count):
+            with open("{0}/file{1}".format(subdir_path if i % 2 else source_path, i), "w") as infile:
+                infile.write(DUMMY_DATA)
+
+        copy_result = hosts.all.zos_copy(
+            src=source_path + "/",
+            dest=dest_path,
+            archive_transfer=archive_transfer
+        )
+
+        count_res = hosts.all.shell(
+            cmd="find {0} -type f | wc -l".format(dest_path),
+            executable=SHELL_EXECUTABLE
+        )
+        cat_res = hosts.all.shell(
+            cmd="cat {0}/subdir/file1".format(dest_path),
+            executable=SHELL_EXECUTABLE
+        )
+
+        for result in copy_result.contacted.values():
+            assert result.get("msg") is None
+            assert result.get("changed") is True
+            assert result.get("dest") == dest_path
+        for result in count_res.contacted.values():
+            assert int(result.get("stdout")) == file_count
+        for result in cat_res.contacted.values():
+            assert result.get("stdout") == DUMMY_DATA.rstrip("\n")
+
+    finally:
+        hosts.all.file(path=dest_path, state="absent")
+        shutil.rmtree(source_path)
+
+
+@pytest.mark.uss
+@pytest.mark.seq
+def test_copy_batch(ansible_zos_module):
+    hosts = ansible_zos_module
+    dest_dir = "/tmp/zos_copy_batch"
+    dest_seq = "USER.TEST.SEQ.BATCH"
+
+    fd, src = tempfile.mkstemp()
+    os.close(fd)
+    with open(src, "w") as infile:
+        infile.write(DUMMY_DATA)
+
+    try:
+        hosts.all.zos_data_set(name=dest_seq, state="absent")
+        hosts.all.file(path=dest_dir, state="directory")
+
+        copy_result = hosts.all.zos_copy(
+            batch=[
+                dict(src=src, dest="{0}/local".format(dest_dir)),
+                dict(content=DUMMY_DATA, dest=dest_seq),
+                dict(src="/etc/profile", dest="{0}/remote".format(dest_dir), remote_src=True, is_binary=True),
+                dict(src="{0}/missing".format(src), dest="{0}/missing".format(dest_dir)),
+            ],
+            force=True
+        )
+
+        # A missing local source is found before anything is copied
+        for result in copy_result.contacted.values():
+            assert result.get("failed") is True
+            assert result.get("msg").startswith("Item 3 of 'batch'")
+
+        copy_result = hosts.all.zos_copy(
+            batch=[
+                dict(src=src, dest="{0}/local".format(dest_dir)),
+                dict(content=DUMMY_DATA, dest=dest_seq),
+                dict(src="/etc/profile", dest="{0}/remote".format(dest_dir), remote_src=True, is_binary=True),
+                dict(src="/tmp/zos_copy_batch_missing", dest="{0}/missing".format(dest_dir), remote_src=True),
+            ],
+            force=True
+        )
+        verify_local = hosts.all.shell(
+            cmd="cat {0}/local".format(dest_dir), executable=SHELL_EXECUTABLE
+        )
+        verify_seq = hosts.all.shell(
+            cmd="cat \"//'{0}'\"".format(dest_seq), executable=SHELL_EXECUTABLE
+        )
+
+        for result in copy_result.contacted.values():
+            assert result.get("failed") is True
+            assert result.get("changed") is True
+            batch_results = result.get("batch_results")
+            assert len(batch_results) == 4
+            assert [item.get("changed") for item in batch_results[:3]] == [True, True, True]
+            assert batch_results[1].get("dest") == dest_seq
+            assert batch_results[3].get("failed") is True
+        for result in verify_local.contacted.values():
+            assert result.get("stdout") == DUMMY_DATA.rstrip("\n")
+        for result in verify_seq.contacted.values():
+            assert result.get("stdout").replace(" ", "") == DUMMY_DATA.replace(" ", "").rstrip("\n")
+    finally:
+        os.remove(src)
+        hosts.all.file(path=dest_dir, state="absent")
+        hosts.all.zos_data_set(name=dest_seq, state="absent")
+
+
+@pytest.mark.uss
+@pytest.mark.benchmark
+@pytest.mark.parametrize("archive_transfer", ["none", "tar", "gz"])
+def test_copy_local_dir_with_many_files_archive_transfer_duration(ansible_zos_module, record_property, archive_transfer):
+    """Benchmark of the archive transfer against 'put -r', the duration is
+    recorded as a property of the test case in the JUnit XML report."""
+    hosts = ansible_zos_module
+    dest_path = "/tmp/new_dir"
+    file_count = 5000
+
+    source_path = tempfile.mkdtemp()
+
+    try:
+        for i in range(file_count):
+            with open("{0}/file{1}".format(source_path, i), "w") as infile:
+                infile.write(DUMMY_DATA)
+
+        start_time = time.time()
+        copy_result = hosts.all.zos_copy(
+            src=source_path + "/",
+            dest=dest_path,
+            archive_transfer=archive_transfer
+        )
+        record_property("duration_seconds", time.time() - start_time)
+
+        for result in copy_result.contacted.values():
+            assert result.get("msg") is None
+            assert result.get("changed") is True
+
+    finally:
+        hosts.all.file(path=dest_path, state="absent")
+        shutil.rmtree(source_path)
+
+
+@pytest.mark.uss
+@pytest.mark.benchmark
+@pytest.mark.parametrize("size_mb", [1024, 4096])
+def test_copy_large_uss_file_to_uss_binary_throughput(ansible_zos_module, record_property, size_mb):
+    """Benchmark of the remote USS to USS copy, the throughput is recorded as
+    a property of the test case in the JUnit XML report."""
+    hosts = ansible_zos_module
+    src_path = "/tmp/zos_copy_large_src"
+    dest_path = "/tmp/zos_copy_large_dest"
+
+    try:
+        hosts.all.shell(
+            cmd="dd if=/dev/zero of={0} bs=1048576 count={1}".format(src_path, size_mb),
+            executable=SHELL_EXECUTABLE
+        )
+
+        start_time = time.time()
+        copy_result = hosts.all.zos_copy(
+            src=src_path,
+            dest=dest_path,
+            remote_src=True,
+            is_binary=True
+        )
+        record_property("throughput_mb_per_s", size_mb / (time.time() - start_time))
+
+        src_stat = hosts.all.stat(path=src_path, checksum_algorithm="sha256")
+        dest_stat = hosts.all.stat(path=dest_path, checksum_algorithm="sha256")
+
+        for result in copy_result.contacted.values():
+            assert result.get("msg") is None
+            assert result.get("changed") is True
+        checksums = [
+            result.get("stat").get("checksum")
+            for stat_result in (src_stat, dest_stat)
+            for result in stat_result.contacted.values()
+        ]
+        assert len(checksums) == 2 and checksums[0] == checksums[1]
+
+    finally:
+        hosts.all.file(path=src_path, state="absent")
+        hosts.all.file(path=dest_path, state="absent")
+
+
+@pytest.mark.uss
+@pytest.mark.parametrize("remote_src", [False, True])
+def test_sync_dir_to_uss_dir(ansible_zos_module, remote_src):
+    hosts = ansible_zos_module
+    dest_path = "/tmp/new_dir"
+    remote_src_path = "/tmp/sync_source"
+
+    source_path = tempfile.mkdtemp()
+    try:
+        populate_dir(source_path)
+        src = source_path + "/"
+        if remote_src:
+            hosts.all.zos_copy(src=src, dest=remote_src_path, is_binary=True)
+            src = remote_src_path + "/"
+
+        first_res = hosts.all.zos_copy(src=src, dest=dest_path, remote_src=remote_src, sync=True)
+        second_res = hosts.all.zos_copy(src=src, dest=dest_path, remote_src=remote_src, sync=True)
+
+        hosts.all.shell(cmd="echo extra > {0}/extra".format(dest_path), executable=SHELL_EXECUTABLE)
+        if remote_src:
+            hosts.all.shell(cmd="echo changed > {0}/file2".format(remote_src_path), executable=SHELL_EXECUTABLE)
+        else:
+            with open(source_path + "/file2", "w") as infile:
+                infile.write("changed\n")
+        third_res = hosts.all.zos_copy(
+            src=src, dest=dest_path, remote_src=remote_src, sync=True, sync_delete=True
+        )
+        cat_res = hosts.all.shell(cmd="cat {0}/file2".format(dest_path), executable=SHELL_EXECUTABLE)
+
+        for result in first_res.contacted.values():
+            assert result.get("msg") is None
+            assert result.get("changed") is True
+            assert sorted(result.get("sync").get("copied")) == ["file{0}".format(i + 1) for i in range(5)]
+        for result in second_res.contacted.values():
+            assert result.get("msg") is None
+            assert result.get("changed") is False
+            assert result.get("sync").get("copied") == []
+        for result in third_res.contacted.values():
+            assert result.get("msg") is None
+            assert result.get("changed") is True
+            assert result.get("sync").get("copied") == ["file2"]
+            assert result.get("sync").get("deleted") == ["extra"]
+        for result in cat_res.contacted.values():
+            assert result.get("stdout") == "changed"
+
+    finally:
+        hosts.all.file(path=dest_path, state="absent")
+        hosts.all.file(path=remote_src_path, state="absent")
+        shutil.rmtree(source_path)
+
+
 @pytest.mark.uss
 @pytest.mark.parametrize("create_dest", [False, True])
 def test_copy_uss_nested_dir_to_uss(ansible_zos_module, create_dest):
@@ -976,6 +1240,30 @@ def test_copy_file_record_length_to_sequential_data_set(ansible_zos_module):
         os.remove(src)
 
 
+@pytest.mark.uss
+@pytest.mark.seq
+@pytest.mark.parametrize("is_remote", [False, True])
+def test_copy_file_to_seq_skip_identical(ansible_zos_module, is_remote):
+    hosts = ansible_zos_module
+    dest = "USER.TEST.SEQ.FUNCTEST"
+    src = "/etc/profile"
+
+    try:
+        hosts.all.zos_data_set(name=dest, state="absent")
+        hosts.all.zos_data_set(name=dest, type="seq", record_format="fb", record_length=80, replace=True)
+
+        for expected_changed in (True, False):
+            copy_result = hosts.all.zos_copy(
+                src=src, dest=dest, remote_src=is_remote, skip_identical=True, force=True
+            )
+            for cp_res in copy_result.contacted.values():
+                assert cp_res.get("msg") is None
+                assert cp_res.get("changed") is expected_changed
+                assert cp_res.get("dest") == dest
+    finally:
+        hosts.all.zos_data_set(name=dest, state="absent")
+
+
 @pytest.mark.uss
 @pytest.mark.seq
 @pytest.mark.parametrize("src", [
@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) IBM Corporation 2023
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import base64
+import gzip
+import json
+
+from ibm_zos_core.plugins.module_utils.content_format import (
+    format_content,
+    format_job_content,
+    parse_content,
+)
+from ibm_zos_core.plugins.filter.content import decompress_content
+
+LINES = [" IEF142I HELLO STEP{0:04d} - STEP WAS EXECUTED - COND CODE 0000".format(i) for i in range(5000)]
+
+
+def jobs_output():
+    return [{
+        "job_id": "JOB00134",
+        "ret_code": {"msg": "CC 0000", "code": 0, "steps": []},
+        "ddnames": [
+            {"ddname": "JESMSGLG", "record_count": "5000", "content": list(LINES)},
+            {"ddname": "JESJCL", "record_count": "0"},
+        ],
+    }]
+
+
+def test_format_content_lines_is_unchanged():
+    jobs = jobs_output()
+
+    assert format_job_content(jobs, "lines") == jobs_output()
+
+
+def test_format_content_gzip_base64():
+    dd = format_content({"ddname": "JESMSGLG", "content": list(LINES)}, "gzip_base64")
+
+    assert "content" not in dd
+    assert dd["content_format"] == "gzip_base64"
+    # Standard gzip, any client can decompress it
+    assert gzip.decompress(base64.b64decode(dd["content_gzip_base64"])).decode("utf-8") == "\n".join(LINES)
+    assert parse_content(dd) == LINES
+
+
+def test_format_job_content_reduces_result_size():
+    lines_size = len(json.dumps(jobs_output()))
+    jobs = format_job_content(jobs_output(), "gzip_base64")
+    compressed_size = len(json.dumps(jobs))
+
+    assert compressed_size < lines_size / 10
+    # A DD without content is left as is
+    assert jobs[0]["ddnames"][1] == {"ddname": "JESJCL", "record_count": "0"}
+
+
+def test_decompress_content_filter():
+    result = {"changed": False, "jobs": format_job_content(jobs_output(), "gzip_base64")}
+
+    assert decompress_content(result) == {"changed": False, "jobs": jobs_output()}
+    assert decompress_content(result["jobs"][0]["ddnames"][0])["content"] == LINES
+    # The result given to the filter is not modified
+    assert "content_gzip_base64" in result["jobs"][0]["ddnames"][0]
@@ -0,0 +1,231 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) IBM Corporation 2023
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import errno
+import os
+import shutil
+
+import pytest
+
+from ibm_zos_core.plugins.module_utils import copy
+
+# Larger than the copy buffer used by the tests, and not a multiple of it
+CONTENT = bytes(bytearray(range(256))) * 41 + b"end"
+
+
+def write_file(path, content, mode=0o640):
+    if not os.path.isdir(os.path.dirname(path)):
+        os.makedirs(os.path.dirname(path))
+    with open(path, "wb") as outfile:
+        outfile.write(content)
+    os.chmod(path, mode)
+
+
+def read_file(path):
+    with open(path, "rb") as infile:
+        return infile.read()
+
+
+@pytest.fixture
+def small_buffer(monkeypatch):
+    monkeypatch.setattr(copy, "COPY_BUFFER_SIZE", 1000)
+    monkeypatch.setattr(copy, "is_zos", lambda: False)
+
+
+def _failing_after_first_call(function, error):
+    calls = []
+
+    def failing(*args):
+        if calls:
+            raise OSError(error, os.strerror(error))
+        calls.append(args)
+        return function(*args)
+
+    return failing
+
+
+@pytest.mark.parametrize("disabled", [[], ["copy_file_range"], ["copy_file_range", "sendfile"]])
+def test_copy_file(small_buffer, monkeypatch, tmp_path, disabled):
+    for name in disabled:
+        monkeypatch.delattr(os, name, raising=False)
+    src = os.path.join(str(tmp_path), "src")
+    dest = os.path.join(str(tmp_path), "dest")
+    write_file(src, CONTENT, mode=0o751)
+    write_file(dest, b"longer content that is replaced" * 1000)
+
+    copy.copy_file(src, dest)
+
+    assert read_file(dest) == CONTENT
+    assert os.stat(dest).st_mode & 0o777 == 0o751
+
+
+@pytest.mark.parametrize("name", ["copy_file_range", "sendfile"])
+def test_copy_file_continues_when_zero_copy_fails(small_buffer, monkeypatch, tmp_path, name):
+    if not hasattr(os, name):
+        pytest.skip("os.{0} is not available".format(name))
+    # The first call copies a block, the copy has to continue from there
+    monkeypatch.setattr(os, name, _failing_after_first_call(getattr(os, name), errno.EXDEV))
+    src = os.path.join(str(tmp_path), "src")
+    dest = os.path.join(str(tmp_path), "dest")
+    write_file(src, CONTENT)
+
+    copy.copy_file(src, dest)
+
+    assert read_file(dest) == CONTENT
+
+
+def test_copy_file_falls_back_when_sendfile_needs_a_socket(small_buffer, monkeypatch, tmp_path):
+    monkeypatch.delattr(os, "copy_file_range", raising=False)
+
+    def sendfile(out_fd, in_fd, offset, count):
+        # Outside of Linux an offset is required and the output must be a socket
+        if offset is None:
+            raise TypeError("an integer is required")
+        raise OSError(errno.ENOTSOCK, os.strerror(errno.ENOTSOCK))
+
+    monkeypatch.setattr(os, "sendfile", sendfile, raising=False)
+    src = os.path.join(str(tmp_path), "src")
+    dest = os.path.join(str(tmp_path), "dest")
+    write_file(src, CONTENT)
+
+    copy.copy_file(src, dest)
+
+    assert read_file(dest) == CONTENT
+
+
+def test_copy_file_raises_other_errors(small_buffer, monkeypatch, tmp_path):
+    if not hasattr(os, "copy_file_range"):
+        pytest.skip("os.copy_file_range is not available")
+    monkeypatch.setattr(os, "copy_file_range", _failing_after_first_call(os.copy_file_range, errno.ENOSPC))
+    src = os.path.join(str(tmp_path), "src")
+    write_file(src, CONTENT)
+
+    with pytest.raises(OSError):
+        copy.copy_file(src, os.path.join(str(tmp_path), "dest"))
+
+
+def test_copy_file_same_file(small_buffer, tmp_path):
+    src = os.path.join(str(tmp_path), "src")
+    link = os.path.join(str(tmp_path), "link")
+    write_file(src, CONTENT)
+    os.symlink(src, link)
+
+    for dest in (src, link):
+        with pytest.raises(shutil.SameFileError):
+            copy.copy_file(src, dest)
+
+    # The source is not truncated
+    assert read_file(src) == CONTENT
+
+
+def test_copy_files_copies_tags_once(small_buffer, monkeypatch, tmp_path):
+    monkeypatch.setattr(copy, "is_zos", lambda: True)
+    tagged = []
+    monkeypatch.setattr(copy, "copy_file_tags", lambda file_pairs: tagged.append(list(file_pairs)))
+    file_pairs = []
+    for i in range(5):
+        src = os.path.join(str(tmp_path), "src{0}".format(i))
+        write_file(src, CONTENT)
+        file_pairs.append((src, os.path.join(str(tmp_path), "dest{0}".format(i))))
+
+    copy.copy_files(file_pairs, preserve_times=True)
+
+    assert all(read_file(dest) == CONTENT for src, dest in file_pairs)
+    assert tagged == [file_pairs]
+
+
+def test_copy_file_preserve_times(small_buffer, tmp_path):
+    src = os.path.join(str(tmp_path), "src")
+    dest = os.path.join(str(tmp_path), "dest")
+    write_file(src, CONTENT)
+    os.utime(src, (1600000000, 1600000000))
+
+    copy.copy_file(src, dest, preserve_times=True)
+
+    assert os.stat(dest).st_mtime == 1600000000
+
+
+def test_copy_tree(small_buffer, tmp_path):
+    src = os.path.join(str(tmp_path), "src")
+    dest = os.path.join(str(tmp_path), "dest")
+    write_file(os.path.join(src, "file1"), CONTENT, mode=0o600)
+    write_file(os.path.join(src, "sub", "deep", "file2"), b"")
+    os.mkdir(os.path.join(src, "empty"))
+    os.utime(os.path.join(src, "sub"), (1600000000, 1600000000))
+
+    assert copy.copy_tree(src, dest) == dest
+
+    assert read_file(os.path.join(dest, "file1")) == CONTENT
+    assert os.stat(os.path.join(dest, "file1")).st_mode & 0o777 == 0o600
+    assert read_file(os.path.join(dest, "sub", "deep", "file2")) == b""
+    assert os.path.isdir(os.path.join(dest, "empty"))
+    assert os.stat(os.path.join(dest, "sub")).st_mtime == 1600000000
+
+    with pytest.raises(OSError):
+        copy.copy_tree(src, dest)
+    write_file(os.path.join(src, "file3"), b"new")
+    copy.copy_tree(src, dest, dirs_exist_ok=True)
+    assert read_file(os.path.join(dest, "file3")) == b"new"
+
+
+class FakeModule:
+    commands = []
+    tags = {}
+
+    def __init__(self, argument_spec):
+        pass
+
+    def run_command(self, cmd):
+        FakeModule.commands.append(cmd)
+        if cmd[0] == "ls":
+            out = "\n".join(
+                "{0} {1}    T=on  {2}".format(tag[0], tag[1], path)
+                for path, tag in FakeModule.tags.items() if path in cmd
+            )
+            return 0, out, ""
+        return 0, "", ""
+
+
+def test_copy_file_tags(monkeypatch):
+    monkeypatch.setattr(copy, "AnsibleModuleHelper", FakeModule)
+    monkeypatch.setattr(copy, "TAG_BATCH_SIZE", 4)
+    FakeModule.commands = []
+    FakeModule.tags = {
+        "/src/a": ("t", "IBM-1047"),
+        "/src/b": ("t", "IBM-1047"),
+        "/src/c": ("b", "binary"),
+        "/src/d": ("-", "untagged"),
+        "/src/e": ("t", "ISO8859-1"),
+        "/dest/e": ("t", "ISO8859-1"),
+    }
+
+    copy.copy_file_tags([
+        ("/src/a", "/dest/a"),
+        ("/src/b", "/dest/b"),
+        ("/src/c", "/dest/c"),
+        ("/src/d", "/dest/d"),
+        ("/src/e", "/dest/e"),
+    ])
+
+    # Ten paths are listed in batches of four
+    assert [cmd[0] for cmd in FakeModule.commands[:3]] == ["ls", "ls", "ls"]
+    # One chtag for each tag, a destination already tagged is left alone
+    assert sorted(FakeModule.commands[3:]) == sorted([
+        ["chtag", "-t", "-c", "IBM-1047", "/dest/a", "/dest/b"],
+        ["chtag", "-b", "/dest/c"],
+        ["chtag", "-r", "/dest/d"],
+    ])
@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) IBM Corporation 2023
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import os
+from collections import namedtuple
+
+from ibm_zos_core.plugins.module_utils.job_cache import JobOutputCache
+
+Job = namedtuple("Job", ["id", "name", "owner", "status", "rc"])
+
+HELLO = Job("JOB00001", "HELLO", "ADMIN", "CC", "0000")
+
+
+def job_entries(job_id, size=0):
+    return [{"job_id": job_id, "ddnames": [{"ddname": "SYSPRINT", "content": ["x" * size]}]}]
+
+
+def test_cache_round_trip(tmp_path):
+    cache = JobOutputCache(str(tmp_path / "cache"))
+    key = cache.key(dd_name=None, dd_content=True)
+
+    assert cache.get("JOB00001", key, HELLO) is None
+    cache.put("JOB00001", key, HELLO, job_entries("JOB00001"))
+
+    assert cache.get("JOB00001", key, HELLO) == job_entries("JOB00001")
+    assert cache.get("JOB00001", cache.key(dd_name=["JESMSGLG"], dd_content=True), HELLO) is None
+
+
+def test_cache_reused_job_id(tmp_path):
+    cache = JobOutputCache(str(tmp_path))
+    key = cache.key()
+    cache.put("JOB00001", key, HELLO, job_entries("JOB00001"))
+
+    assert cache.get("JOB00001", key, HELLO._replace(name="OTHER")) is None
+    assert os.listdir(str(tmp_path)) == []
+
+
+def test_cache_evicts_least_recently_used(tmp_path):
+    cache = JobOutputCache(str(tmp_path), max_bytes=3500)
+    key = cache.key()
+
+    for i in range(3):
+        job_id = "JOB0000{0}".format(i)
+        cache.put(job_id, key, HELLO._replace(id=job_id), job_entries(job_id, 1000))
+        os.utime(cache._path(job_id, key), (i, i))
+    # Reading JOB00000 makes JOB00001 the least recently used entry
+    assert cache.get("JOB00000", key, HELLO) is not None
+
+    cache.put("JOB00003", key, HELLO, job_entries("JOB00003", 1000))
+
+    assert sorted(os.listdir(str(tmp_path))) == [
+        "JOB0000{0}.{1}.json".format(i, key) for i in (0, 2, 3)]
+
+
+def test_cache_errors_are_misses(tmp_path):
+    not_a_dir = tmp_path / "file"
+    not_a_dir.write_text("")
+    cache = JobOutputCache(str(not_a_dir))
+
+    cache.put("JOB00001", cache.key(), HELLO, job_entries("JOB00001"))
+
+    assert cache.get("JOB00001", cache.key(), HELLO) is None
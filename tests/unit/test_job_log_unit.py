@@ -0,0 +1,155 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) IBM Corporation 2023
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import re
+from timeit import default_timer as timer
+
+import pytest
+
+from ibm_zos_core.plugins.module_utils.job_log import JobLogParser, parse_job_log
+
+JESMSGLG = """1                       J E S 2  J O B  L O G  --  S Y S T E M  S T L 1  --  N O D E  S T L 1
+0
+ 10.25.48 JOB00134 ---- TUESDAY,   18 FEB 2020 ----
+ 10.25.48 JOB00134  IRR010I  USERID OMVSADM  IS ASSIGNED TO THIS JOB.
+ 10.25.48 JOB00134  $HASP373 HELLO    STARTED - INIT 3    - CLASS R        - SYS STL1
+ 10.25.48 JOB00134  SMF000I  HELLO       STEP0001    IEBGENER    0000
+ 10.25.48 JOB00134  $HASP395 HELLO    ENDED - RC=0000
+"""
+
+JESYSMSG = """ ICH70001I OMVSADM  LAST ACCESS AT 10:25:47 ON TUESDAY, FEBRUARY 18, 2020
+ IEF236I ALLOC. FOR HELLO STEP0001
+ IEF142I HELLO STEP0001 - STEP WAS EXECUTED - COND CODE 0000
+ IEF236I ALLOC. FOR HELLO STEP0002
+ IEF142I HELLO STEP0002 - STEP WAS EXECUTED - COND CODE 0004
+ IEF450I HELLO STEP0003 - ABEND=S0C4 U0000 REASON=00000004
+ IEF450I HELLO STEP0004 PROC1 - ABEND=S000 U0100
+"""
+
+JCLERR = """ 19.49.44 JOB06848  IEFC452I DOCEASYT - JOB NOT RUN - JCL ERROR 029
+ IEFC605I UNIDENTIFIED OPERATION FIELD
+ IEF212I DOCEASYT STEP0001 SYSUT1 - DATA SET NOT FOUND
+"""
+
+
+def test_parse_header():
+    job_log = parse_job_log(JESMSGLG)
+
+    assert job_log.job_class == "R"
+    assert job_log.system == "STL1"
+    assert job_log.subsystem == "STL1"
+    assert job_log.header_found
+
+
+def test_parse_steps_and_abends():
+    job_log = parse_job_log(JESYSMSG)
+
+    assert job_log.steps == [
+        {"step_name": "STEP0001", "step_cc": 0},
+        {"step_name": "STEP0002", "step_cc": 4},
+    ]
+    assert job_log.abends == [
+        {"step_name": "STEP0003", "procstep": None, "system_code": "S0C4",
+         "user_code": "U0000", "reason": "00000004"},
+        {"step_name": "STEP0004", "procstep": "PROC1", "system_code": "S000",
+         "user_code": "U0100", "reason": None},
+    ]
+    assert job_log.not_run_msg is None
+    assert job_log.jcl_errors == []
+
+
+def test_parse_jcl_errors():
+    job_log = parse_job_log(JCLERR)
+
+    assert job_log.not_run_msg == "JCL ERROR 029"
+    assert job_log.jcl_errors == [
+        {"msg_id": "IEFC452I", "msg_txt": "DOCEASYT - JOB NOT RUN - JCL ERROR 029"},
+        {"msg_id": "IEFC605I", "msg_txt": "UNIDENTIFIED OPERATION FIELD"},
+        {"msg_id": "IEF212I", "msg_txt": "DOCEASYT STEP0001 SYSUT1 - DATA SET NOT FOUND"},
+    ]
+
+
+def test_parse_many_dds_keeps_first_header():
+    job_log = JobLogParser()
+
+    job_log.parse(JESMSGLG.split("\n"))
+    job_log.parse(["--  S Y S T E M  OTHR  --  N O D E  OTHR", "- CLASS Z"])
+    job_log.parse(JESYSMSG.split("\n"))
+
+    assert (job_log.job_class, job_log.system, job_log.subsystem) == ("R", "STL1", "STL1")
+    assert len(job_log.steps) == 2
+
+
+def legacy_parse(content):
+    """The parsing previously done by job.py, a scan of the whole DD content
+    for each field, kept to compare results and timings with JobLogParser."""
+    steps = []
+    if "STEP WAS EXECUTED" in content:
+        for match in re.findall(r"(.*?)\s-\sSTEP\sWAS\sEXECUTED\s-\s(.*?)\n", content):
+            steps.append({"step_name": match[0].split()[-1], "step_cc": int(match[1].split()[-1])})
+    job_class = system = subsystem = ""
+    if "- CLASS " in content:
+        job_class = content.split("- CLASS ")[1].split(" ")[0]
+    if "--  S Y S T E M  " in content:
+        system = content.split("--  S Y S T E M  ")[1].split("--", 1)[0].replace(" ", "")
+    if "--  N O D E " in content:
+        subsystem = content.split("--  N O D E ")[1].split("\n")[0].replace(" ", "")
+    return job_class, system, subsystem, steps
+
+
+def synthetic_job_log(size_mb):
+    """A JES job log of about size_mb megabytes with a step every 50 lines."""
+    lines = JESMSGLG.split("\n")
+    step = 0
+    size = 0
+    while size < size_mb * 1024 * 1024:
+        if len(lines) % 50 == 0:
+            step += 1
+            line = " IEF142I HELLO STEP{0:04d} - STEP WAS EXECUTED - COND CODE 0000".format(step)
+        else:
+            line = " IEF285I   OMVSADM.HELLO.JOB00134.D{0:07d}.?            SYSOUT".format(len(lines))
+        lines.append(line)
+        size += len(line) + 1
+    return "\n".join(lines) + "\n"
+
+
+def test_parse_multi_mb_job_log():
+    content = synthetic_job_log(2)
+
+    expected = legacy_parse(content)
+    job_log = parse_job_log(content)
+
+    assert (job_log.job_class, job_log.system, job_log.subsystem, job_log.steps) == expected
+    assert len(job_log.steps) > 500
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("size_mb", [2, 16])
+def test_parse_multi_mb_job_log_timing(record_property, size_mb):
+    """Benchmark of JobLogParser against the legacy parsing, the durations are
+    recorded as properties of the test case in the JUnit XML report."""
+    content = synthetic_job_log(size_mb)
+
+    start = timer()
+    expected = legacy_parse(content)
+    record_property("legacy_seconds", timer() - start)
+
+    start = timer()
+    job_log = parse_job_log(content)
+    record_property("job_log_parser_seconds", timer() - start)
+
+    assert (job_log.job_class, job_log.system, job_log.subsystem, job_log.steps) == expected
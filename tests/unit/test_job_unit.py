@@ -0,0 +1,865 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) IBM Corporation 2023
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+from collections import namedtuple
+from fnmatch import fnmatch
+from threading import Lock
+from time import sleep
+
+import pytest
+
+IMPORT_NAME = "ibm_zos_core.plugins.module_utils.job"
+
+# Mirrors the attributes ZOAU returns for each entry of jobs.listing()
+Job = namedtuple("Job", ["id", "name", "owner", "status", "rc"])
+
+JESMSGLG = (
+    "1                       J E S 2  J O B  L O G  --  S Y S T E M  S T L 1  --  N O D E  S T L 1\n"
+    " 10.25.48 JOB00134  $HASP373 HELLO    STARTED - INIT 3    - CLASS R        - SYS STL1\n"
+    " 10.25.48 JOB00134  $HASP395 HELLO    ENDED - RC=0000\n"
+)
+
+JESYSMSG = (
+    " IEF142I HELLO STEP0001 - STEP WAS EXECUTED - COND CODE 0000\n"
+    " IEF373I STEP/STEP0001/START 2020049.1025\n"
+)
+
+
+class SpoolCounter(object):
+    """Stands in for the ZOAU jobs API, serving a synthetic spool while
+    counting how many calls were made to each function so that the number
+    of ZOAU round trips can be compared between code paths."""
+
+    def __init__(self, num_jobs=1, num_dds=5, read_delay=0, jobs=None):
+        self.calls = {"listing": 0, "list_dds": 0, "read_output": 0}
+        self.listed_entries = 0
+        self.read_delay = read_delay
+        self.active_reads = 0
+        self.max_active_reads = 0
+        self.lock = Lock()
+        self.jobs = [
+            Job("JOB{0:05d}".format(i), "HELLO", "ADMIN", "CC", "0000")
+            for i in range(num_jobs)
+        ] if jobs is None else jobs
+        self.dds = [
+            {"dataset": "JESMSGLG", "stepname": "JES2", "procstep": "", "dsid": "2",
+             "recnum": "3", "length": str(len(JESMSGLG))},
+            {"dataset": "JESYSMSG", "stepname": "JES2", "procstep": "", "dsid": "4",
+             "recnum": "2", "length": str(len(JESYSMSG))},
+        ]
+        for i in range(num_dds - len(self.dds)):
+            self.dds.append({"dataset": "SYSUT{0}".format(i), "stepname": "STEP0001",
+                             "procstep": "", "dsid": str(100 + i), "recnum": "1",
+                             "length": "80"})
+
+    def listing(self, job_id=None, owner=None, job_name=None):
+        self.calls["listing"] += 1
+        entries = [
+            job for job in self.jobs
+            if (job_id is None or job.id == job_id) and
+            (owner is None or job.owner == owner) and
+            (job_name is None or fnmatch(job.name, job_name))
+        ]
+        self.listed_entries += len(entries)
+        return entries
+
+    def list_dds(self, job_id):
+        self.calls["list_dds"] += 1
+        return [dict(dd) for dd in self.dds]
+
+    def read_output(self, job_id, stepname, dataset):
+        with self.lock:
+            self.calls["read_output"] += 1
+            self.active_reads += 1
+            self.max_active_reads = max(self.max_active_reads, self.active_reads)
+        # Simulates the time spent waiting on JES for the DD content
+        sleep(self.read_delay)
+        with self.lock:
+            self.active_reads -= 1
+        if dataset == "JESMSGLG":
+            return JESMSGLG
+        if dataset == "JESYSMSG":
+            return JESYSMSG
+        return " {0} {1}\n".format(job_id, dataset)
+
+
+@pytest.fixture(scope="function")
+def job_mocker(zos_import_mocker):
+    """Yields the job module_utils along with a SpoolCounter factory that
+    patches the ZOAU jobs API used by the module."""
+    mocker, importer = zos_import_mocker
+    job = importer(IMPORT_NAME)
+    mocker.patch.object(job, "_LISTING_FILTERS_SUPPORTED", False)
+
+    def patch_spool(**kwargs):
+        spool = SpoolCounter(**kwargs)
+        mocker.patch.object(job, "listing", spool.listing)
+        mocker.patch.object(job, "list_dds", spool.list_dds)
+        mocker.patch.object(job, "read_output", spool.read_output)
+        return spool
+
+    yield job, patch_spool
+
+
+def test_job_status_reads_every_dd(job_mocker):
+    job, patch_spool = job_mocker
+    spool = patch_spool(num_jobs=3, num_dds=10)
+
+    jobs = job.job_status(job_name="HELLO")
+
+    assert len(jobs) == 3
+    assert jobs[0]["system"] == "STL1"
+    assert jobs[0]["ret_code"]["steps"] == [{"step_name": "STEP0001", "step_cc": 0}]
+    assert spool.calls == {"listing": 1, "list_dds": 3, "read_output": 30}
+
+
+def test_job_status_without_dd_scan_only_lists(job_mocker):
+    job, patch_spool = job_mocker
+    spool = patch_spool(num_jobs=3, num_dds=10)
+
+    jobs = job.job_status(job_name="HELLO", dd_scan=False)
+
+    assert len(jobs) == 3
+    for entry in jobs:
+        assert entry["ret_code"]["msg"] == "CC 0000"
+        assert entry["ret_code"]["code"] == 0
+        assert entry["ddnames"] == []
+    # The DDs are listed to leave out the jobs without any, but not read
+    assert spool.calls == {"listing": 1, "list_dds": 3, "read_output": 0}
+
+
+def test_job_status_without_dd_scan_job_not_found(job_mocker):
+    job, patch_spool = job_mocker
+    patch_spool(num_jobs=1)
+
+    jobs = job.job_status(job_id="JOB99999", dd_scan=False)
+
+    assert jobs[0]["ret_code"]["msg_txt"] == "The job could not be found."
+
+
+@pytest.mark.parametrize("kwargs", [dict(), dict(dd_scan=False), dict(dd_content=False)])
+def test_job_status_jcl_error_msg_on_every_path(job_mocker, mocker, kwargs):
+    job, patch_spool = job_mocker
+    spool = patch_spool(jobs=[Job("JOB00000", "HELLO", "ADMIN", "JCLERR", "?"),
+                              Job("JOB00001", "HELLO", "ADMIN", "CC", "0000")])
+    jesysmsg = " 19.49.44 JOB00000 IEFC452I HELLO - JOB NOT RUN - JCL ERROR 029 \n"
+    read_job_ids = set()
+
+    def read_output(job_id, stepname, dataset):
+        read_job_ids.add(job_id)
+        return jesysmsg if dataset == "JESYSMSG" else spool.read_output(job_id, stepname, dataset)
+    mocker.patch.object(job, "read_output", read_output)
+
+    if kwargs.get("dd_content") is False:
+        jobs = job.job_output(job_name="HELLO", **kwargs)
+    else:
+        jobs = job.job_status(job_name="HELLO", **kwargs)
+
+    assert jobs[0]["ret_code"]["msg"] == "JCL ERROR 029"
+    assert jobs[0]["ret_code"]["msg_code"] is None
+    assert jobs[1]["ret_code"]["msg"] == "CC 0000"
+    if kwargs:
+        # Only the job that did not run is read, for its msg
+        assert jobs[0]["ret_code"]["steps"] == []
+        assert read_job_ids == {"JOB00000"}
+
+
+@pytest.mark.parametrize("kwargs", [dict(), dict(dd_scan=False), dict(dd_content=False)])
+def test_job_status_without_dds_on_every_path(job_mocker, mocker, kwargs):
+    job, patch_spool = job_mocker
+    spool = patch_spool(num_jobs=2)
+    mocker.patch.object(job, "list_dds", lambda job_id: (
+        [] if job_id == "JOB00000" else spool.list_dds(job_id)))
+
+    if kwargs.get("dd_content") is False:
+        jobs = job.job_output(job_name="HELLO", **kwargs)
+    else:
+        jobs = job.job_status(job_name="HELLO", **kwargs)
+
+    assert [entry["job_id"] for entry in jobs] == ["JOB00001"]
+
+
+def test_job_output_reads_only_requested_dds(job_mocker):
+    job, patch_spool = job_mocker
+    spool = patch_spool(num_jobs=1, num_dds=200)
+
+    jobs = job.job_output(job_id="JOB00000", dd_name=["JESMSGLG", "JESYSMSG"])
+
+    assert [dd["ddname"] for dd in jobs[0]["ddnames"]] == ["JESMSGLG", "JESYSMSG"]
+    assert jobs[0]["class"] == "R"
+    assert jobs[0]["ret_code"]["steps"] == [{"step_name": "STEP0001", "step_cc": 0}]
+    assert spool.calls["read_output"] == 2
+
+
+@pytest.mark.parametrize("dd_name", [None, "?", ["?"]])
+def test_job_output_all_dds(job_mocker, dd_name):
+    job, patch_spool = job_mocker
+    spool = patch_spool(num_jobs=1, num_dds=20)
+
+    jobs = job.job_output(job_id="JOB00000", dd_name=dd_name)
+
+    assert len(jobs[0]["ddnames"]) == 20
+    assert spool.calls["read_output"] == 20
+
+
+def test_job_output_metadata_only(job_mocker):
+    job, patch_spool = job_mocker
+    spool = patch_spool(num_jobs=1, num_dds=200)
+
+    jobs = job.job_output(job_id="JOB00000", dd_content=False)
+
+    assert len(jobs[0]["ddnames"]) == 200
+    jesmsglg = jobs[0]["ddnames"][0]
+    assert jesmsglg["ddname"] == "JESMSGLG"
+    assert jesmsglg["record_count"] == "3"
+    assert jesmsglg["byte_count"] == str(len(JESMSGLG))
+    assert "content" not in jesmsglg
+    assert spool.calls["read_output"] == 0
+
+
+def test_job_output_invalid_dd_name(job_mocker):
+    job, patch_spool = job_mocker
+    patch_spool()
+
+    with pytest.raises(ValueError):
+        job.job_output(job_id="JOB00000", dd_name=["JESMSGLG", "1BAD"])
+
+
+@pytest.mark.parametrize("max_workers", [1, 4])
+def test_job_output_concurrent_reads_keep_order(job_mocker, max_workers):
+    job, patch_spool = job_mocker
+    spool = patch_spool(num_jobs=2, num_dds=12, read_delay=0.01)
+
+    jobs = job.job_output(job_name="HELLO", max_workers=max_workers)
+
+    assert spool.calls["read_output"] == 24
+    assert spool.max_active_reads == max_workers
+    for entry in jobs:
+        assert entry["class"] == "R"
+        assert entry["system"] == "STL1"
+        assert entry["ret_code"]["steps"] == [{"step_name": "STEP0001", "step_cc": 0}]
+        for dd in entry["ddnames"][2:]:
+            assert dd["content"][0] == " {0} {1}".format(entry["job_id"], dd["ddname"])
+
+
+def test_job_output_abends_and_jcl_errors(job_mocker, mocker):
+    job, patch_spool = job_mocker
+    spool = patch_spool(num_jobs=1, num_dds=2)
+    jesysmsg = (
+        " IEF142I HELLO STEP0001 - STEP WAS EXECUTED - COND CODE 0000\n"
+        " IEF212I HELLO STEP0002 SYSUT1 - DATA SET NOT FOUND\n"
+        " IEF450I HELLO STEP0003 PROC1 - ABEND=S0C4 U0000 REASON=00000004\n"
+    )
+    mocker.patch.object(job, "read_output", lambda job_id, stepname, dataset: (
+        jesysmsg if dataset == "JESYSMSG" else spool.read_output(job_id, stepname, dataset)))
+
+    jobs = job.job_output(job_id="JOB00000")
+
+    ret_code = jobs[0]["ret_code"]
+    assert ret_code["steps"] == [{"step_name": "STEP0001", "step_cc": 0}]
+    assert ret_code["abends"] == [{"step_name": "STEP0003", "procstep": "PROC1", "system_code": "S0C4",
+                                   "user_code": "U0000", "reason": "00000004"}]
+    assert ret_code["jcl_errors"] == [{"msg_id": "IEF212I", "msg_txt": "HELLO STEP0002 SYSUT1 - DATA SET NOT FOUND"}]
+
+
+class FakeClock(object):
+    """Replaces the timer and sleep used by JobPoller so that polling can be
+    tested without waiting."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def timer(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture(scope="function")
+def fake_clock(job_mocker, mocker):
+    job, patch_spool = job_mocker
+    clock = FakeClock()
+    mocker.patch.object(job, "timer", clock.timer)
+    mocker.patch.object(job, "sleep", clock.sleep)
+    yield job, clock
+
+
+def test_job_poller_backoff_is_capped(fake_clock):
+    job, clock = fake_clock
+    poller = job.JobPoller(timeout=120, initial_delay=0.05, max_delay=5, jitter=0)
+
+    result = poller.poll(lambda: None)
+
+    assert result is None
+    assert clock.sleeps[:4] == [0.05, 0.1, 0.2, 0.4]
+    assert max(clock.sleeps) == 5
+    assert sum(clock.sleeps) == pytest.approx(120)
+    # A fixed one second sleep would have queried JES about 120 times
+    assert poller.polls < 35
+    assert poller.duration == 120
+
+
+def test_job_poller_stops_when_done(fake_clock):
+    job, clock = fake_clock
+    results = iter([[], [], ["JOB00001"]])
+    poller = job.JobPoller(timeout=10, jitter=0)
+
+    result = poller.poll(lambda: next(results))
+
+    assert result == ["JOB00001"]
+    assert poller.polls == 3
+    assert clock.now == pytest.approx(job.POLL_INITIAL_DELAY_S * 3)
+
+
+def test_job_poller_jitter_stays_in_bounds(fake_clock):
+    job, clock = fake_clock
+    poller = job.JobPoller(timeout=1000, initial_delay=1, max_delay=1, jitter=0.1)
+
+    poller.poll(lambda: False)
+
+    assert all(0.9 <= delay <= 1.1 for delay in clock.sleeps[:-1])
+
+
+def test_job_poller_without_timeout_polls_once(fake_clock):
+    job, clock = fake_clock
+    poller = job.JobPoller()
+
+    poller.poll(lambda: [])
+
+    assert poller.polls == 1
+    assert clock.sleeps == []
+
+
+@pytest.mark.parametrize("status,rc,expected", [
+    ("AC", "?", False),
+    ("AC", "", False),
+    ("AC", "0000", True),
+    ("CC", "0000", True),
+    ("JCLERR", "?", True),
+    ("ABEND", "S0C4", True),
+])
+def test_is_job_complete(job_mocker, status, rc, expected):
+    job, patch_spool = job_mocker
+
+    job_listing = Job("JOB00001", "HELLO", "ADMIN", status, rc)
+
+    assert job.is_job_complete(job_listing) == expected
+
+
+class FinishingQueue(SpoolCounter):
+    """A spool where the job at index i stays active until the poll tick
+    finish_after[i], a job finishing after None ticks never completes. The
+    ticks are counted from the sleeps of the fake clock, so that the number
+    of listing calls made in a tick does not change when jobs finish."""
+
+    def __init__(self, finish_after, clock, purge_after=None):
+        super(FinishingQueue, self).__init__(jobs=[
+            Job("JOB{0:05d}".format(i), "HELLO", "ADMIN", "AC", "?")
+            for i in range(len(finish_after))
+        ])
+        self.finish_after = finish_after
+        self.clock = clock
+        self.purge_after = purge_after or {}
+        self.listing_kwargs = []
+
+    def listing(self, job_id=None, owner=None, job_name=None):
+        tick = len(self.clock.sleeps) + 1
+        self.listing_kwargs.append(dict(job_id=job_id, owner=owner, job_name=job_name))
+        self.jobs = [
+            job._replace(status="CC", rc="0000")
+            if self.finish_after[i] is not None and tick >= self.finish_after[i] else job
+            for i, job in enumerate(self.jobs)
+        ]
+        entries = super(FinishingQueue, self).listing(job_id, owner, job_name)
+        return [job for job in entries if tick < self.purge_after.get(job.id, tick + 1)]
+
+
+def test_poll_jobs_one_listing_per_tick(fake_clock, job_mocker, mocker):
+    job, clock = fake_clock
+    mocker.patch.object(job, "_LISTING_FILTERS_SUPPORTED", True)
+    spool = FinishingQueue([i % 5 + 1 for i in range(40)], clock)
+    mocker.patch.object(job, "listing", spool.listing)
+    done = []
+
+    entries, poller = job.poll_jobs(
+        [entry.id for entry in spool.jobs], lambda entry: entry.status != "AC",
+        timeout=60, owner="ADMIN", on_done=lambda entry: done.append(entry.id))
+
+    # 40 jobs polled one at a time would have listed at least 40 times
+    assert spool.calls["listing"] == 5
+    assert poller.polls == 5
+    assert sorted(done) == sorted(entries) and len(done) == 40
+    # Output can be collected as jobs finish, the first ones done are reported first
+    assert done[:8] == ["JOB{0:05d}".format(i) for i in range(0, 40, 5)]
+    assert all(entry.status == "CC" for entry in entries.values())
+
+
+@pytest.mark.parametrize("filters_supported", [True, False])
+def test_poll_jobs_without_owner_lists_by_id(fake_clock, job_mocker, mocker, filters_supported):
+    job, clock = fake_clock
+    mocker.patch.object(job, "_LISTING_FILTERS_SUPPORTED", filters_supported)
+    spool = FinishingQueue([3, 3, 3, None, None], clock)
+    spool.jobs[4] = Job("JOB99999", "OTHER", "BATCH", "AC", "?")
+    mocker.patch.object(job, "listing", spool.listing)
+
+    entries, poller = job.poll_jobs(
+        ["JOB00000", "JOB00001", "JOB00002"], lambda entry: entry.status != "AC", timeout=60)
+
+    assert poller.polls == 3
+    # The whole spool is never listed, the first tick lists each job by its ID
+    assert all(kwargs["job_id"] or kwargs["owner"] for kwargs in spool.listing_kwargs)
+    assert [kwargs["job_id"] for kwargs in spool.listing_kwargs[:3]] == ["JOB00000", "JOB00001", "JOB00002"]
+    if filters_supported:
+        # Once listed, the jobs of a single owner are listed together
+        assert spool.listing_kwargs[3:] == [dict(job_id=None, owner="ADMIN", job_name=None)] * 2
+    else:
+        assert len(spool.listing_kwargs) == 9
+    assert spool.listed_entries <= 2 * 4 + 3
+
+
+def test_poll_jobs_single_job_lists_by_id(fake_clock, job_mocker, mocker):
+    job, clock = fake_clock
+    spool = FinishingQueue([2, 1], clock)
+    listing = mocker.patch.object(job, "listing", side_effect=spool.listing)
+
+    entries, poller = job.poll_jobs(["JOB00000"], lambda entry: entry.status != "AC", timeout=60)
+
+    assert list(entries) == ["JOB00000"]
+    assert listing.call_args_list[0][1] == {"job_id": "JOB00000"}
+
+
+def test_poll_jobs_purged_and_missing_jobs(fake_clock, job_mocker, mocker):
+    job, clock = fake_clock
+    spool = FinishingQueue([None, None], clock, purge_after={"JOB00000": 3})
+    mocker.patch.object(job, "listing", spool.listing)
+    done = []
+
+    entries, poller = job.poll_jobs(
+        ["JOB00000", "JOB00001", "JOB99999"], lambda entry: entry.status != "AC",
+        timeout=10, on_done=lambda entry: done.append(entry.id))
+
+    # The purged job is done with its last entry, the others wait for the timeout
+    assert done == ["JOB00000"]
+    assert entries["JOB00000"].status == "AC"
+    assert "JOB99999" not in entries
+    assert poller.duration == 10
+
+
+def test_poll_jobs_wait_for_any(fake_clock, job_mocker, mocker):
+    job, clock = fake_clock
+    spool = FinishingQueue([None, 3, None], clock)
+    mocker.patch.object(job, "listing", spool.listing)
+    done = []
+
+    entries, poller = job.poll_jobs(
+        [entry.id for entry in spool.jobs], lambda entry: entry.status != "AC",
+        timeout=60, on_done=lambda entry: done.append(entry.id), wait_for_all=False)
+
+    assert done == ["JOB00001"]
+    assert poller.polls == 3
+
+
+def synthetic_queue(size):
+    """A spool queue where one job in a thousand is a payroll job."""
+    names = ["PAYROLL", "BACKUP", "DB2UTIL", "COMPILE", "LINKEDIT"]
+    owners = ["ADMIN", "BATCH", "DBA"]
+    jobs = []
+    for i in range(size):
+        name = names[0] if i % 1000 == 0 else names[1 + i % (len(names) - 1)]
+        jobs.append(Job("J{0:07d}".format(i), name, owners[i % len(owners)], "CC", "0000"))
+    return jobs
+
+
+@pytest.mark.parametrize("filters_supported", [True, False])
+def test_job_status_listing_filters_50k_queue(job_mocker, mocker, filters_supported):
+    job, patch_spool = job_mocker
+    mocker.patch.object(job, "_LISTING_FILTERS_SUPPORTED", filters_supported)
+    spool = patch_spool(jobs=synthetic_queue(50000))
+
+    jobs = job.job_status(job_name="PAY*", dd_scan=False)
+
+    assert len(jobs) == 50
+    assert all(entry["job_name"] == "PAYROLL" for entry in jobs)
+    assert spool.calls["listing"] == 1
+    assert spool.listed_entries == (50 if filters_supported else 50000)
+
+
+def test_job_status_listing_filters_fallback(job_mocker, mocker):
+    job, patch_spool = job_mocker
+    mocker.patch.object(job, "_LISTING_FILTERS_SUPPORTED", True)
+    spool = patch_spool(jobs=synthetic_queue(2000))
+
+    def listing_without_filters(job_id=None):
+        return spool.listing(job_id=job_id)
+    mocker.patch.object(job, "listing", listing_without_filters)
+
+    jobs = job.job_status(owner="ADMIN", job_name="PAY*", dd_scan=False)
+
+    assert [entry["job_id"] for entry in jobs] == ["J0000000"]
+    assert job._LISTING_FILTERS_SUPPORTED is False
+
+
+@pytest.mark.parametrize("owner,job_name,expected", [
+    ("*", "*", {}),
+    ("", "", {}),
+    ("ADMIN", "*", {"owner": "ADMIN"}),
+    ("*", "PAYROLL", {"job_name": "PAYROLL"}),
+    ("*", "PAY*", {"job_name": "PAY*"}),
+    ("*", "P*Y*L", {"job_name": "P*"}),
+    ("*", "*ROLL", {}),
+    ("ADMIN", "PAY?OLL", {"owner": "ADMIN", "job_name": "PAY*"}),
+])
+def test_listing_filters(job_mocker, mocker, owner, job_name, expected):
+    job, patch_spool = job_mocker
+    mocker.patch.object(job, "_LISTING_FILTERS_SUPPORTED", True)
+
+    assert job._listing_filters(owner, job_name) == expected
+
+
+class DummyPjdd(object):
+    """Stands in for the pjdd process, counting how many lines were read
+    from its output before the process was stopped."""
+
+    instances = []
+    rc = 0
+    error = b""
+
+    def __init__(self, args, num_lines=100000, stderr=None, **kwargs):
+        self.args = args
+        self.num_lines = num_lines
+        self.lines_read = 0
+        self.killed = False
+        self.returncode = None
+        self.stdout = self
+        self.stderr = stderr
+        DummyPjdd.instances.append(self)
+
+    def __iter__(self):
+        for i in range(self.num_lines):
+            self.lines_read += 1
+            yield "LINE {0:06d}\n".format(i)
+
+    def poll(self):
+        return 0 if self.lines_read == self.num_lines else None
+
+    def kill(self):
+        self.killed = True
+
+    def close(self):
+        pass
+
+    def wait(self):
+        if self.returncode is None:
+            self.returncode = -9 if self.killed else DummyPjdd.rc
+            if self.stderr is not None and not self.killed:
+                self.stderr.write(DummyPjdd.error)
+        return self.returncode
+
+
+@pytest.fixture(scope="function")
+def pjdd_mocker(job_mocker, mocker):
+    job, patch_spool = job_mocker
+    DummyPjdd.instances = []
+    mocker.patch.object(DummyPjdd, "rc", 0)
+    mocker.patch.object(DummyPjdd, "error", b"")
+    mocker.patch.object(job, "Popen", DummyPjdd)
+    yield job, patch_spool
+
+
+def test_job_output_max_lines_stops_reading(pjdd_mocker):
+    job, patch_spool = pjdd_mocker
+    spool = patch_spool(num_jobs=1, num_dds=3)
+
+    jobs = job.job_output(job_id="JOB00000", dd_name="SYSUT0", max_lines=10)
+
+    dd = jobs[0]["ddnames"][0]
+    assert dd["content"] == ["LINE {0:06d}".format(i) for i in range(10)]
+    assert dd["truncated"] is True
+    assert dd["record_count"] == "1"
+    assert spool.calls["read_output"] == 0
+    pjdd = DummyPjdd.instances[0]
+    assert pjdd.args == ["pjdd", "JOB00000", "STEP0001", "SYSUT0"]
+    assert pjdd.lines_read == 11
+    assert pjdd.killed
+
+
+def test_job_output_pjdd_failure(pjdd_mocker, mocker):
+    job, patch_spool = pjdd_mocker
+    patch_spool(num_jobs=1, num_dds=3)
+    mocker.patch.object(DummyPjdd, "rc", 8)
+    mocker.patch.object(DummyPjdd, "error", b"BGYSC5201E Unable to read SYSUT0\n")
+    mocker.patch.object(job, "Popen", lambda args, **kwargs: DummyPjdd(args, num_lines=0, **kwargs))
+
+    # A failed read is not returned as an empty DD
+    with pytest.raises(job.DDReadError) as err:
+        job.job_output(job_id="JOB00000", dd_name="SYSUT0", max_lines=10)
+
+    assert "SYSUT0" in err.value.msg
+    assert "RC=8" in err.value.msg
+    assert "BGYSC5201E" in err.value.msg
+
+
+def test_job_output_tail_lines(pjdd_mocker):
+    job, patch_spool = pjdd_mocker
+    patch_spool(num_jobs=1, num_dds=3)
+
+    jobs = job.job_output(job_id="JOB00000", dd_name="SYSUT0", tail_lines=3)
+
+    dd = jobs[0]["ddnames"][0]
+    assert dd["content"] == ["LINE 099997", "LINE 099998", "LINE 099999"]
+    assert dd["truncated"] is True
+    assert not DummyPjdd.instances[0].killed
+
+
+def test_job_output_max_bytes(pjdd_mocker):
+    job, patch_spool = pjdd_mocker
+    patch_spool(num_jobs=1, num_dds=3)
+
+    jobs = job.job_output(job_id="JOB00000", dd_name="SYSUT0", max_bytes=50)
+
+    # Each line is 11 bytes plus its new line
+    dd = jobs[0]["ddnames"][0]
+    assert len(dd["content"]) == 4
+    assert dd["truncated"] is True
+    assert DummyPjdd.instances[0].lines_read == 5
+
+
+def test_job_output_tail_lines_and_max_bytes(pjdd_mocker):
+    job, patch_spool = pjdd_mocker
+    patch_spool(num_jobs=1, num_dds=3)
+
+    jobs = job.job_output(job_id="JOB00000", dd_name="SYSUT0", tail_lines=10, max_bytes=30)
+
+    assert jobs[0]["ddnames"][0]["content"] == ["LINE 099998", "LINE 099999"]
+
+
+def test_job_output_limits_not_reached(pjdd_mocker, mocker):
+    job, patch_spool = pjdd_mocker
+    patch_spool(num_jobs=1, num_dds=3)
+    mocker.patch.object(job, "Popen", lambda args, **kwargs: DummyPjdd(args, num_lines=5))
+
+    jobs = job.job_output(job_id="JOB00000", dd_name="SYSUT0", max_lines=10)
+
+    assert len(jobs[0]["ddnames"][0]["content"]) == 5
+    assert jobs[0]["ddnames"][0]["truncated"] is False
+
+
+@pytest.mark.parametrize("limits", [
+    {"max_lines": 0},
+    {"max_bytes": -1},
+    {"max_lines": 10, "tail_lines": 10},
+])
+def test_job_output_invalid_limits(pjdd_mocker, limits):
+    job, patch_spool = pjdd_mocker
+    patch_spool()
+
+    with pytest.raises(ValueError):
+        job.job_output(job_id="JOB00000", **limits)
+
+
+def test_job_output_search(job_mocker):
+    job, patch_spool = job_mocker
+    patch_spool(num_jobs=1, num_dds=5)
+
+    jobs = job.job_output(job_id="JOB00000", search=["IEF142I", r"RC=\d+"])
+
+    assert jobs[0]["matches"] == [
+        {"ddname": "JESMSGLG", "stepname": "JES2", "line_number": 3,
+         "line": " 10.25.48 JOB00134  $HASP395 HELLO    ENDED - RC=0000"},
+        {"ddname": "JESYSMSG", "stepname": "JES2", "line_number": 1,
+         "line": " IEF142I HELLO STEP0001 - STEP WAS EXECUTED - COND CODE 0000"},
+    ]
+    assert all("content" not in dd for dd in jobs[0]["ddnames"])
+    assert len(jobs[0]["ddnames"]) == 5
+    # The ret_code is still parsed from the whole content
+    assert jobs[0]["ret_code"]["steps"] == [{"step_name": "STEP0001", "step_cc": 0}]
+    assert jobs[0]["class"] == "R"
+
+
+def test_job_output_search_context(job_mocker):
+    job, patch_spool = job_mocker
+    patch_spool(num_jobs=1, num_dds=5)
+
+    jobs = job.job_output(job_id="JOB00000", dd_name="JESMSGLG", search="HASP373", search_context=1)
+
+    match = jobs[0]["matches"][0]
+    assert match["line_number"] == 2
+    assert match["before"] == [JESMSGLG.split("\n")[0]]
+    assert match["after"] == [" 10.25.48 JOB00134  $HASP395 HELLO    ENDED - RC=0000"]
+
+
+def test_job_output_search_no_match(job_mocker):
+    job, patch_spool = job_mocker
+    patch_spool(num_jobs=1, num_dds=5)
+
+    jobs = job.job_output(job_id="JOB00000", search=["IEF450I"])
+
+    assert jobs[0]["matches"] == []
+
+
+@pytest.mark.parametrize("search,search_context", [(["ABEND("], 0), (["ABEND"], -1)])
+def test_job_output_search_invalid(job_mocker, search, search_context):
+    job, patch_spool = job_mocker
+    patch_spool()
+
+    with pytest.raises(ValueError):
+        job.job_output(job_id="JOB00000", search=search, search_context=search_context)
+
+
+def test_job_output_cache_completed_job(job_mocker, tmp_path):
+    job, patch_spool = job_mocker
+    spool = patch_spool(num_dds=5)
+    cache_dir = str(tmp_path / "cache")
+
+    first = job.job_output(job_id="JOB00000", cache_dir=cache_dir)
+    calls = dict(spool.calls)
+    second = job.job_output(job_id="JOB00000", cache_dir=cache_dir)
+
+    assert second == first
+    assert calls == {"listing": 2, "list_dds": 1, "read_output": 5}
+    # A cache hit only lists the job to make sure it was not purged
+    assert spool.calls == {"listing": 3, "list_dds": 1, "read_output": 5}
+
+    # A different request is cached separately
+    job.job_output(job_id="JOB00000", dd_name="JESMSGLG", cache_dir=cache_dir)
+    assert spool.calls["read_output"] == 6
+    assert len(list((tmp_path / "cache").iterdir())) == 2
+
+
+def test_job_output_cache_bypassed_for_active_job(job_mocker, tmp_path):
+    job, patch_spool = job_mocker
+    spool = patch_spool(jobs=[Job("JOB00000", "HELLO", "ADMIN", "AC", "?")])
+    cache_dir = str(tmp_path / "cache")
+
+    job.job_output(job_id="JOB00000", cache_dir=cache_dir)
+    job.job_output(job_id="JOB00000", cache_dir=cache_dir)
+
+    assert spool.calls["list_dds"] == 2
+    assert not (tmp_path / "cache").exists()
+
+
+def test_job_output_cache_invalidated_when_purged(job_mocker, tmp_path):
+    job, patch_spool = job_mocker
+    spool = patch_spool()
+    cache_dir = str(tmp_path / "cache")
+
+    job.job_output(job_id="JOB00000", cache_dir=cache_dir)
+    assert len(list((tmp_path / "cache").iterdir())) == 1
+
+    spool.jobs = []
+    purged = job.job_output(job_id="JOB00000", cache_dir=cache_dir)
+
+    assert purged[0]["ret_code"]["msg_txt"] == "The job could not be found."
+    assert list((tmp_path / "cache").iterdir()) == []
+
+
+def test_job_output_cache_skips_job_not_found(job_mocker, tmp_path):
+    job, patch_spool = job_mocker
+    spool = patch_spool(num_dds=2)
+    dds = spool.dds
+    cache_dir = str(tmp_path / "cache")
+
+    # The job is listed as completed but its DDs are not available yet
+    spool.dds = []
+    not_found = job.job_output(job_id="JOB00000", cache_dir=cache_dir)
+
+    assert not_found[0]["ret_code"]["msg_txt"] == "The job could not be found."
+    assert not (tmp_path / "cache").exists() or list((tmp_path / "cache").iterdir()) == []
+
+    spool.dds = dds
+    found = job.job_output(job_id="JOB00000", cache_dir=cache_dir)
+
+    assert [dd["ddname"] for dd in found[0]["ddnames"]] == ["JESMSGLG", "JESYSMSG"]
+    assert len(list((tmp_path / "cache").iterdir())) == 1
+
+
+class GrowingPjdd(DummyPjdd):
+    """A pjdd process for a DD of an active job that has num_lines records."""
+
+    num_lines = 0
+
+    def __init__(self, args, **kwargs):
+        super(GrowingPjdd, self).__init__(args, num_lines=GrowingPjdd.num_lines)
+
+
+@pytest.fixture(scope="function")
+def follow_mocker(pjdd_mocker, mocker):
+    job, patch_spool = pjdd_mocker
+    mocker.patch.object(job, "Popen", GrowingPjdd)
+    spool = patch_spool(jobs=[Job("JOB00000", "HELLO", "ADMIN", "AC", "?")], num_dds=3)
+
+    def write_records(count):
+        GrowingPjdd.num_lines = count
+        for dd in spool.dds:
+            dd["recnum"] = str(count)
+
+    yield job, spool, write_records
+
+
+def test_job_output_follow_returns_new_records(follow_mocker):
+    job, spool, write_records = follow_mocker
+
+    write_records(5)
+    first = job.job_output(job_id="JOB00000", dd_name="SYSUT0", dd_offsets={})
+    write_records(8)
+    second = job.job_output(job_id="JOB00000", dd_name="SYSUT0", dd_offsets=first[0]["offsets"])
+
+    assert first[0]["ddnames"][0]["content"] == ["LINE {0:06d}".format(i) for i in range(5)]
+    assert first[0]["offsets"] == {"100": 5}
+    dd = second[0]["ddnames"][0]
+    assert dd["content"] == ["LINE {0:06d}".format(i) for i in range(5, 8)]
+    assert (dd["offset"], dd["next_offset"]) == (5, 8)
+    assert second[0]["offsets"] == {"100": 8}
+
+
+def test_job_output_follow_skips_dds_without_new_records(follow_mocker):
+    job, spool, write_records = follow_mocker
+
+    write_records(5)
+    jobs = job.job_output(job_id="JOB00000", dd_offsets={"2": 5, "4": 5, "100": 3})
+
+    # Only the DD with records past its offset is read from the spool
+    assert len(DummyPjdd.instances) == 1
+    assert DummyPjdd.instances[0].args[-1] == "SYSUT0"
+    assert [dd["content"] for dd in jobs[0]["ddnames"]] == [[], [], ["LINE 000003", "LINE 000004"]]
+    assert jobs[0]["offsets"] == {"2": 5, "4": 5, "100": 5}
+
+
+def test_job_output_follow_with_max_lines_resumes(follow_mocker):
+    job, spool, write_records = follow_mocker
+
+    write_records(10)
+    first = job.job_output(job_id="JOB00000", dd_name="SYSUT0", dd_offsets={}, max_lines=4)
+    second = job.job_output(job_id="JOB00000", dd_name="SYSUT0", dd_offsets=first[0]["offsets"],
+                            max_lines=4, search=["LINE 00000[5-9]"])
+
+    assert first[0]["ddnames"][0]["truncated"] is True
+    assert first[0]["offsets"] == {"100": 4}
+    assert [(match["line_number"], match["line"]) for match in second[0]["matches"]] == [
+        (6, "LINE 000005"), (7, "LINE 000006"), (8, "LINE 000007")]
+    assert second[0]["offsets"] == {"100": 8}
+
+
+@pytest.mark.parametrize("dd_offsets", [{"100": -1}, {"100": "x"}, ["100"]])
+def test_job_output_follow_invalid_offsets(follow_mocker, dd_offsets):
+    job, spool, write_records = follow_mocker
+
+    with pytest.raises(ValueError):
+        job.job_output(job_id="JOB00000", dd_offsets=dd_offsets)
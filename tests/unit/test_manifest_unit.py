@@ -0,0 +1,136 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) IBM Corporation 2023
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+from hashlib import sha256
+import os
+
+from ibm_zos_core.plugins.module_utils.manifest import (
+    build_manifest,
+    dest_manifest,
+    diff_manifests,
+    load_sync_state,
+    save_sync_state,
+    sync_conversion,
+)
+
+
+def write_file(path, content):
+    if not os.path.isdir(os.path.dirname(path)):
+        os.makedirs(os.path.dirname(path))
+    with open(path, "wb") as outfile:
+        outfile.write(content)
+
+
+def test_build_manifest(tmp_path):
+    root = str(tmp_path)
+    write_file(os.path.join(root, "file1"), b"data")
+    write_file(os.path.join(root, "sub", "file2"), b"")
+    os.mkdir(os.path.join(root, "empty"))
+
+    manifest = build_manifest(root)
+
+    assert sorted(manifest["directories"]) == ["empty", "sub"]
+    assert sorted(manifest["files"]) == ["file1", os.path.join("sub", "file2")]
+    assert manifest["files"]["file1"]["size"] == 4
+    assert manifest["files"]["file1"]["checksum"] == sha256(b"data").hexdigest()
+    assert manifest["files"]["file1"]["mtime"] == os.stat(os.path.join(root, "file1")).st_mtime
+
+
+def test_dest_manifest_uses_valid_state_entries(tmp_path):
+    root = str(tmp_path)
+    write_file(os.path.join(root, "synced"), b"converted")
+    write_file(os.path.join(root, "modified"), b"converted")
+    write_file(os.path.join(root, "unknown"), b"data")
+    state = {}
+    for name in ("synced", "modified"):
+        file_stat = os.stat(os.path.join(root, name))
+        state[name] = dict(size=file_stat.st_size, mtime=file_stat.st_mtime, checksum="source-" + name)
+    write_file(os.path.join(root, "modified"), b"changed on the node")
+
+    manifest = dest_manifest(root, state)
+    assert manifest["files"] == {"synced": "source-synced", "modified": None, "unknown": None}
+
+    # Without encoding conversion the files can be compared by their own checksum
+    manifest = dest_manifest(root, state, hash_files=True)
+    assert manifest["files"]["unknown"] == sha256(b"data").hexdigest()
+    assert manifest["files"]["modified"] == sha256(b"changed on the node").hexdigest()
+    assert manifest["files"]["synced"] == "source-synced"
+
+
+def test_dest_manifest_missing_directory(tmp_path):
+    assert dest_manifest(os.path.join(str(tmp_path), "missing"), {}) == dict(files={}, directories=[])
+
+
+def test_diff_manifests():
+    src = dict(
+        files={
+            "same": dict(checksum="a"),
+            "changed": dict(checksum="b"),
+            "new": dict(checksum="c"),
+            os.path.join("sub", "file"): dict(checksum="d"),
+        },
+        directories=["sub"],
+    )
+    dest = dict(
+        files={
+            "same": "a",
+            "changed": "old",
+            "unknown": None,
+            os.path.join("sub", "file"): None,
+            os.path.join("gone", "deep", "file"): "e",
+        },
+        directories=["sub", "gone", os.path.join("gone", "deep")],
+    )
+
+    changed, extraneous = diff_manifests(src, dest)
+
+    assert changed == ["changed", "new", os.path.join("sub", "file")]
+    # Deepest first, so each directory is empty once it is reached
+    assert extraneous == [
+        os.path.join("gone", "deep", "file"), os.path.join("gone", "deep"), "gone", "unknown"
+    ]
+
+
+def test_sync_state_round_trip(tmp_path):
+    state_dir = os.path.join(str(tmp_path), "state")
+    dest = os.path.join(str(tmp_path), "dest")
+    files = {"file1": dict(size=4, mtime=1690000000.123456, checksum="a")}
+
+    assert load_sync_state(dest, state_dir=state_dir) == {}
+    save_sync_state(dest, files, state_dir=state_dir)
+    assert load_sync_state(dest, state_dir=state_dir) == files
+    assert load_sync_state(os.path.join(str(tmp_path), "other"), state_dir=state_dir) == {}
+    assert [name for name in os.listdir(state_dir) if name.endswith(".tmp")] == []
+
+
+def test_sync_state_ignored_for_other_conversion(tmp_path):
+    state_dir = os.path.join(str(tmp_path), "state")
+    dest = os.path.join(str(tmp_path), "dest")
+    files = {"file1": dict(size=4, mtime=1690000000.123456, checksum="a")}
+    conversion = sync_conversion({"from": "ISO8859-1", "to": "IBM-1047"})
+
+    save_sync_state(dest, files, conversion=conversion, state_dir=state_dir)
+
+    assert load_sync_state(dest, conversion=conversion, state_dir=state_dir) == files
+    # The destination files no longer match their source once copied with other settings
+    for other in [
+        sync_conversion({"from": "ISO8859-1", "to": "IBM-037"}),
+        sync_conversion({"from": "UTF-8", "to": "IBM-1047"}),
+        sync_conversion(is_binary=True),
+        None,
+    ]:
+        assert load_sync_state(dest, conversion=other, state_dir=state_dir) == {}
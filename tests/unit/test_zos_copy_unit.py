@@ -0,0 +1,691 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) IBM Corporation 2023
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import errno
+import io
+import os
+import shutil
+import tarfile
+
+import pytest
+
+# The action plugin runs on the controller and needs no zoautil_py mock, it is
+# imported once so that the Ansible plugin loader types are not defined twice
+from ibm_zos_core.plugins.action.zos_copy import (
+    INLINE_CONTENT_MAX_SIZE,
+    _check_copy_args,
+    _create_batch_archive,
+    _create_transfer_archive,
+    _inline_content,
+    _inline_module_content,
+    _update_result,
+)
+
+IMPORT_NAME = "ibm_zos_core.plugins.modules.zos_copy"
+
+
+def populate_tree(root):
+    os.makedirs(os.path.join(root, "sub", "nested"))
+    files = {
+        "file1": b"DUMMY DATA ---- LINE 001 ------\n",
+        "file2": b"",
+        os.path.join("sub", "file3"): b"\x00\x01\x02",
+        os.path.join("sub", "nested", "file4"): b"DUMMY DATA\n" * 100,
+    }
+    for name, content in files.items():
+        with open(os.path.join(root, name), "wb") as outfile:
+            outfile.write(content)
+    return files
+
+
+@pytest.mark.parametrize("compress", [False, True])
+def test_transfer_archive_round_trip(zos_import_mocker, tmp_path, compress):
+    mocker, importer = zos_import_mocker
+    zos_copy = importer(IMPORT_NAME)
+    src = os.path.join(str(tmp_path), "source")
+    files = populate_tree(src)
+
+    archive_path, size = _create_transfer_archive(src + "/", compress=compress)
+    try:
+        # The size comes from the archive manifest, covering every regular file
+        assert size == sum(len(content) for content in files.values())
+
+        # Stand in for the SFTP transfer to the remote temp path
+        temp_path = os.path.join(str(tmp_path), "ansible-zos-copy-payload")
+        os.rename(archive_path, temp_path)
+        zos_copy.extract_transfer_archive(temp_path)
+    finally:
+        if os.path.exists(archive_path):
+            os.remove(archive_path)
+
+    # The same layout a 'put -r' of the directory creates under the temp path
+    assert os.listdir(temp_path) == ["source"]
+    for name, content in files.items():
+        with open(os.path.join(temp_path, "source", name), "rb") as infile:
+            assert infile.read() == content
+    assert not os.path.exists(temp_path + ".archive")
+
+
+def test_extract_transfer_archive_rejects_outside_members(zos_import_mocker, tmp_path):
+    mocker, importer = zos_import_mocker
+    zos_copy = importer(IMPORT_NAME)
+    outside = os.path.join(str(tmp_path), "outside")
+    with open(outside, "wb") as outfile:
+        outfile.write(b"data")
+
+    temp_path = os.path.join(str(tmp_path), "ansible-zos-copy-payload")
+    with tarfile.open(temp_path, "w") as archive:
+        archive.add(outside, arcname="../outside")
+
+    with pytest.raises(tarfile.TarError):
+        zos_copy.extract_transfer_archive(temp_path)
+    assert os.listdir(temp_path) == []
+
+
+def test_sync_to_uss(zos_import_mocker, tmp_path, monkeypatch):
+    mocker, importer = zos_import_mocker
+    zos_copy = importer(IMPORT_NAME)
+    # The sync state is recorded under the home directory
+    monkeypatch.setenv("HOME", str(tmp_path))
+    src = os.path.join(str(tmp_path), "source")
+    dest = os.path.join(str(tmp_path), "dest")
+    files = populate_tree(src)
+    handler = zos_copy.USSCopyHandler(mocker.MagicMock(), common_file_args=None)
+
+    synced_dest, copied, deleted = handler.sync_to_uss(src, dest, None, None)
+    assert synced_dest == os.path.join(dest, "source")
+    assert sorted(copied) == sorted(files)
+    assert deleted == []
+
+    # Nothing changed, the sync state is enough to compare the files
+    synced_dest, copied, deleted = handler.sync_to_uss(src, dest, None, None)
+    assert copied == []
+
+    with open(os.path.join(src, "file2"), "wb") as outfile:
+        outfile.write(b"changed")
+    os.remove(os.path.join(src, "sub", "file3"))
+    with open(os.path.join(synced_dest, "extra"), "wb") as outfile:
+        outfile.write(b"extra")
+
+    synced_dest, copied, deleted = handler.sync_to_uss(src, dest, None, None)
+    assert copied == ["file2"]
+    # Extraneous files are kept unless asked otherwise
+    assert deleted == []
+    assert os.path.exists(os.path.join(synced_dest, "extra"))
+
+    synced_dest, copied, deleted = handler.sync_to_uss(src + "/", synced_dest, None, None, delete=True)
+    assert copied == []
+    assert sorted(deleted) == ["extra", os.path.join("sub", "file3")]
+    with open(os.path.join(synced_dest, "file2"), "rb") as infile:
+        assert infile.read() == b"changed"
+
+
+def test_sync_to_uss_from_transferred_changes(zos_import_mocker, tmp_path, monkeypatch):
+    mocker, importer = zos_import_mocker
+    zos_copy = importer(IMPORT_NAME)
+    monkeypatch.setenv("HOME", str(tmp_path))
+    local_src = os.path.join(str(tmp_path), "local", "source")
+    dest = os.path.join(str(tmp_path), "dest")
+    populate_tree(local_src)
+    src_manifest = zos_copy.manifest.build_manifest(local_src)
+    os.makedirs(os.path.join(dest, "sub"))
+    # Copied before without a sync, in another encoding, so it can not be compared
+    with open(os.path.join(dest, "file1"), "wb") as outfile:
+        outfile.write(b"converted")
+
+    # The changed files, here all of them, were transferred under the temp path
+    temp_path = os.path.join(str(tmp_path), "ansible-zos-copy-payload")
+    for name in src_manifest["files"]:
+        write_path = os.path.join(temp_path, "source", name)
+        if not os.path.isdir(os.path.dirname(write_path)):
+            os.makedirs(os.path.dirname(write_path))
+        with open(write_path, "wb") as outfile:
+            outfile.write(b"converted again")
+
+    handler = zos_copy.USSCopyHandler(mocker.MagicMock(), common_file_args=None)
+    synced_dest, copied, deleted = handler.sync_to_uss(
+        local_src + "/", dest, None, temp_path, src_manifest=src_manifest
+    )
+    assert synced_dest == dest
+    assert sorted(copied) == sorted(src_manifest["files"])
+
+    # Recorded with the checksums of the local files they were copied from
+    state = zos_copy.manifest.load_sync_state(dest)
+    assert state["file1"]["checksum"] == src_manifest["files"]["file1"]["checksum"]
+    assert zos_copy.manifest.diff_manifests(
+        src_manifest, zos_copy.manifest.dest_manifest(dest, state)
+    ) == ([], [])
+
+
+def test_build_iebcopy_sysin(zos_import_mocker):
+    mocker, importer = zos_import_mocker
+    zos_copy = importer(IMPORT_NAME)
+
+    assert zos_copy.build_iebcopy_sysin() == "   COPY OUTDD=OUTPUT,INDD=((INPUT,R))"
+    assert zos_copy.build_iebcopy_sysin(["member1"], ["NEWNAME"]).splitlines() == [
+        "   COPY OUTDD=OUTPUT,INDD=((INPUT,R))",
+        "   SELECT MEMBER=((MEMBER1,NEWNAME,R))",
+    ]
+
+    members = ["MEM{0:05}".format(i) for i in range(100)]
+    statements = zos_copy.build_iebcopy_sysin(members).splitlines()
+    assert all(len(statement) <= 71 for statement in statements)
+    selected = "".join(statement[len("   SELECT MEMBER=("):-1] + "," for statement in statements[1:])
+    assert selected == "".join("({0},,R),".format(member) for member in members)
+
+
+@pytest.mark.parametrize("src,src_member,select", [
+    ("SOME.SRC.PDS", False, False),
+    ("SOME.SRC.PDS(ABC*)", False, True),
+    ("SOME.SRC.PDS(ABC1)", True, True),
+])
+def test_copy_pds_to_pdse_single_iebcopy(zos_import_mocker, src, src_member, select):
+    mocker, importer = zos_import_mocker
+    zos_copy = importer(IMPORT_NAME)
+    list_members = mocker.patch.object(zos_copy.datasets, "list_members")
+    list_members.side_effect = lambda name: ["ABC1", "ABC2"] if name.startswith("SOME.SRC") else ["ABC2", "OTHER"]
+    iebcopy = mocker.patch.object(zos_copy, "iebcopy", return_value=(0, "", ""))
+    copy = mocker.patch.object(zos_copy.datasets, "_copy")
+
+    handler = zos_copy.PDSECopyHandler(mocker.MagicMock())
+    handler.copy_to_pdse(src, None, None, "SOME.DEST.PDS", "PDSE", src_member=src_member)
+
+    iebcopy.assert_called_once()
+    sysin = iebcopy.call_args[0][0]
+    assert ("SELECT" in sysin) == select
+    assert iebcopy.call_args[1]["dds"] == dict(OUTPUT="SOME.DEST.PDS", INPUT="SOME.SRC.PDS")
+    copy.assert_not_called()
+
+
+def test_copy_pds_to_pdse_falls_back_to_members(zos_import_mocker):
+    mocker, importer = zos_import_mocker
+    zos_copy = importer(IMPORT_NAME)
+    mocker.patch.object(zos_copy.datasets, "list_members", side_effect=[["MEM1", "MEM2"], ["MEM2"]])
+    mocker.patch.object(zos_copy, "iebcopy", return_value=(8, "IEB1", ""))
+    copy = mocker.patch.object(zos_copy.datasets, "_copy")
+    copy.side_effect = [
+        mocker.MagicMock(rc=0, stdout_response="", stderr_response=""),
+        mocker.MagicMock(rc=1, stdout_response="", stderr_response="error"),
+    ]
+
+    handler = zos_copy.PDSECopyHandler(mocker.MagicMock())
+    with pytest.raises(zos_copy.CopyOperationError) as err:
+        handler.copy_to_pdse("SOME.SRC.PDS", None, None, "SOME.DEST.PDS", "PDS")
+
+    assert copy.call_count == 2
+    # Reported from a single comparison of the member lists
+    assert err.value.overwritten_members == ["MEM2"]
+    assert err.value.new_members == ["MEM1"]
+
+
+def test_copy_pds_to_pdse_retries_only_members_not_copied(zos_import_mocker):
+    mocker, importer = zos_import_mocker
+    zos_copy = importer(IMPORT_NAME)
+    mocker.patch.object(zos_copy.datasets, "list_members", side_effect=[["MEM1", "MEM2", "MEM3"], []])
+    sysprint = (
+        "IEB154I MEM1     HAS BEEN SUCCESSFULLY COPIED\n"
+        "IEB139I MEM2     COULD NOT BE COPIED\n"
+        "IEB154I MEM3     HAS BEEN SUCCESSFULLY COPIED\n"
+    )
+    mocker.patch.object(zos_copy, "iebcopy", return_value=(8, sysprint, ""))
+    copy = mocker.patch.object(zos_copy.datasets, "_copy")
+    copy.return_value = mocker.MagicMock(rc=0, stdout_response="", stderr_response="")
+
+    handler = zos_copy.PDSECopyHandler(mocker.MagicMock())
+    handler.copy_to_pdse("SOME.SRC.PDS", None, None, "SOME.DEST.PDS", "PDS")
+
+    copy.assert_called_once()
+    assert copy.call_args[0][:2] == ("SOME.SRC.PDS(MEM2)", "SOME.DEST.PDS(MEM2)")
+
+
+def test_copy_pds_to_pdse_converted_source_skips_iebcopy(zos_import_mocker, tmp_path):
+    mocker, importer = zos_import_mocker
+    zos_copy = importer(IMPORT_NAME)
+    mocker.patch.object(zos_copy.datasets, "list_members", return_value=[])
+    iebcopy = mocker.patch.object(zos_copy, "iebcopy", return_value=(0, "", ""))
+    copy = mocker.patch.object(zos_copy.datasets, "_copy")
+    copy.return_value = mocker.MagicMock(rc=0, stdout_response="", stderr_response="")
+    conv_path = os.path.join(str(tmp_path), "converted")
+
+    handler = zos_copy.PDSECopyHandler(mocker.MagicMock())
+    handler.copy_to_pdse("SOME.SRC.PDS(MEM1)", None, conv_path, "SOME.DEST.PDS", "PDS", src_member=True)
+
+    iebcopy.assert_not_called()
+    copy.assert_called_once()
+
+
+@pytest.mark.parametrize("max_workers", [1, 4])
+def test_copy_uss_dir_to_pdse_collects_member_errors(zos_import_mocker, tmp_path, max_workers):
+    mocker, importer = zos_import_mocker
+    zos_copy = importer(IMPORT_NAME)
+    src = os.path.join(str(tmp_path), "source")
+    os.mkdir(src)
+    for name in ("mem1.txt", "mem2.txt", "mem3.txt", "mem4.txt"):
+        with open(os.path.join(src, name), "w") as outfile:
+            outfile.write(name)
+    mocker.patch.object(zos_copy.datasets, "list_members", return_value=["MEM1"])
+
+    def copy(src, dest, *args, **kwargs):
+        rc = 1 if dest.endswith(("(MEM2)", "(MEM4)")) else 0
+        return mocker.MagicMock(rc=rc, stdout_response="", stderr_response="error" if rc else "")
+
+    copy = mocker.patch.object(zos_copy.datasets, "_copy", side_effect=copy)
+
+    handler = zos_copy.PDSECopyHandler(mocker.MagicMock(), max_workers=max_workers)
+    with pytest.raises(zos_copy.CopyOperationError) as err:
+        handler.copy_to_pdse(src, None, None, "SOME.DEST.PDSE", "USS")
+
+    # A failed member does not stop the copy of the others
+    assert copy.call_count == 4
+    assert sorted(error["member"] for error in err.value.json_args["member_errors"]) == ["mem2", "mem4"]
+    assert err.value.overwritten_members == ["mem1"]
+    assert sorted(err.value.new_members) == ["mem2", "mem3", "mem4"]
+
+
+def test_copy_to_pdse_detects_load_library(zos_import_mocker):
+    mocker, importer = zos_import_mocker
+    zos_copy = importer(IMPORT_NAME)
+    mocker.patch.object(zos_copy.datasets, "list_members", side_effect=[["PGM1", "PGM2"], []])
+    mocker.patch.object(zos_copy.datasets, "listing", return_value=[mocker.MagicMock(recfm="U")])
+    copy = mocker.patch.object(zos_copy.datasets, "_copy")
+    copy.return_value = mocker.MagicMock(rc=0, stdout_response="", stderr_response="")
+
+    handler = zos_copy.PDSECopyHandler(mocker.MagicMock(), is_binary=True)
+    # Same source and destination data set, the members are copied one by one
+    handler.copy_to_pdse("SOME.LOAD(PGM*)", None, None, "SOME.LOAD", "PDSE")
+
+    assert [call[1]["options"] for call in copy.call_args_list] == ["-X", "-X"]
+    assert handler.failed_attempts == 0
+
+
+@pytest.mark.parametrize("max_workers", [1, 4])
+def test_copy_to_pdse_switches_to_program_objects(zos_import_mocker, tmp_path, max_workers):
+    mocker, importer = zos_import_mocker
+    zos_copy = importer(IMPORT_NAME)
+    src = os.path.join(str(tmp_path), "source")
+    os.mkdir(src)
+    for name in ("pgm1", "pgm2", "pgm3", "pgm4"):
+        with open(os.path.join(src, name), "w") as outfile:
+            outfile.write(name)
+    mocker.patch.object(zos_copy.datasets, "list_members", return_value=[])
+    mocker.patch.object(zos_copy.datasets, "listing", return_value=[mocker.MagicMock(recfm="FB")])
+
+    def copy(src, dest, *args, **kwargs):
+        if kwargs.get("options") == "-X":
+            return mocker.MagicMock(rc=0, stdout_response="", stderr_response="")
+        return mocker.MagicMock(rc=1, stdout_response="", stderr_response="FSUM8976 EDC5091I")
+
+    copy = mocker.patch.object(zos_copy.datasets, "_copy", side_effect=copy)
+
+    handler = zos_copy.PDSECopyHandler(mocker.MagicMock(), max_workers=max_workers)
+    handler.copy_to_pdse(src, None, None, "SOME.DEST.PDSE", "USS")
+
+    # Only the first member pays for the failed attempt
+    assert copy.call_count == 5
+    assert handler.failed_attempts == 1
+
+
+def test_update_result_keeps_failed_copy_attempts():
+    copy_res = dict(dest="SOME.DEST.PDSE", changed=True, ds_type="PO", failed_copy_attempts=1)
+    assert _update_result(False, copy_res, {})["failed_copy_attempts"] == 1
+    assert "failed_copy_attempts" not in _update_result(False, dict(dest="/tmp/dest", ds_type="USS"), {})
+
+
+def test_iter_records(zos_import_mocker):
+    mocker, importer = zos_import_mocker
+    zos_copy = importer(IMPORT_NAME)
+    content = b"\x15".join([b"A" * 10, b"", b"B" * 7]) + b"\x15"
+
+    # Records that span the blocks read are put back together
+    records = list(zos_copy.iter_records(io.BytesIO(content), block_size=4))
+    assert records == [b"A" * 10, b"", b"B" * 7]
+    assert list(zos_copy.iter_records(io.BytesIO(b"C\x15D"), block_size=1)) == [b"C", b"D"]
+
+
+def test_get_records_checksum_ignores_padding(zos_import_mocker):
+    mocker, importer = zos_import_mocker
+    zos_copy = importer(IMPORT_NAME)
+    src = [b"\xc8\xc5\xd3\xd3\xd6\x0d", b"\xe6\xd6\xd9\xd3\xc4"]
+    fixed = [b"\xc8\xc5\xd3\xd3\xd6" + b"\x40" * 75, b"\xe6\xd6\xd9\xd3\xc4" + b"\x40" * 75]
+
+    assert zos_copy.get_records_checksum(src, strip_blanks=True) == zos_copy.get_records_checksum(
+        fixed, strip_blanks=True
+    )
+    assert zos_copy.get_records_checksum(src) != zos_copy.get_records_checksum(fixed)
+    assert zos_copy.get_records_checksum(src) != zos_copy.get_records_checksum(src[:1])
+
+
+def test_is_content_identical(zos_import_mocker, tmp_path):
+    mocker, importer = zos_import_mocker
+    zos_copy = importer(IMPORT_NAME)
+    src = os.path.join(str(tmp_path), "src")
+    with open(src, "wb") as outfile:
+        outfile.write(b"\xc8\xc5\xd3\xd3\xd6\x15")
+    mocker.patch.object(zos_copy.datasets, "listing", return_value=[mocker.MagicMock(recfm="FB")])
+    dest_checksum = mocker.patch.object(zos_copy, "get_data_set_checksum")
+
+    dest_checksum.return_value = zos_copy.get_records_checksum([b"\xc8\xc5\xd3\xd3\xd6" + b"\x40" * 75], True)
+    assert zos_copy.is_content_identical(src, "USS", "SOME.DEST.SEQ", "SOME.DEST.SEQ")
+    dest_checksum.assert_called_once_with("SOME.DEST.SEQ", strip_blanks=True)
+
+    dest_checksum.return_value = zos_copy.get_records_checksum([b"\xe6\xd6\xd9\xd3\xc4"], True)
+    assert not zos_copy.is_content_identical(src, "USS", "SOME.DEST.SEQ", "SOME.DEST.SEQ")
+
+    # A destination that can not be read is never identical
+    dest_checksum.return_value = None
+    assert not zos_copy.is_content_identical(src, "USS", "SOME.DEST.SEQ", "SOME.DEST.SEQ")
+
+
+@pytest.mark.parametrize("newline", [b"\n", b"\x15"])
+@pytest.mark.parametrize("block_size", [3, 16, 1024])
+def test_profile_source(zos_import_mocker, tmp_path, newline, block_size):
+    mocker, importer = zos_import_mocker
+    zos_copy = importer(IMPORT_NAME)
+    records = [b"A" * 10, b"", b"B" * 25, b"C" * 4]
+    content = (b"\r" + newline).join(records) + b"\r" + newline
+    path = os.path.join(str(tmp_path), "src")
+    with open(path, "wb") as outfile:
+        outfile.write(content)
+
+    profile = zos_copy.profile_source(path, block_size=block_size)
+
+    assert profile["size"] == len(content)
+    assert profile["record_count"] == 4
+    # Carriage returns are not part of the records
+    assert profile["max_record_length"] == 25
+    assert profile["line_ending"] == "crlf"
+
+
+def test_profile_source_without_newline(zos_import_mocker, tmp_path):
+    mocker, importer = zos_import_mocker
+    zos_copy = importer(IMPORT_NAME)
+    path = os.path.join(str(tmp_path), "src")
+    with open(path, "wb") as outfile:
+        outfile.write(b"Hello world\nlast")
+
+    profile = zos_copy.profile_source(path)
+    assert (profile["record_count"], profile["max_record_length"], profile["line_ending"]) == (2, 11, "lf")
+
+    with open(path, "wb") as outfile:
+        outfile.write(b"")
+    profile = zos_copy.profile_source(path)
+    assert (profile["size"], profile["record_count"], profile["line_ending"]) == (0, 0, None)
+
+
+def test_create_seq_dataset_from_profile(zos_import_mocker):
+    mocker, importer = zos_import_mocker
+    zos_copy = importer(IMPORT_NAME)
+    ensure_present = mocker.patch.object(zos_copy.data_set.DataSet, "ensure_present")
+    src_profile = dict(size=4096, max_record_length=0)
+
+    # The file is not read again when its profile is given
+    zos_copy.create_seq_dataset_from_file("/nonexistent", "SOME.DEST.SEQ", True, False, src_profile=src_profile)
+
+    params = ensure_present.call_args[1]
+    assert params["record_format"] == "FB"
+    assert params["record_length"] == zos_copy.DEFAULT_RECORD_LENGTH
+    assert params["space_primary"] == 5
+
+
+@pytest.mark.parametrize("block_size", [1, 2, 3, 1024])
+def test_normalize_line_endings(zos_import_mocker, block_size):
+    mocker, importer = zos_import_mocker
+    zos_copy = importer(IMPORT_NAME)
+    content = b"LINE1\x0d\x15LINE\x0d2\x0d\x0d\x15\x15LAST\x0d"
+    outfile = io.BytesIO()
+
+    zos_copy.normalize_line_endings(io.BytesIO(content), outfile, block_size=block_size)
+
+    # Carriage returns are only removed before a newline, even across blocks
+    assert outfile.getvalue() == b"LINE1\x15LINE\x0d2\x15\x15LAST\x0d"
+
+
+@pytest.mark.skipif(shutil.which("iconv") is None, reason="requires iconv")
+@pytest.mark.parametrize("convert", [False, True])
+def test_create_temp_with_lf_endings(zos_import_mocker, tmp_path, convert):
+    mocker, importer = zos_import_mocker
+    zos_copy = importer(IMPORT_NAME)
+    src = os.path.join(str(tmp_path), "src")
+    with open(src, "wb") as outfile:
+        outfile.write(b"LINE1\x0d\x15LINE2\x0d\x15")
+    handler = zos_copy.CopyHandler(mocker.MagicMock())
+    tag = mocker.patch.object(handler, "_tag_file_encoding")
+
+    # The conversion output is streamed through the same pass
+    codes = dict(from_code="UTF-8", to_code="UTF-8") if convert else dict()
+    converted = handler.create_temp_with_lf_endings(src, **codes)
+    try:
+        with open(converted, "rb") as infile:
+            assert infile.read() == b"LINE1\x15LINE2\x15"
+        tag.assert_called_once_with(converted, zos_copy.encode.Defaults.DEFAULT_EBCDIC_MVS_CHARSET)
+    finally:
+        os.remove(converted)
+
+
+@pytest.mark.skipif(shutil.which("iconv") is None, reason="requires iconv")
+def test_create_temp_with_lf_endings_conversion_error(zos_import_mocker, tmp_path):
+    mocker, importer = zos_import_mocker
+    zos_copy = importer(IMPORT_NAME)
+    src = os.path.join(str(tmp_path), "src")
+    with open(src, "wb") as outfile:
+        outfile.write(b"LINE1\x0d\x15")
+    handler = zos_copy.CopyHandler(mocker.MagicMock())
+
+    with pytest.raises(zos_copy.CopyOperationError):
+        handler.create_temp_with_lf_endings(src, from_code="NOT-A-CODE-SET", to_code="UTF-8")
+
+
+def test_batch_archive_round_trip(zos_import_mocker, tmp_path):
+    mocker, importer = zos_import_mocker
+    zos_copy = importer(IMPORT_NAME)
+    src = os.path.join(str(tmp_path), "source")
+    files = populate_tree(src)
+    single_file = os.path.join(src, "file1")
+
+    archive_path, sizes = _create_batch_archive([
+        (single_file, "0", None),
+        (None, "1", u"inline content"),
+        (src, "2/source", None),
+    ])
+    temp_path = os.path.join(str(tmp_path), "ansible-zos-copy-payload")
+    os.rename(archive_path, temp_path)
+    zos_copy.extract_transfer_archive(temp_path)
+
+    # Each item finds its source where a transfer of it alone would be
+    assert sizes == [len(files["file1"]), len(b"inline content"), sum(len(content) for content in files.values())]
+    with open(os.path.join(temp_path, "0"), "rb") as infile:
+        assert infile.read() == files["file1"]
+    with open(os.path.join(temp_path, "1"), "rb") as infile:
+        assert infile.read() == b"inline content"
+    for name, content in files.items():
+        with open(os.path.join(temp_path, "2", "source", name), "rb") as infile:
+            assert infile.read() == content
+
+
+def test_check_copy_args(tmp_path):
+    local_file = os.path.join(str(tmp_path), "file")
+    with open(local_file, "wb") as outfile:
+        outfile.write(b"data")
+
+    assert _check_copy_args(dict(src=local_file, dest="/tmp/file")) is None
+    assert _check_copy_args(dict(content="data", dest="USER.SEQ")) is None
+    assert _check_copy_args(dict(src="USER.SEQ", dest="/tmp/file", remote_src=True)) is None
+    assert _check_copy_args(dict(src=local_file)) == "Destination is required"
+    assert _check_copy_args(dict(dest="/tmp/file")) == "'src' or 'content' is required"
+    assert _check_copy_args(dict(src=local_file, content="data", dest="/tmp/file")).startswith("Either")
+    assert _check_copy_args(dict(src=local_file, dest="USER.SEQ", mode="0644")).startswith("Cannot specify")
+    assert _check_copy_args(dict(src=local_file + "x", dest="/tmp/file")) == (
+        "The local file {0}x does not exist".format(os.path.realpath(local_file))
+    )
+
+
+def test_get_batch_groups(zos_import_mocker):
+    mocker, importer = zos_import_mocker
+    zos_copy = importer(IMPORT_NAME)
+    items = [
+        dict(src="/local/a", dest="/u/app/conf/"),
+        dict(src="/local/b", dest="USER.PDSE(MEM1)"),
+        dict(src="/local/c", dest="/u/other/file"),
+        dict(src="/local/d", dest="user.pdse(mem2)"),
+        dict(src="/u/app/conf/app.properties", dest="USER.SEQ", remote_src=True),
+        dict(src="/local/e", dest="USER.SEQ2"),
+        # A local source with the same path is a different file
+        dict(src="/u/other/file", dest="USER.SEQ3"),
+    ]
+
+    assert zos_copy.get_batch_groups(items) == [[0, 4], [1, 3], [2], [5], [6]]
+
+
+def test_run_batch(zos_import_mocker, monkeypatch):
+    mocker, importer = zos_import_mocker
+    zos_copy = importer(IMPORT_NAME)
+    module = mocker.MagicMock()
+    module.params = dict(
+        batch=[
+            dict(src="/local/a", dest="/u/a", is_binary=None, force=None),
+            dict(src="/local/b", dest="/u/b", is_binary=True, force=None),
+            dict(src="/local/c", dest="/u/c", is_binary=None, force=None),
+            dict(src="/local/d", dest="/u/d", is_binary=None, force=None),
+        ],
+        is_binary=False,
+        force=True,
+        remote_src=False,
+        encoding=None,
+        local_charset="ISO8859-1",
+        temp_path="/tmp/payload",
+        archive_transfer="tar",
+    )
+    monkeypatch.setattr(zos_copy.encode.Defaults, "get_default_system_charset", staticmethod(lambda: "IBM-1047"))
+    seen = []
+
+    def fake_run_module(item_module, arg_def):
+        params = item_module.params
+        seen.append(params)
+        if params["dest"] == "/u/c":
+            item_module.fail_json(msg="Destination /u/c is not writable")
+        if params["dest"] == "/u/d":
+            raise zos_copy.CopyOperationError(msg="Unable to copy", rc=1)
+        return dict(changed=True, dest=params["dest"], is_binary=params["is_binary"]), None, "/tmp/converted"
+
+    monkeypatch.setattr(zos_copy, "run_module", fake_run_module)
+
+    results, cleanup_paths = zos_copy.run_batch(module, dict())
+
+    assert [result.get("dest") for result in results[:2]] == ["/u/a", "/u/b"]
+    # The options the item does not set come from the task
+    assert [result["is_binary"] for result in results[:2]] == [False, True]
+    assert results[2] == dict(msg="Destination /u/c is not writable", failed=True)
+    assert results[3]["failed"] is True and results[3]["rc"] == 1
+    params_by_dest = dict((params["dest"], params) for params in seen)
+    # Text from the controller is converted, binary items are not
+    assert params_by_dest["/u/a"]["encoding"] == {"from": "ISO8859-1", "to": "IBM-1047"}
+    assert params_by_dest["/u/b"]["encoding"] is None
+    # The shared archive is unpacked once, not by each item
+    assert all(params["temp_path"] is None and params["archive_transfer"] == "none" for params in seen)
+    assert cleanup_paths.count("/tmp/converted") == 2
+
+
+def test_inline_content_round_trip(zos_import_mocker):
+    mocker, importer = zos_import_mocker
+    zos_copy = importer(IMPORT_NAME)
+    content = u"DUMMY DATA ---- LINE 001 ------\n" * 100
+
+    path = zos_copy.write_inline_content(_inline_content(content))
+    try:
+        with open(path, "rb") as infile:
+            assert infile.read() == content.encode()
+    finally:
+        os.remove(path)
+
+
+def test_inline_content_threshold():
+    assert _inline_content(u"a" * INLINE_CONTENT_MAX_SIZE) is not None
+    # Larger content is transferred with SFTP
+    assert _inline_content(u"a" * (INLINE_CONTENT_MAX_SIZE + 1)) is None
+
+
+def test_inline_module_content_sends_content_once():
+    module_args = dict(content=u"DUMMY DATA", dest="/tmp/file")
+    assert _inline_module_content(module_args)
+    assert module_args == dict(content_b64=_inline_content(u"DUMMY DATA"), dest="/tmp/file")
+
+    module_args = dict(content=u"a" * (INLINE_CONTENT_MAX_SIZE + 1), dest="/tmp/file")
+    assert not _inline_module_content(module_args)
+    assert "content_b64" not in module_args
+
+
+def test_run_batch_item_backup_failure(zos_import_mocker, monkeypatch):
+    mocker, importer = zos_import_mocker
+    zos_copy = importer(IMPORT_NAME)
+    module = mocker.MagicMock()
+    module.params = dict(
+        batch=[
+            dict(src="/u/src/a", dest="/u/a", backup=True),
+            dict(src="/u/src/b", dest="/u/b", backup=True),
+            dict(src="/u/src/c", dest="/u/c", backup=True),
+        ],
+        remote_src=True,
+        is_binary=True,
+        encoding=None,
+    )
+
+    def uss_file_backup(path, backup_name=None):
+        if path == "/u/b":
+            raise zos_copy.backup.BackupError("No space left on device", rc=1)
+        return path + ".bak"
+
+    def fake_run_module(item_module, arg_def):
+        dest = item_module.params["dest"]
+        backup_name = zos_copy.backup_data(dest, "USS", None)
+        return dict(changed=True, dest=dest, backup_name=backup_name), None, None
+
+    monkeypatch.setattr(zos_copy.backup, "uss_file_backup", uss_file_backup)
+    monkeypatch.setattr(zos_copy, "run_module", fake_run_module)
+
+    results, cleanup_paths = zos_copy.run_batch(module, dict())
+
+    # The failed backup ends its own item, the others are still copied
+    assert [result.get("backup_name") for result in results] == ["/u/a.bak", None, "/u/c.bak"]
+    assert results[1]["failed"] is True
+    assert results[1]["rc"] == 1
+    assert "No space left on device" in results[1]["msg"]
+
+
+def test_cleanup_failure_raises(zos_import_mocker, monkeypatch, tmp_path):
+    mocker, importer = zos_import_mocker
+    zos_copy = importer(IMPORT_NAME)
+    busy = os.path.join(str(tmp_path), "busy")
+    denied = os.path.join(str(tmp_path), "denied")
+    for path in (busy, denied):
+        with open(path, "w") as outfile:
+            outfile.write("payload")
+
+    def remove(path):
+        if path == busy:
+            raise OSError(errno.EBUSY, "Resource busy", path)
+        raise OSError(errno.EACCES, "Permission denied", path)
+
+    # Only the given paths are removed, not the temporary files of other runs
+    monkeypatch.setattr(zos_copy.glob, "glob", lambda pattern: [])
+    monkeypatch.setattr(zos_copy.os, "remove", remove)
+
+    zos_copy.cleanup([denied])
+    with pytest.raises(zos_copy.CopyOperationError) as err:
+        zos_copy.cleanup([denied, busy])
+
+    assert busy in err.value.json_args["msg"]
+    assert "Resource busy" in err.value.json_args["stderr"]
@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) IBM Corporation 2023
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+from hashlib import sha256
+import os
+
+IMPORT_NAME = "ibm_zos_core.plugins.modules.zos_job_output"
+
+
+def test_write_job_content(zos_import_mocker, tmp_path):
+    mocker, importer = zos_import_mocker
+    zos_job_output = importer(IMPORT_NAME)
+    jobs = [
+        {
+            "job_id": "JOB00134",
+            "ddnames": [
+                {"ddname": "JESMSGLG", "stepname": "JES2", "id": "2", "content": ["line 1", "line 2"]},
+                {"ddname": "SYSPRINT", "stepname": None, "id": "102", "content": []},
+                {"ddname": "SYSUT2", "stepname": "STEP0001", "id": "103"},
+            ],
+        }
+    ]
+
+    jobs = zos_job_output.write_job_content(jobs, str(tmp_path))
+
+    jesmsglg, sysprint, sysut2 = jobs[0]["ddnames"]
+    assert "content" not in jesmsglg
+    assert jesmsglg["dest"] == os.path.join("JOB00134", "JES2.JESMSGLG.2.txt")
+    with open(os.path.join(str(tmp_path), jesmsglg["dest"]), "rb") as dd_file:
+        assert dd_file.read() == b"line 1\nline 2"
+    assert jesmsglg["checksum"] == sha256(b"line 1\nline 2").hexdigest()
+    # A missing step name is kept to a single path component
+    assert sysprint["dest"] == os.path.join("JOB00134", "None.SYSPRINT.102.txt")
+    assert sysprint["checksum"] == sha256(b"").hexdigest()
+    # No content was read for this DD, no file is written
+    assert "dest" not in sysut2
+    assert sorted(os.listdir(os.path.join(str(tmp_path), "JOB00134"))) == [
+        "JES2.JESMSGLG.2.txt", "None.SYSPRINT.102.txt"
+    ]
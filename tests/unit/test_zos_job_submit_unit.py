@@ -0,0 +1,248 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) IBM Corporation 2023
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+from collections import namedtuple
+
+import pytest
+
+IMPORT_NAME = "ibm_zos_core.plugins.modules.zos_job_submit"
+
+Job = namedtuple("Job", ["id", "name", "owner", "status", "rc"])
+
+
+class DummyModule(object):
+    """Used in place of Ansible's module
+    so we can easily mock the desired behavior."""
+
+    def fail_json(self, **kwargs):
+        raise Exception(kwargs.get("msg"))
+
+
+class DummyJobs(object):
+    """Stands in for the ZOAU jobs API, the submitted job stays active for
+    a number of listing calls before completing."""
+
+    def __init__(self, active_listings=0):
+        self.active_listings = active_listings
+        self.listing_calls = 0
+
+    def submit(self, src, wait, *args, **kwargs):
+        return Job("JOB00001", "HELLO", "ADMIN", "AC", "?")
+
+    def listing(self, job_id):
+        self.listing_calls += 1
+        if self.listing_calls <= self.active_listings:
+            return [Job(job_id, "HELLO", "ADMIN", "AC", "?")]
+        return [Job(job_id, "HELLO", "ADMIN", "CC", "0000")]
+
+
+@pytest.fixture(scope="function")
+def zos_job_submit_mocker(zos_import_mocker):
+    mocker, importer = zos_import_mocker
+    zos_job_submit = importer(IMPORT_NAME)
+
+    def patch_jobs(**kwargs):
+        dummy_jobs = DummyJobs(**kwargs)
+        mocker.patch.object(zos_job_submit, "jobs", dummy_jobs)
+        return dummy_jobs
+
+    yield zos_job_submit, patch_jobs
+
+
+@pytest.mark.parametrize("active_listings", [0, 1, 3])
+def test_submit_src_jcl_one_listing_per_poll(zos_job_submit_mocker, active_listings):
+    zos_job_submit, patch_jobs = zos_job_submit_mocker
+    dummy_jobs = patch_jobs(active_listings=active_listings)
+
+    job_id, duration = zos_job_submit.submit_src_jcl(
+        DummyModule(), "/u/user/hello.jcl", src_name="hello.jcl", timeout=10, hfs=True,
+        start_time=zos_job_submit.timer())
+
+    assert job_id == "JOB00001"
+    assert duration == 0
+    assert dummy_jobs.listing_calls == active_listings + 1
+
+
+def test_submit_src_jcl_honors_wait_time(zos_job_submit_mocker):
+    zos_job_submit, patch_jobs = zos_job_submit_mocker
+    dummy_jobs = patch_jobs(active_listings=1000)
+
+    job_id, duration = zos_job_submit.submit_src_jcl(
+        DummyModule(), "/u/user/hello.jcl", src_name="hello.jcl", timeout=1, hfs=True,
+        start_time=zos_job_submit.timer())
+
+    assert job_id == "JOB00001"
+    assert duration == 1
+    # Backoff starts at 50ms, a fixed one second sleep would have listed twice
+    assert dummy_jobs.listing_calls < 10
+
+
+def test_submit_src_jcl_without_wait(zos_job_submit_mocker):
+    zos_job_submit, patch_jobs = zos_job_submit_mocker
+    dummy_jobs = patch_jobs(active_listings=1000)
+
+    job_id, duration = zos_job_submit.submit_src_jcl(
+        DummyModule(), "/u/user/hello.jcl", src_name="hello.jcl", timeout=0, hfs=True,
+        start_time=zos_job_submit.timer())
+
+    assert job_id == "JOB00001"
+    assert duration == 0
+    assert dummy_jobs.listing_calls == 0
+
+
+class BatchJobs(object):
+    """Stands in for the ZOAU jobs API in a batch submission, each source
+    gets its own job ID and a source named FAIL can not be submitted."""
+
+    def __init__(self):
+        self.submitted = []
+
+    def submit(self, src, wait, *args, **kwargs):
+        if "FAIL" in src:
+            raise RuntimeError("BGYSC1201E Unable to submit {0}".format(src))
+        self.submitted.append((src, wait, kwargs.get("hfs")))
+        return Job("JOB{0:05d}".format(len(self.submitted)), "HELLO", "ADMIN", "AC", "?")
+
+
+def batch_job_output(return_codes):
+    def job_output(job_id=None, **kwargs):
+        code = return_codes[job_id]
+        return [{
+            "job_id": job_id,
+            "ret_code": {"msg": "CC {0:04d}".format(code), "code": code, "steps": []},
+            "ddnames": [{"ddname": "JESMSGLG", "content": ["..."]}],
+        }]
+    return job_output
+
+
+@pytest.fixture(scope="function")
+def batch_mocker(zos_job_submit_mocker, mocker):
+    zos_job_submit, patch_jobs = zos_job_submit_mocker
+    batch_jobs = BatchJobs()
+    mocker.patch.object(zos_job_submit, "jobs", batch_jobs)
+
+    def patch_jobs_done(return_codes, unfinished=()):
+        def poll_jobs(job_ids, is_done, on_done=None, **kwargs):
+            for job_id in job_ids:
+                if job_id not in unfinished:
+                    on_done(Job(job_id, "HELLO", "ADMIN", "CC", "0000"))
+            return {}, None
+        poll = mocker.patch.object(zos_job_submit, "poll_jobs", side_effect=poll_jobs)
+        mocker.patch.object(zos_job_submit, "job_output", side_effect=batch_job_output(return_codes))
+        return poll
+
+    yield zos_job_submit, batch_jobs, patch_jobs_done
+
+
+def test_submit_batch_jcl_submits_up_front(batch_mocker):
+    zos_job_submit, batch_jobs, patch_jobs_done = batch_mocker
+    poll = patch_jobs_done({"JOB00001": 0, "JOB00002": 4, "JOB00003": 0})
+    batch = [
+        {"src": "HLQ.JCL(JOB1)", "location": "DATA_SET", "volume": None, "max_rc": None},
+        {"src": "HLQ.JCL(JOB2)", "location": "DATA_SET", "volume": None, "max_rc": 4},
+        {"src": "/u/user/job3.jcl", "location": "USS", "volume": None, "max_rc": None},
+    ]
+
+    result = zos_job_submit.submit_batch_jcl(DummyModule(), batch, timeout=10)
+
+    assert [submitted[1:] for submitted in batch_jobs.submitted] == [(False, False), (False, False), (False, True)]
+    # A single poller tracks every submitted job
+    assert poll.call_count == 1
+    assert poll.call_args[0][0] == ["JOB00001", "JOB00002", "JOB00003"]
+    assert [job["job_id"] for job in result["jobs"]] == ["JOB00001", "JOB00002", "JOB00003"]
+    assert [(item["job_id"], item["changed"], item["failed"]) for item in result["batch"]] == [
+        ("JOB00001", True, False), ("JOB00002", False, False), ("JOB00003", True, False)]
+    assert result["changed"] is True
+    assert result["failed"] is False
+
+
+def test_submit_batch_jcl_evaluates_max_rc_per_job(batch_mocker):
+    zos_job_submit, batch_jobs, patch_jobs_done = batch_mocker
+    patch_jobs_done({"JOB00001": 8, "JOB00002": 8})
+    batch = [
+        {"src": "HLQ.JCL(JOB1)", "location": "DATA_SET", "volume": None, "max_rc": 4},
+        {"src": "HLQ.JCL(JOB2)", "location": "DATA_SET", "volume": None, "max_rc": 8},
+    ]
+
+    result = zos_job_submit.submit_batch_jcl(DummyModule(), batch, timeout=10)
+
+    assert [item["failed"] for item in result["batch"]] == [True, False]
+    assert "max_rc" in result["batch"][0]["msg"]
+    assert len(result["jobs"]) == 2
+    assert result["failed"] is True
+    assert result["msg"].startswith("1 of the 2 jobs")
+
+
+def test_submit_batch_jcl_submission_and_wait_failures(batch_mocker):
+    zos_job_submit, batch_jobs, patch_jobs_done = batch_mocker
+    poll = patch_jobs_done({"JOB00001": 0, "JOB00002": 0}, unfinished=("JOB00002",))
+    batch = [
+        {"src": "HLQ.JCL(JOB1)", "location": "DATA_SET", "volume": None, "max_rc": None},
+        {"src": "HLQ.JCL(FAIL)", "location": "DATA_SET", "volume": None, "max_rc": None},
+        {"src": "HLQ.JCL(LONGRUN)", "location": "DATA_SET", "volume": None, "max_rc": None},
+    ]
+
+    result = zos_job_submit.submit_batch_jcl(DummyModule(), batch, timeout=10)
+
+    assert poll.call_args[0][0] == ["JOB00001", "JOB00002"]
+    assert [(item["job_id"], item["failed"]) for item in result["batch"]] == [
+        ("JOB00001", False), (None, True), ("JOB00002", True)]
+    assert "BGYSC1201E" in result["batch"][1]["msg"]
+    assert "exceeded its maximum wait time" in result["batch"][2]["msg"]
+    # The output of the long running job is still returned with its current status
+    assert [job["job_id"] for job in result["jobs"]] == ["JOB00001", "JOB00002"]
+    assert result["changed"] is True
+    assert result["failed"] is True
+
+
+def test_submit_batch_jcl_without_wait(batch_mocker, mocker):
+    zos_job_submit, batch_jobs, patch_jobs_done = batch_mocker
+    poll = patch_jobs_done({})
+    job_status = mocker.patch.object(
+        zos_job_submit, "job_status",
+        side_effect=lambda job_id=None, **kwargs: [{"job_id": job_id, "ret_code": None}])
+    batch = [
+        {"src": "HLQ.JCL(JOB1)", "location": "DATA_SET", "volume": None, "max_rc": None},
+        {"src": "HLQ.JCL(JOB2)", "location": "DATA_SET", "volume": None, "max_rc": None},
+    ]
+
+    result = zos_job_submit.submit_batch_jcl(DummyModule(), batch, timeout=0)
+
+    assert poll.call_count == 0
+    assert job_status.call_args[1] == {"job_id": "JOB00002", "dd_scan": False}
+    assert [job["job_id"] for job in result["jobs"]] == ["JOB00001", "JOB00002"]
+    assert [(item["changed"], item["failed"]) for item in result["batch"]] == [(True, False), (True, False)]
+
+
+@pytest.mark.parametrize("owners, expected_owner", [(["ADMIN", "ADMIN"], "ADMIN"), (["ADMIN", "BATCH"], None)])
+def test_submit_batch_jcl_polls_by_owner(batch_mocker, mocker, owners, expected_owner):
+    zos_job_submit, batch_jobs, patch_jobs_done = batch_mocker
+    poll = patch_jobs_done({"JOB00001": 0, "JOB00002": 0})
+    submit = batch_jobs.submit
+
+    def submit_as_owner(src, wait, *args, **kwargs):
+        return submit(src, wait, *args, **kwargs)._replace(owner=owners[len(batch_jobs.submitted) - 1])
+    mocker.patch.object(batch_jobs, "submit", side_effect=submit_as_owner)
+    batch = [
+        {"src": "HLQ.JCL(JOB1)", "location": "DATA_SET", "volume": None, "max_rc": None},
+        {"src": "HLQ.JCL(JOB2)", "location": "DATA_SET", "volume": None, "max_rc": None},
+    ]
+
+    zos_job_submit.submit_batch_jcl(DummyModule(), batch, timeout=10)
+
+    # The jobs of the submitting user are listed, not the whole spool
+    assert poll.call_args[1]["owner"] == expected_owner
@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (c) IBM Corporation 2023
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+from collections import namedtuple
+
+import pytest
+
+IMPORT_NAME = "ibm_zos_core.plugins.modules.zos_job_wait"
+
+Job = namedtuple("Job", ["id", "name", "owner", "status", "rc"])
+
+
+@pytest.fixture(scope="function")
+def zos_job_wait_mocker(zos_import_mocker):
+    """Yields the module along with a function that patches the poller to
+    complete the given jobs, in order."""
+    mocker, importer = zos_import_mocker
+    zos_job_wait = importer(IMPORT_NAME)
+
+    def patch_completed(completed):
+        def poll_jobs(job_ids, is_done, on_done=None, wait_for_all=True, **kwargs):
+            for job_id in completed:
+                on_done(Job(job_id, "HELLO", "ADMIN", "CC", "0000"))
+                if not wait_for_all:
+                    break
+
+            class Poller(object):
+                duration = 3
+            return {}, Poller()
+
+        def job_output(job_id=None, **kwargs):
+            return [{
+                "job_id": job_id,
+                "ret_code": {"msg": "CC 0000", "code": 0,
+                             "steps": [{"step_name": "STEP0001", "step_cc": 0}]},
+                "ddnames": [{"ddname": "JESMSGLG", "content": ["..."]}],
+            }]
+
+        poll = mocker.patch.object(zos_job_wait, "poll_jobs", side_effect=poll_jobs)
+        mocker.patch.object(zos_job_wait, "job_output", side_effect=job_output)
+        return poll
+
+    yield zos_job_wait, patch_completed
+
+
+def test_wait_jobs_all(zos_job_wait_mocker):
+    zos_job_wait, patch_completed = zos_job_wait_mocker
+    poll = patch_completed(["JOB00002", "JOB00001"])
+
+    jobs, pending, duration = zos_job_wait.wait_jobs(["JOB00001", "JOB00002", "JOB00003"], timeout=30)
+
+    assert poll.call_count == 1
+    assert poll.call_args[1]["wait_for_all"] is True
+    # Jobs are returned in the order they were given, not the order they completed
+    assert [job["job_id"] for job in jobs] == ["JOB00001", "JOB00002"]
+    assert jobs[0]["ret_code"]["steps"] == [{"step_name": "STEP0001", "step_cc": 0}]
+    assert pending == ["JOB00003"]
+    assert duration == 3
+
+
+def test_wait_jobs_any_without_output(zos_job_wait_mocker):
+    zos_job_wait, patch_completed = zos_job_wait_mocker
+    poll = patch_completed(["JOB00002", "JOB00001"])
+
+    jobs, pending, duration = zos_job_wait.wait_jobs(
+        ["JOB00001", "JOB00002"], condition="any", timeout=30, return_output=False)
+
+    assert poll.call_args[1]["wait_for_all"] is False
+    assert [job["job_id"] for job in jobs] == ["JOB00002"]
+    assert jobs[0]["ddnames"] == []
+    assert pending == ["JOB00001"]
+
+
+@pytest.mark.parametrize("job_id,valid", [
+    ("JOB00134", True),
+    ("stc00001", True),
+    ("J0012345", True),
+    ("JOB0013", False),
+    ("JOB*", False),
+])
+def test_job_id_type(zos_job_wait_mocker, job_id, valid):
+    zos_job_wait, patch_completed = zos_job_wait_mocker
+
+    if valid:
+        assert zos_job_wait._job_id_type(job_id, {}) == job_id.upper()
+    else:
+        with pytest.raises(ValueError):
+            zos_job_wait._job_id_type(job_id, {})
@@ -701,3 +701,23 @@ def test_ksds_exception_key_offset(
     }
     with pytest.raises(ValueError):
         raw.parse_and_validate_args(valid_args)
+
+
+@pytest.mark.parametrize("content_format", ["lines", "gzip_base64"])
+def test_build_response_content_format(zos_import_mocker, content_format):
+    mocker, importer = zos_import_mocker
+    raw = importer(IMPORT_NAME)
+    contents = "\n".join(" IDCAMS  SYSTEM SERVICES {0:05d}".format(i) for i in range(1000))
+    mocker.patch.object(raw, "gather_backups", return_value=[])
+    mocker.patch.object(
+        raw, "gather_output", return_value=[raw.build_dd_response("SYSPRINT", "SYSPRINT", contents)])
+
+    response = raw.build_response(0, [], content_format)
+
+    dd_response = response["dd_names"][0]
+    assert dd_response["record_count"] == 1000
+    if content_format == "lines":
+        assert dd_response["content"] == contents.split("\n")
+    else:
+        assert "content" not in dd_response
+        assert len(dd_response["content_gzip_base64"]) < len(contents) / 4